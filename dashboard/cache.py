@@ -0,0 +1,31 @@
+# dashboard/cache.py
+
+# ========================================
+# 대시보드 스냅샷 캐시
+# - 팀 데이터가 바뀌면 teams/signals.py에서 팀 버전(teams.versioning)을 올림
+# - 스냅샷은 (팀, 사용자) 단위로 저장하고 저장 당시 팀 버전을 함께 기록
+# - 조회 시 버전과 스냅샷을 한 번에 가져와 버전이 다르면 버림
+# ========================================
+from teams.versioning import get_versioned, set_versioned
+
+SNAPSHOT_TIMEOUT = 60 * 60  # 1시간 (버전이 바뀌면 그 전에라도 무효화됨)
+
+
+def _snapshot_key(team_id, user_id):
+    return f'dashboard:team:{team_id}:user:{user_id}:snapshot'
+
+
+def get_dashboard_snapshot(team_id, user_id):
+    """
+    캐시된 대시보드 응답 데이터와 현재 팀 버전 반환 (데이터가 없거나 오래된 경우 None)
+    마감 임박 수가 날짜에 따라 달라지므로 저장한 날짜도 함께 비교
+    """
+    return get_versioned(_snapshot_key(team_id, user_id), team_id=team_id)
+
+
+def set_dashboard_snapshot(team_id, user_id, data, versions):
+    """
+    대시보드 응답 데이터 저장
+    versions는 데이터를 계산하기 전에 get_dashboard_snapshot에서 받은 값을 넘겨야 함
+    """
+    set_versioned(_snapshot_key(team_id, user_id), data, versions, timeout=SNAPSHOT_TIMEOUT)
@@ -0,0 +1,231 @@
+# ========================================
+# 주요 API 쿼리 실행 계획 확인
+# 사용법:
+#   python manage.py explain_queries                    # 임시 데이터를 만들어 확인 후 롤백
+#   python manage.py explain_queries --team 3 --user 5  # 기존 데이터로 확인
+# 인덱스 없이 테이블 전체를 읽는 단계(SCAN)나 정렬용 임시 B-TREE가 있으면 표시
+# 회의를 start_time/series_end의 과거 방향 열린 범위(< 만 있음)로 찾는 단계도 표시
+#   (팀의 지난 회의 전체를 읽으므로 기록이 쌓일수록 느려짐)
+# 각 항목은 API가 쓰는 헬퍼를 그대로 실행해서 실제로 나간 쿼리(CaptureQueriesContext)를 EXPLAIN
+# ========================================
+import re
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from dashboard.utils import get_task_stats
+from files.models import File
+from schedule.models import Meeting
+from schedule.recurrence import FREQ_WEEKLY
+from schedule.utils import (
+    meetings_in_window, my_meetings_in_window, my_tasks_in_window, parse_window, tasks_in_window,
+)
+from tasks.models import Task, TaskAssignment
+from tasks.pagination import DEFAULT_PAGE_SIZE, TASK_ORDERING, paginate_tasks
+from tasks.serializers import task_rows
+from tasks.sync import get_changed_tasks, get_deleted_task_ids
+from team_log.models import TeamLog
+from teams.models import Team, TeamMember
+from users.models import Profile
+
+# 과거 방향으로 열린 범위: "start_time<?" / "series_end<?"만 있고 같은 열의 하한(>)이 없는 탐색
+_RANGE_COLUMNS = ('start_time', 'series_end')
+_CONSTRAINT_RE = re.compile(r'\((.*)\)\s*$')
+
+
+class Command(BaseCommand):
+    help = '대시보드/작업/일정/파일/팀 로그 API 쿼리의 실행 계획(EXPLAIN QUERY PLAN)을 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--team', type=int, help='확인할 팀 ID (없으면 임시 데이터 생성)')
+        parser.add_argument('--user', type=int, help='확인할 사용자 ID (--team과 함께 사용)')
+        parser.add_argument('--tasks', type=int, default=2000, help='임시 데이터의 작업 수')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options['team']:
+                team = Team.objects.filter(id=options['team']).first()
+                if team is None:
+                    raise CommandError(f"팀 {options['team']}을 찾을 수 없습니다.")
+                user = User.objects.filter(id=options['user']).first() if options['user'] else team.owner
+                seeded = False
+            else:
+                team, user = self.seed(options['tasks'])
+                seeded = True
+
+            # 임시 데이터 기준으로 통계를 갱신해야 실제와 비슷한 계획이 나옴
+            if connection.vendor == 'sqlite':
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE')
+
+            warnings = 0
+            for endpoint, queries in self.endpoint_queries(team, user):
+                self.stdout.write(self.style.MIGRATE_HEADING(f'\n[{endpoint}]'))
+                for name, query in queries:
+                    warnings += self.explain(name, query)
+
+            if seeded:
+                transaction.set_rollback(True)
+
+        if warnings:
+            self.stdout.write(self.style.WARNING(f'\n인덱스를 사용하지 않는 단계 {warnings}개'))
+        else:
+            self.stdout.write(self.style.SUCCESS('\n모든 쿼리가 인덱스를 사용합니다.'))
+
+    def explain(self, name, query):
+        """query: QuerySet이면 그 쿼리, 함수면 실행하면서 나간 SELECT 쿼리 각각의 실행 계획"""
+        self.stdout.write(f'  {name}')
+        if hasattr(query, 'explain'):
+            plans = [query.explain()]
+        else:
+            with CaptureQueriesContext(connection) as captured:
+                query()
+            plans = [
+                self.explain_sql(item['sql']) for item in captured.captured_queries
+                if item['sql'].lstrip().upper().startswith('SELECT')
+            ]
+
+        warnings = 0
+        for plan in plans:
+            for line in plan.splitlines():
+                if self.is_warning(line):
+                    warnings += 1
+                    self.stdout.write(self.style.WARNING(f'    ! {line}'))
+                else:
+                    self.stdout.write(f'      {line}')
+        return warnings
+
+    @staticmethod
+    def explain_sql(sql):
+        prefix = connection.ops.explain_query_prefix()
+        with connection.cursor() as cursor:
+            cursor.execute(f'{prefix} {sql}')
+            return '\n'.join(' '.join(str(value) for value in row) for row in cursor.fetchall())
+
+    @staticmethod
+    def is_warning(line):
+        step = line.split('|--')[-1].split('`--')[-1].strip()
+        step = re.sub(r'^(\d+ )+', '', step)  # SQLite EXPLAIN 결과 앞의 id / parent / notused 열
+        if step.startswith('SCAN') and 'USING' not in step:
+            return True
+        if 'USE TEMP B-TREE' in step:
+            return True
+        match = _CONSTRAINT_RE.search(step) if step.startswith('SEARCH') else None
+        if match:
+            terms = match.group(1)
+            for column in _RANGE_COLUMNS:
+                if f'{column}<' in terms and f'{column}>' not in terms:
+                    # 끝없는 반복 회의(series_end IS NULL → "series_end=?") 안에서의 범위는 제외
+                    if not (column == 'start_time' and 'series_end=' in terms):
+                        return True
+        return False
+
+    def endpoint_queries(self, team, user):
+        """각 API가 실행하는 헬퍼/QuerySet 목록 (함수는 실행해서 나간 쿼리를 확인)"""
+        window = parse_window({})[:2]
+        team_tasks = Task.objects.filter(team=team, type='team')
+        personal_tasks = Task.objects.filter(team=team, type='personal', assignee=user)
+        dashboard_tasks = Task.objects.filter(team=team).order_by('-created_at').with_urgency()
+
+        # 커서/동기화 토큰은 실제 응답과 같은 방식으로 만든 값 사용
+        _, next_cursor = paginate_tasks(task_rows(team_tasks), None, DEFAULT_PAGE_SIZE)
+        since = timezone.now() - timedelta(hours=1)
+
+        return [
+            ('DashboardAPIView', [
+                ('멤버십 확인', TeamMember.objects.select_related('team').filter(user=user, team=team)),
+                ('팀원 목록', TeamMember.objects.filter(team=team).values('user__first_name', 'user__profile__major', 'role')),
+                ('팀 작업', dashboard_tasks.filter(type='team')),
+                ('개인 작업', dashboard_tasks.filter(type='personal', assignee=user)),
+                ('작업 통계 (get_task_stats)', lambda: get_task_stats(team, user)),
+            ]),
+            ('TaskListAPIView', [
+                ('팀 작업 첫 페이지', lambda: paginate_tasks(task_rows(team_tasks), None, DEFAULT_PAGE_SIZE)),
+                ('팀 작업 다음 페이지 (커서)', lambda: paginate_tasks(task_rows(team_tasks), next_cursor, DEFAULT_PAGE_SIZE)),
+                ('개인 작업 첫 페이지', lambda: paginate_tasks(task_rows(personal_tasks), None, DEFAULT_PAGE_SIZE)),
+                ('변경분 (since)', task_rows(get_changed_tasks(team_tasks, since)).order_by(*TASK_ORDERING)),
+                ('목록에서 빠진 작업 (since)',
+                 get_changed_tasks(Task.objects.filter(team=team), since).order_by().values_list('id', flat=True)),
+                ('삭제된 작업 (since)', lambda: get_deleted_task_ids(team.id, since)),
+            ]),
+            ('schedule_list_view', [
+                ('회의 일정 (보이는 범위)', meetings_in_window(Meeting.objects.filter(team_id=team.id), *window).order_by()),
+                ('내 작업 (보이는 범위)', tasks_in_window(Task.objects.all(), user, team.id, *window).order_by()),
+            ]),
+            ('my_calendar_view', [
+                ('내 모든 팀 회의 (보이는 범위)',
+                 my_meetings_in_window(Meeting.objects.select_related('team'), user, *window).order_by()),
+                ('내 모든 팀 작업 (보이는 범위)', my_tasks_in_window(Task.objects.all(), user, *window).order_by()),
+            ]),
+            ('file_list_view', [
+                ('파일 목록', File.objects.filter(team=team).order_by('-uploaded_at')),
+            ]),
+            ('team_log_list_api', [
+                ('팀 로그', TeamLog.objects.filter(team=team).order_by('-created_at')),
+                ('작업', Task.objects.filter(team=team).order_by('-created_at')),
+                ('파일', File.objects.filter(team=team)),
+                ('팀원', TeamMember.objects.filter(team=team)),
+            ]),
+            ('global_context (캐시가 없을 때 HeaderContext)', [
+                ('전공', lambda: Profile.objects.filter(user=user).first()),
+                ('현재 팀', lambda: Team.objects.filter(id=team.id).first()),
+                ('기본 팀', lambda: Team.objects.filter(members=user).first()),
+                ('마감 임박 수 (get_task_stats)', lambda: get_task_stats(team, user)),
+            ]),
+            ('UserMeUpdateView', [
+                ('완료한 작업 수', lambda: TaskAssignment.objects.filter(user=user, status='completed').count()),
+            ]),
+        ]
+
+    def seed(self, task_count):
+        """다른 팀 데이터도 섞어서 임시 데이터 생성 (handle에서 롤백됨)"""
+        users = [User.objects.create_user(username=f'explain_user_{i}') for i in range(10)]
+        teams = [
+            Team.objects.create(name=f'explain_team_{i}', owner=users[0], invite_code=f'EXP{i:03d}')
+            for i in range(5)
+        ]
+        TeamMember.objects.bulk_create([TeamMember(team=t, user=u) for t in teams for u in users])
+
+        today = date.today()
+        statuses = ['pending', 'in_progress', 'completed']
+        tasks = Task.objects.bulk_create([
+            Task(
+                name=f'작업 {i}', team=teams[i % len(teams)], assignee=users[i % len(users)],
+                type='team' if i % 3 else 'personal', status=statuses[i % 3],
+                due_date=today + timedelta(days=i % 60 - 30),
+            )
+            for i in range(task_count)
+        ])
+        TaskAssignment.objects.bulk_create([
+            TaskAssignment(task=t, user_id=t.assignee_id, team_id=t.team_id, status=t.status, due_date=t.due_date)
+            for t in tasks
+        ])
+
+        # 실제 데이터처럼 대부분 지난 한 번짜리 회의 + 일부 반복 회의 (끝이 있는 것 / 끝없는 것)
+        # bulk_create는 save()를 거치지 않으므로 series_end를 직접 계산
+        now = timezone.now()
+        meeting_count = task_count // 10
+        meetings = []
+        for i in range(meeting_count):
+            start = now + timedelta(days=i - meeting_count * 3 // 4)
+            meeting = Meeting(team=teams[i % len(teams)], title=f'회의 {i}',
+                              start_time=start, end_time=start + timedelta(hours=1))
+            if i % 10 == 0:
+                meeting.recurrence_freq = FREQ_WEEKLY
+                meeting.recurrence_count = 8 if i % 20 == 0 else None
+            meeting.update_series_end()
+            meetings.append(meeting)
+        Meeting.objects.bulk_create(meetings)
+        File.objects.bulk_create([
+            File(team=teams[i % len(teams)], uploader=users[0], file=f'team_files/{i}.txt', filename=f'{i}.txt')
+            for i in range(task_count // 10)
+        ])
+        TeamLog.objects.bulk_create([
+            TeamLog(team=teams[i % len(teams)], title=f'로그 {i}', status='pending')
+            for i in range(task_count // 10)
+        ])
+        return teams[0], users[0]
@@ -1,3 +1,188 @@
-from django.test import TestCase
+from datetime import date, timedelta
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tasks.models import Task
+from teams.models import Team, TeamMember
+from teamflow.context_processors import global_context
+from .management.commands.explain_queries import Command as ExplainQueriesCommand
+from .utils import get_task_stats
+
+
+class DashboardStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='owner', password='pw', first_name='팀장')
+        self.other = User.objects.create_user(username='member', password='pw', first_name='팀원')
+        self.team = Team.objects.create(name='팀', owner=self.user, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.user, role='팀장')
+        TeamMember.objects.create(team=self.team, user=self.other, role='팀원')
+
+    def create_tasks(self, count):
+        tomorrow = date.today() + timedelta(days=1)
+        for i in range(count):
+            task = Task.objects.create(
+                name=f'작업 {i}', team=self.team, type='team',
+                assignee=self.other, status='pending', due_date=tomorrow,
+            )
+            task.assignees.add(self.user, self.other)
+
+    def test_stats_values(self):
+        tomorrow = date.today() + timedelta(days=1)
+        Task.objects.create(name='팀 완료', team=self.team, type='team', status='completed', assignee=self.user)
+        co_task = Task.objects.create(name='공동', team=self.team, type='team', due_date=tomorrow, assignee=self.other)
+        co_task.assignees.add(self.user, self.other)
+        Task.objects.create(name='개인', team=self.team, type='personal', assignee=self.user, due_date=tomorrow)
+        Task.objects.create(name='개인 완료', team=self.team, type='personal', assignee=self.user, status='completed')
+        Task.objects.create(name='남의 개인', team=self.team, type='personal', assignee=self.other, due_date=tomorrow)
+
+        stats = get_task_stats(self.team, self.user)
+
+        self.assertEqual(stats['total'], 5)
+        self.assertEqual(stats['completed'], 2)
+        self.assertEqual(stats['personal'], 2)
+        self.assertEqual(stats['personal_completed'], 1)
+        self.assertEqual(stats['deadline_imminent'], 2)
+        self.assertEqual(stats['total_progress'], 40)
+        self.assertEqual(stats['personal_progress'], 50)
+
+    def test_stats_single_query(self):
+        self.create_tasks(10)
+        with self.assertNumQueries(1):
+            get_task_stats(self.team, self.user)
+
+    def test_dashboard_api_query_count_is_constant(self):
+        self.client.force_login(self.user)
+        url = f'/api/dashboard/api/?team_id={self.team.id}'
+
+        self.client.get(url)  # 멤버십 캐시(teams.versioning) 채움
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_tasks(1)
+        with CaptureQueriesContext(connection) as small:
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_tasks(30)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['team_tasks']), 31)
+        self.assertEqual(len(small), len(large))
+
+
+class DashboardSnapshotCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='owner', password='pw', first_name='팀장')
+        self.team = Team.objects.create(name='팀', owner=self.user, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.user, role='팀장')
+        self.client.force_login(self.user)
+        self.url = f'/api/dashboard/api/?team_id={self.team.id}'
+
+    def test_second_read_is_served_from_cache(self):
+        with CaptureQueriesContext(connection) as cold:
+            self.client.get(self.url)
+        with CaptureQueriesContext(connection) as warm:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        # 세션/사용자 로딩 쿼리만 남고 대시보드 쿼리는 실행되지 않아야 함
+        self.assertFalse(any('tasks_task' in q['sql'] for q in warm.captured_queries))
+        self.assertLess(len(warm), len(cold))
+
+    def test_task_change_invalidates_snapshot(self):
+        self.assertEqual(self.client.get(self.url).json()['team_tasks'], [])
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.create(name='새 작업', team=self.team, type='team')
+        self.assertEqual([t['name'] for t in self.client.get(self.url).json()['team_tasks']], ['새 작업'])
+
+        task.status = 'completed'
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+        self.assertEqual(self.client.get(self.url).json()['total_progress'], 100)
+
+    def test_profile_and_member_changes_invalidate_snapshot(self):
+        self.client.get(self.url)
+        self.user.profile.major = '컴퓨터공학'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.profile.save()
+        members = self.client.get(self.url).json()['team_members']
+        self.assertEqual(members[0]['user__profile__major'], '컴퓨터공학')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TeamMember.objects.filter(team=self.team, user=self.user).get().delete()
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class GlobalContextTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='owner', password='pw', first_name='팀장')
+        self.team = Team.objects.create(name='팀', owner=self.user, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.user, role='팀장')
+        self.factory = RequestFactory()
+
+    def make_request(self):
+        request = self.factory.get('/')
+        request.user = self.user
+        request.session = {'current_team_id': self.team.id}
+        return request
+
+    def test_values_are_lazy(self):
+        with self.assertNumQueries(0):
+            global_context(self.make_request())
+
+    def test_values_and_cache(self):
+        Task.objects.create(name='임박', team=self.team, type='team', assignee=self.user, due_date=date.today())
+        context = global_context(self.make_request())
+        self.assertEqual(context['team'].id, self.team.id)
+        self.assertEqual(str(context['team_role']), '팀장')
+        self.assertEqual(context['deadline_imminent_count'], 1)
+
+        context = global_context(self.make_request())
+        with self.assertNumQueries(0):
+            self.assertEqual(context['team'].name, '팀')
+            self.assertEqual(context['deadline_imminent_count'], 1)
+
+    def test_task_and_profile_changes_invalidate_cache(self):
+        context = global_context(self.make_request())
+        self.assertEqual(context['deadline_imminent_count'], 0)
+        self.assertEqual(str(context['user_specialization']), '미정')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(name='임박', team=self.team, type='personal', assignee=self.user, due_date=date.today())
+            self.user.profile.specialization = '백엔드'
+            self.user.profile.save()
+
+        context = global_context(self.make_request())
+        self.assertEqual(context['deadline_imminent_count'], 1)
+        self.assertEqual(str(context['user_specialization']), '백엔드')
+
+
+class ExplainQueriesTests(TestCase):
+    def test_flags_open_ended_meeting_ranges(self):
+        is_warning = ExplainQueriesCommand.is_warning
+        self.assertTrue(is_warning('3 0 0 SEARCH schedule_meeting USING INDEX meeting_team_start_idx (team_id=? AND start_time<?)'))
+        self.assertTrue(is_warning('3 0 0 SEARCH schedule_meeting USING INDEX x (team_id=? AND series_end<?)'))
+        self.assertTrue(is_warning('4 0 0 SCAN tasks_task'))
+        self.assertFalse(is_warning('5 2 0 SEARCH schedule_meeting USING INDEX meeting_team_series_end_idx (team_id=? AND series_end>?)'))
+        self.assertFalse(is_warning(
+            '33 30 0 SEARCH schedule_meeting USING INDEX meeting_team_series_end_idx '
+            '(team_id=? AND series_end=? AND start_time<?)'
+        ))
+
+    def test_runs_real_endpoint_helpers(self):
+        out = StringIO()
+        call_command('explain_queries', tasks=60, stdout=out)
+        output = out.getvalue()
+        # 함수 항목은 실제로 나간 쿼리의 계획이 출력됨
+        self.assertIn('작업 통계 (get_task_stats)', output)
+        self.assertIn('CORRELATED SCALAR SUBQUERY', output)
+        self.assertIn('due_date>?', output)  # 커서 다음 페이지
+        self.assertIn('meeting_team_series_end_idx', output)
+        self.assertNotIn('start_time<?)\n', output.replace('series_end=? AND start_time<?)\n', ''))
@@ -0,0 +1,44 @@
+# dashboard/utils.py
+
+# ========================================
+# 대시보드 작업 통계 계산
+# DashboardAPIView / dashboard_page 에서 공통으로 사용
+# 팀 작업 수, 완료 수, 개인 작업 수, 마감 임박 수를 조건부 집계 쿼리 1번으로 계산
+# ========================================
+from django.db.models import Count, Exists, OuterRef, Q
+
+from tasks.models import URGENCY_NEEDS_ATTENTION, Task, TaskAssignment, urgency_expression
+
+
+def get_task_stats(team, user):
+    """
+    팀의 작업 통계를 한 번의 쿼리로 계산하여 dict로 반환
+    - total / completed: 팀 전체 작업 수, 완료 작업 수
+    - personal / personal_completed: 본인 개인 작업 수, 완료 수
+    - deadline_imminent: 본인 담당(assignee 또는 assignees) 작업 중 마감 임박/지난 미완료 작업 수
+      (기준은 tasks.models.urgency_expression)
+    - total_progress / personal_progress: 진행률(%)
+    """
+    # 담당 여부(assignee 또는 assignees)는 담당자 통합 테이블의 (task, user) 인덱스로 확인
+    is_mine = Exists(
+        TaskAssignment.objects.filter(task_id=OuterRef('pk'), user_id=user.id)
+    )
+    is_personal = Q(type='personal', assignee=user)
+    is_imminent = Q(is_mine) & Q(urgency__in=URGENCY_NEEDS_ATTENTION)
+
+    stats = Task.objects.filter(team=team).alias(urgency=urgency_expression()).aggregate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(status='completed')),
+        personal=Count('id', filter=is_personal),
+        personal_completed=Count('id', filter=is_personal & Q(status='completed')),
+        deadline_imminent=Count('id', filter=is_imminent),
+    )
+
+    stats['total_progress'] = calculate_progress(stats['completed'], stats['total'])
+    stats['personal_progress'] = calculate_progress(stats['personal_completed'], stats['personal'])
+    return stats
+
+
+def calculate_progress(completed_count, total_count):
+    """완료 수 / 전체 수 기준 진행률(%)"""
+    return int((completed_count / total_count) * 100) if total_count > 0 else 0
@@ -7,6 +7,10 @@ from teams.models import Team, TeamMember
 from django.db.models import F
 from tasks.models import Task
 from datetime import date, timedelta
+from .utils import get_task_stats
+from teams.versioning import team_etag
+from django.utils.decorators import method_decorator
+from .cache import get_dashboard_snapshot, set_dashboard_snapshot
 
 def landing_page_view(request):
     return render(request, 'landing/index.html')
@@ -15,9 +19,15 @@ def landing_page_view(request):
 # ========================================
 # MGP: 대시보드 API 엔드포인트 수정
 # 백엔드 부분 대신 수정: Task 모델에 없는 priority 필드 제거, 올바른 필드명으로 수정
+def _dashboard_team_id(request, *args, **kwargs):
+    # get()과 같은 우선순위: 쿼리 파라미터 > 세션
+    return request.query_params.get('team_id') or request.session.get('current_team_id')
+
+
 class DashboardAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(team_etag(get_team_id=_dashboard_team_id))
     def get(self, request):
         try:
             print("\n===== [DashboardAPIView GET 호출] =====")
@@ -40,9 +50,17 @@ class DashboardAPIView(APIView):
                 request.session.save()
                 print(f"[4] 세션에 첫 번째 팀 저장: {team_id}")
 
+            # 캐시된 스냅샷이 있으면 바로 반환 (팀 데이터 변경 시 signals에서 버전이 바뀌어 무효화됨)
+            # 멤버십이 바뀌어도 버전이 바뀌므로 스냅샷이 있으면 멤버로 확인된 상태
+            team_id = int(team_id)
+            snapshot, team_versions = get_dashboard_snapshot(team_id, request.user.id)
+            if snapshot is not None:
+                print(f"[캐시] 스냅샷 반환: team_id={team_id}")
+                return Response(snapshot)
+
             # 3. 해당 팀의 멤버십 검증
             try:
-                team_member = TeamMember.objects.get(user=request.user, team_id=team_id)
+                team_member = TeamMember.objects.select_related('team').get(user=request.user, team_id=team_id)
                 print(f"[5] 팀 멤버십 확인 성공: {team_member.team.name} (ID: {team_id})")
             except TeamMember.DoesNotExist:
                 print(f"[Error] 팀 멤버 아님: team_id={team_id}")
@@ -51,47 +69,24 @@ class DashboardAPIView(APIView):
             team = team_member.team
 
             # 4. 팀 멤버 목록
-            team_members = TeamMember.objects.filter(team=team).values(
+            team_members = list(TeamMember.objects.filter(team=team).values(
                 'user__first_name', 
                 'user__profile__major', 
                 'role'
-            )
+            ))
             print(f"[6] 팀 멤버 수: {len(team_members)}명")
 
             # 5. 팀 작업 / 개인 작업 조회
-            all_tasks = Task.objects.filter(team=team).order_by('-created_at')
+            all_tasks = Task.objects.filter(team=team).order_by('-created_at').with_urgency()
             team_tasks = all_tasks.filter(type='team')  # 팀 작업만
             personal_tasks = all_tasks.filter(type='personal', assignee=request.user)  # 개인 작업 중 본인 것만
-            print(f"[7] 전체 작업 수: {all_tasks.count()}, 팀 작업 수: {team_tasks.count()}, 개인 작업 수: {personal_tasks.count()}")
-
-            # 6. 진행률 계산
-            total_tasks_count = all_tasks.count()
-            completed_tasks_count = all_tasks.filter(status='completed').count()
-            total_progress = int((completed_tasks_count / total_tasks_count) * 100) if total_tasks_count > 0 else 0
-
-            personal_tasks_count = personal_tasks.count()
-            personal_completed_count = personal_tasks.filter(status='completed').count()
-            personal_progress = int((personal_completed_count / personal_tasks_count) * 100) if personal_tasks_count > 0 else 0
-
-            # 7. 마감 임박 작업 수 계산 (팀 작업 + 개인 작업)
-            from django.db.models import Q
-            my_tasks = Task.objects.filter(
-                Q(team_id=team_id) & (Q(assignee=request.user) | Q(assignees=request.user))
-            ).distinct().order_by('-created_at')
-
-            deadline_imminent_count = 0
-            if team:
-                deadline_threshold = date.today() + timedelta(days=1)
-                
-                # 팀 작업 + 개인 작업 중 완료되지 않은 마감 임박 작업 수
-                imminent_tasks = my_tasks.filter(
-                    team=team,
-                    due_date__isnull=False,
-                    due_date__lte=deadline_threshold,
-                    status__in=['pending', 'in_progress']
-                )
-                deadline_imminent_count = imminent_tasks.count()
 
+            # 6. 진행률 / 마감 임박 작업 수 계산 (조건부 집계 쿼리 1번)
+            stats = get_task_stats(team, request.user)
+            total_progress = stats['total_progress']
+            personal_progress = stats['personal_progress']
+            deadline_imminent_count = stats['deadline_imminent']
+            print(f"[7] 전체 작업 수: {stats['total']}, 개인 작업 수: {stats['personal']}")
             print(f"[8] 전체 진행률: {total_progress}%, 개인 진행률: {personal_progress}%, 마감 임박: {deadline_imminent_count}개")
 
             # 8. 응답 데이터 구성
@@ -108,14 +103,15 @@ class DashboardAPIView(APIView):
                     'created_at': team.created_at.isoformat() if team.created_at else None
                 },
                 'user_role': team_member.role,
-                'team_members': list(team_members),
+                'team_members': team_members,
                 'total_progress': total_progress,
                 'personal_progress': personal_progress,
                 'deadline_imminent_count': deadline_imminent_count,
-                'team_tasks': list(team_tasks.values('id', 'name', 'status', 'due_date', 'type', 'assignee__first_name', 'assignee__username', 'description')),
-                'personal_tasks': list(personal_tasks.values('id', 'name', 'status', 'due_date', 'type', 'description')),
+                'team_tasks': list(team_tasks.values('id', 'name', 'status', 'due_date', 'type', 'assignee__first_name', 'assignee__username', 'description', 'urgency')),
+                'personal_tasks': list(personal_tasks.values('id', 'name', 'status', 'due_date', 'type', 'description', 'urgency')),
             }
 
+            set_dashboard_snapshot(team.id, request.user.id, dashboard_data, team_versions)
             print(f"[9] 응답 데이터 준비 완료: team_id={team.id}, team_name={team.name}")
             return Response(dashboard_data)
 
@@ -153,7 +149,7 @@ def dashboard_page(request):
     )
 
     # 작업 분류 명확화
-    all_tasks = Task.objects.filter(team=team).order_by('-created_at')
+    all_tasks = Task.objects.filter(team=team).order_by('-created_at').with_people().with_urgency()
     
     # 팀 작업: type이 'team'인 모든 작업 (담당자 관계없이)
     team_tasks = all_tasks.filter(type='team')
@@ -161,27 +157,8 @@ def dashboard_page(request):
     # 개인 작업: type이 'personal'이면서 현재 사용자가 담당자인 작업
     personal_tasks = all_tasks.filter(type='personal', assignee=request.user)
 
-    # 디버깅용 출력
-    print(f"현재 사용자 ID: {request.user.id}")
-    print(f"팀: {team.name} (ID: {team.id})")
-    print(f"전체 작업 수: {all_tasks.count()}")
-    print(f"팀 작업 수: {team_tasks.count()}")
-    print(f"개인 작업 수: {personal_tasks.count()}")
-    print("=== 팀 작업 목록 ===")
-    for task in team_tasks:
-        print(f"- {task.name} (담당자: {task.assignee.id if task.assignee else 'None'})")
-    print("=== 개인 작업 목록 ===")
-    for task in personal_tasks:
-        print(f"- {task.name} (담당자: {task.assignee.id})")
-
-    # 진행률 계산 (completed 상태 기준)
-    total_tasks_count = all_tasks.count()
-    completed_tasks_count = all_tasks.filter(status='completed').count()
-    total_progress = int((completed_tasks_count / total_tasks_count) * 100) if total_tasks_count > 0 else 0
-
-    personal_tasks_count = personal_tasks.count()
-    personal_completed_count = personal_tasks.filter(status='completed').count()
-    personal_progress = int((personal_completed_count / personal_tasks_count) * 100) if personal_tasks_count > 0 else 0
+    # 진행률 계산 (completed 상태 기준, 조건부 집계 쿼리 1번)
+    stats = get_task_stats(team, request.user)
 
     # deadline_imminent_count는 context processor에서 전역적으로 처리
 
@@ -190,12 +167,12 @@ def dashboard_page(request):
         'team_members': team_members,
         'team_tasks': team_tasks,
         'personal_tasks': personal_tasks,
-        'total_progress': total_progress,
-        'personal_progress': personal_progress,
-        'total_tasks_count': total_tasks_count,
-        'completed_tasks_count': completed_tasks_count,
-        'personal_tasks_count': personal_tasks_count,
-        'personal_completed_count': personal_completed_count,
+        'total_progress': stats['total_progress'],
+        'personal_progress': stats['personal_progress'],
+        'total_tasks_count': stats['total'],
+        'completed_tasks_count': stats['completed'],
+        'personal_tasks_count': stats['personal'],
+        'personal_completed_count': stats['personal_completed'],
 
     })
 # ========================================
@@ -218,7 +195,7 @@ def dashboard_view(request, team_id):
 
     # 1. 팀 작업 및 개인 작업 정보 (임시로 빈 리스트 전달)
     # 팀 전체 작업
-    all_team_tasks = Task.objects.filter(team=team).order_by('-created_at')
+    all_team_tasks = Task.objects.filter(team=team).order_by('-created_at').with_people().with_urgency()
 
     # 개인 작업 (담당자가 현재 로그인한 사용자)
     personal_tasks = all_team_tasks.filter(assignee=user)
@@ -0,0 +1,289 @@
+# files/archives.py
+
+# ========================================
+# 팀 전체 파일 ZIP 캐시
+# - 저장소(MEDIA_ROOT) 아래 FILES_ARCHIVE_DIR/<팀 ID>/에 완성된 ZIP을 파일로 보관
+#   이름 = 팀 파일 목록의 지문(파일 ID, 크기/수정 시각, 아카이브 안 이름) → 파일이 그대로면 같은 ZIP
+#   → 변경이 없으면 다시 읽거나 압축하지 않고 정적 파일로 전송 (Range / ETag / X-Accel-Redirect 포함)
+# - 캐시가 없으면 미리 만들지 않고 ZIP을 만들면서 바로 전송, 같은 바이트를 임시 파일에도 씀
+#   → 첫 다운로드도 바로 전송 시작, 끝까지 보냈으면 os.replace로 캐시에 넣음
+#   중간에 끊기거나 실패하면 임시 파일만 지움 (반쯤 쓴 ZIP은 보이지 않음)
+#   빠진 파일(저장소에 없거나 열 수 없음)이 있으면 캐시하지 않음 → 다음 요청에서 다시 시도
+#   캐시에 쓰다가 오류가 나도 전송은 계속 (캐시만 포기)
+# - 파일별로 압축한 데이터(항목)는 members/<파일 ID>-<크기>-<수정 시각>.member로 따로 보관
+#   파일이 추가/변경되면 새 ZIP은 바뀐 파일만 압축하고 나머지는 보관된 항목을 그대로 복사
+#   압축하지 않는 형식(stored)은 CRC/크기만 보관하고 데이터는 원본에서 복사 (디스크에 두 번 두지 않음)
+# - 기존 ZIP을 제자리에서 고치거나 바로 지우지 않음: 전송 중인 다운로드가 있을 수 있음
+#   (FileResponse로 여는 중이거나 앞단 서버에 X-Accel-Redirect로 넘긴 경우)
+#   → 새 ZIP으로 바뀐 지 FILES_ARCHIVE_KEEP_MINUTES가 지난 ZIP만 삭제
+# - 로컬 경로가 없는 저장소(클라우드 등)는 None → 뷰에서 캐시 없이 스트리밍 ZIP만 전송
+# ========================================
+import hashlib
+import os
+import struct
+import time
+import uuid
+from functools import partial
+
+from django.conf import settings
+from django.utils import timezone
+
+from .downloads import local_path
+from .models import File
+from .zipstream import (
+    ZIP_DEFLATED, ZIP_STORED, ZipEntry, central_directory, iter_entry, known_member, local_header, read_chunks,
+    should_store, unique_names,
+)
+
+ARCHIVE_FORMAT = 2  # 항목/ZIP 구성이 바뀌면 올려서 기존 캐시를 무효화
+MEMBER_SUFFIX = '.member'
+
+# 보관 항목 헤더: 압축 방식, CRC, 압축 크기, 원본 크기, 데이터 포함 여부
+_MEMBER_HEADER = struct.Struct('<HIQQ?')
+
+
+class ArchiveFile:
+    """캐시된 ZIP (file_download_response에 FieldFile 대신 넘김)"""
+
+    def __init__(self, storage, name, sources=()):
+        self.storage = storage
+        self.name = name
+        self.sources = sources  # (File, 아카이브 안 이름, 원본 경로, 크기/수정 시각) 목록, 없는 파일은 경로 None
+
+    @property
+    def path(self):
+        return self.storage.path(self.name)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def open(self, mode='rb'):
+        return self.storage.open(self.name, mode)
+
+
+def archive_dir(team_id):
+    return f"{getattr(settings, 'FILES_ARCHIVE_DIR', 'team_archives')}/{team_id}"
+
+
+def file_stamp(path):
+    """크기와 수정 시각(마이크로초) → 파일 내용이 바뀌었는지 비교하는 값"""
+    stat = os.stat(path)
+    return f'{stat.st_size:x}-{stat.st_mtime_ns // 1000:x}'
+
+
+def fingerprint(sources):
+    digest = hashlib.sha256(f'v{ARCHIVE_FORMAT}'.encode())
+    for file_instance, name, _, stamp in sources:
+        digest.update(f'\n{file_instance.id}:{stamp}:{name}'.encode())
+    return digest.hexdigest()[:32]
+
+
+def team_archive(team, files):
+    """
+    팀 파일 목록(files, 아카이브 순서) → 캐시 ZIP의 ArchiveFile (아직 없을 수 있음, exists()로 확인)
+    저장소가 로컬 경로를 지원하지 않으면 None
+    """
+    storage = File._meta.get_field('file').storage
+    try:
+        storage.path(archive_dir(team.id))
+    except NotImplementedError:
+        return None
+
+    sources = []
+    for file_instance, name in zip(files, unique_names([f.filename for f in files])):
+        path = local_path(file_instance.file)
+        try:
+            stamp = file_stamp(path) if path else None
+        except FileNotFoundError:
+            path = stamp = None
+        sources.append((file_instance, name, path, stamp))
+    return ArchiveFile(storage, f'{archive_dir(team.id)}/{fingerprint(sources)}.zip', sources)
+
+
+def member_name(file_instance, stamp):
+    return f'{file_instance.id}-{stamp}{MEMBER_SUFFIX}'
+
+
+def _open_member(member_path, source_path):
+    """보관된 항목 → (헤더 값, 데이터 위치의 파일 객체), 보관된 항목이 없으면 None"""
+    try:
+        fh = open(member_path, 'rb')
+    except FileNotFoundError:
+        return None
+    header = _MEMBER_HEADER.unpack(fh.read(_MEMBER_HEADER.size))
+    if not header[4]:
+        fh.close()
+        fh = open(source_path, 'rb')
+    return header, fh
+
+
+def _iter_new_member(entry, offset, member_path):
+    """원본을 압축하면서 전송하고 압축한 데이터는 항목 파일로 보관 (iter_entry와 같은 결과 반환)"""
+    inline = not should_store(entry.name)  # stored는 CRC/크기만 보관
+    temp_path = f'{member_path}.{uuid.uuid4().hex}.tmp'
+    try:
+        out = open(temp_path, 'wb')
+        out.write(_MEMBER_HEADER.pack(0, 0, 0, 0, False))
+    except OSError:
+        out = None
+
+    def keep(chunk):
+        nonlocal out
+        if out is None or not inline:
+            return
+        try:
+            out.write(chunk)
+        except OSError:
+            out.close()
+            out = None
+            _remove(temp_path)
+
+    try:
+        member = yield from iter_entry(entry, offset, on_data=keep)
+        if out is not None and member is not None:
+            finished, out = out, None
+            try:
+                with finished:
+                    finished.seek(0)
+                    finished.write(_MEMBER_HEADER.pack(member.method, member.crc, member.compressed_size,
+                                                       member.size, inline))
+                os.replace(temp_path, member_path)
+            except OSError:
+                _remove(temp_path)
+        return member
+    finally:
+        # 끊기거나 파일을 열 수 없었으면 반쯤 쓴 항목은 버림
+        if out is not None:
+            out.close()
+            _remove(temp_path)
+
+
+def _iter_member(source, members_dir, offset):
+    """
+    항목 하나의 바이트 조각 → ZipMember (yield from의 결과)
+    보관된 항목이 있으면 압축하지 않고 그대로 복사, 파일이 없거나 열 수 없으면 None
+    """
+    file_instance, name, path, stamp = source
+    if path is None:
+        return None
+    modified = timezone.localtime(file_instance.uploaded_at)
+    member_path = os.path.join(members_dir, member_name(file_instance, stamp))
+    try:
+        cached = _open_member(member_path, path)
+    except OSError:
+        return None
+    if cached is None:
+        entry = ZipEntry(name=name, open=partial(open, path, 'rb'), modified=modified)
+        return (yield from _iter_new_member(entry, offset, member_path))
+
+    (method, crc, compressed_size, size, _), data = cached
+    with data:
+        member = known_member(name, method, modified, crc, compressed_size, size, offset)
+        yield local_header(member)
+        yield from read_chunks(data)
+    return member
+
+
+def iter_archive(sources, members_dir):
+    """
+    팀 파일 → ZIP 바이트 조각 (iter_zip과 같은 형식, 보관된 항목 재사용)
+    yield from의 결과로 모든 파일이 들어갔는지 반환 (빠진 파일이 있으면 False)
+    """
+    position, written, complete = 0, [], True
+    for source in sources:
+        chunks = _iter_member(source, members_dir, position)
+        while True:
+            try:
+                chunk = next(chunks)
+            except StopIteration as done:
+                if done.value is None:
+                    complete = False
+                else:
+                    written.append(done.value)
+                break
+            position += len(chunk)
+            yield chunk
+    yield from central_directory(written, position)
+    return complete
+
+
+def stream_archive(archive):
+    """
+    ZIP을 만들면서 그대로 내보내고 같은 바이트를 임시 파일에도 씀
+    모든 파일이 들어간 ZIP을 끝까지 내보냈으면 archive 위치로 교체하고 오래된 ZIP/항목 정리
+    """
+    archive_path = archive.path
+    root = os.path.dirname(archive_path)
+    members_dir = os.path.join(root, 'members')
+    temp_path = f'{archive_path}.{uuid.uuid4().hex}.tmp'
+    try:
+        os.makedirs(members_dir, exist_ok=True)
+        out = open(temp_path, 'wb')
+    except OSError:
+        out = None
+
+    chunks = iter_archive(archive.sources, members_dir)
+    try:
+        while True:
+            try:
+                chunk = next(chunks)
+            except StopIteration as done:
+                complete = done.value
+                break
+            if out is not None:
+                try:
+                    out.write(chunk)
+                except OSError:
+                    out.close()
+                    out = None
+                    _remove(temp_path)
+            yield chunk
+        if out is not None:
+            finished, out = out, None
+            try:
+                finished.close()
+                if complete:
+                    os.replace(temp_path, archive_path)
+                    prune(root, os.path.basename(archive_path),
+                          {member_name(f, stamp) for f, _, path, stamp in archive.sources if path})
+            except OSError:
+                pass
+            # 빠진 파일이 있었거나 교체하지 못한 임시 파일 삭제 (교체했으면 이미 없음)
+            _remove(temp_path)
+    finally:
+        # 클라이언트가 끊으면 GeneratorExit → 임시 파일만 정리
+        if out is not None:
+            out.close()
+            _remove(temp_path)
+
+
+def prune(root, keep_archive, keep_members):
+    """
+    이번 ZIP에 쓰이지 않는 항목과 오래된 ZIP 삭제 (다른 요청이 쓰는 중인 임시 파일은 건드리지 않음)
+    ZIP은 그다음 ZIP으로 바뀐 지(= 다음 ZIP의 수정 시각) FILES_ARCHIVE_KEEP_MINUTES가 지난 것만 삭제
+    """
+    keep_seconds = getattr(settings, 'FILES_ARCHIVE_KEEP_MINUTES', 60) * 60
+    archives = []
+    for name in os.listdir(root):
+        if name.endswith('.zip'):
+            try:
+                archives.append((os.stat(os.path.join(root, name)).st_mtime, name))
+            except FileNotFoundError:
+                continue
+    archives.sort(reverse=True)
+    cutoff = time.time() - keep_seconds
+    for (replaced_at, _), (_, name) in zip(archives, archives[1:]):
+        if replaced_at < cutoff and name != keep_archive:
+            _remove(os.path.join(root, name))
+
+    members_dir = os.path.join(root, 'members')
+    for name in os.listdir(members_dir):
+        if name.endswith(MEMBER_SUFFIX) and name not in keep_members:
+            _remove(os.path.join(members_dir, name))
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
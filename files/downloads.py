@@ -0,0 +1,236 @@
+# files/downloads.py
+
+# ========================================
+# 팀 파일 다운로드 응답
+# - 파일 내용을 메모리에 한 번에 읽지 않고 전송
+#   로컬 저장소: 열린 파일을 FileResponse로 넘김
+#     → WSGI 서버(gunicorn 등)는 wsgi.file_wrapper로 os.sendfile 사용 (커널에서 바로 소켓으로 복사)
+#     → ASGI에서는 DOWNLOAD_CHUNK_SIZE 단위로 읽어서 전송
+#   .path를 지원하지 않는 저장소: file.open()을 같은 방식으로 조각 단위 전송
+# - settings.FILES_DOWNLOAD_OFFLOAD를 설정하면 권한 확인까지만 Django가 하고 전송은 앞단 웹 서버에 맡김
+#   'x-accel-redirect': nginx (FILES_ACCEL_REDIRECT_PREFIX를 MEDIA_ROOT로 연결한 internal location 필요)
+#   'x-sendfile': Apache mod_xsendfile / lighttpd (MEDIA_ROOT 아래 절대 경로)
+# - 이어받기 / 미디어 탐색: Range 요청(단일 → 206, 여러 구간 → multipart/byteranges, 범위 밖 → 416)
+#   검증값은 파일 크기와 수정 시각으로 만든 강한 ETag + Last-Modified
+#   If-Range가 현재 파일과 다르면(그 사이 파일이 바뀜) Range를 무시하고 전체 전송
+#   If-None-Match / If-Modified-Since가 같으면 304
+# ========================================
+import os
+import re
+import uuid
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+OFFLOAD_ACCEL_REDIRECT = 'x-accel-redirect'
+OFFLOAD_SENDFILE = 'x-sendfile'
+DOWNLOAD_CONTENT_TYPE = 'application/octet-stream'
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+MAX_RANGES = 16  # 이보다 많은 구간을 요청하면 전체 전송 (작은 구간을 대량으로 요청하는 경우 방지)
+
+
+class DownloadResponse(FileResponse):
+    block_size = DOWNLOAD_CHUNK_SIZE
+
+
+def attachment_header(filename):
+    """한글 등 파일 이름을 UTF-8로 인코딩한 Content-Disposition 값"""
+    return f"attachment; filename*=UTF-8''{quote(filename)}"
+
+
+def local_path(field_file):
+    """로컬 저장소의 실제 경로 (지원하지 않거나 파일이 없으면 None)"""
+    try:
+        path = field_file.path
+    except (NotImplementedError, AttributeError, ValueError):
+        return None
+    return path if os.path.exists(path) else None
+
+
+def offload_response(field_file, path, content_type=DOWNLOAD_CONTENT_TYPE):
+    """앞단 웹 서버가 전송하도록 헤더만 담은 응답 (설정이 없거나 헤더로 보낼 수 없는 경로면 None)"""
+    mode = getattr(settings, 'FILES_DOWNLOAD_OFFLOAD', None)
+    if mode == OFFLOAD_ACCEL_REDIRECT:
+        prefix = getattr(settings, 'FILES_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+        header, value = 'X-Accel-Redirect', prefix.rstrip('/') + '/' + quote(field_file.name)
+    elif mode == OFFLOAD_SENDFILE:
+        # mod_xsendfile은 경로를 그대로 읽으므로 헤더에 넣을 수 없는 이름(한글 등)은 직접 전송
+        if not path.isascii():
+            return None
+        header, value = 'X-Sendfile', path
+    else:
+        return None
+
+    response = HttpResponse(content_type=content_type)
+    response[header] = value
+    return response
+
+
+# ========================================
+# 검증값 / Range
+# ========================================
+_RANGE_RE = re.compile(r'^\s*(\d*)\s*-\s*(\d*)\s*$')
+
+
+def file_validators(field_file, path):
+    """(크기, 강한 ETag, 수정 시각 timestamp) - 저장소가 수정 시각을 모르면 ETag/수정 시각은 None"""
+    if path:
+        stat = os.stat(path)
+        size, mtime = stat.st_size, stat.st_mtime
+    else:
+        storage = field_file.storage
+        size = storage.size(field_file.name)
+        try:
+            mtime = storage.get_modified_time(field_file.name).timestamp()
+        except (NotImplementedError, AttributeError):
+            mtime = None
+    if mtime is None:
+        return size, None, None
+    return size, f'"{size:x}-{int(mtime * 1_000_000):x}"', int(mtime)
+
+
+def parse_range_header(header, size):
+    """
+    Range 헤더 → [(start, end), ...] (end 포함)
+    - 헤더가 없거나 형식이 잘못됐거나 구간이 너무 많으면 None (전체 전송)
+    - 만족하는 구간이 하나도 없으면 [] (416)
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes' or not spec:
+        return None
+    specs = spec.split(',')
+    if len(specs) > MAX_RANGES:
+        return None
+
+    ranges = []
+    for item in specs:
+        match = _RANGE_RE.match(item)
+        if not match or match.groups() == ('', ''):
+            return None
+        first, last = match.groups()
+        if first == '':
+            # bytes=-N: 마지막 N바이트
+            length = int(last)
+            if length == 0:
+                continue
+            start, end = max(size - length, 0), size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+            if last and int(last) < start:
+                return None
+        if start < size:
+            ranges.append((start, end))
+    return ranges
+
+
+def if_range_matches(header, etag, last_modified):
+    """If-Range가 없거나 현재 파일과 같으면 True (강한 비교만 인정)"""
+    if not header:
+        return True
+    header = header.strip()
+    if header.startswith(('"', 'W/')):
+        return etag is not None and header == etag
+    return last_modified is not None and parse_http_date_safe(header) == last_modified
+
+
+def _read_range(fh, start, length):
+    fh.seek(start)
+    while length > 0:
+        chunk = fh.read(min(DOWNLOAD_CHUNK_SIZE, length))
+        if not chunk:
+            break
+        length -= len(chunk)
+        yield chunk
+
+
+def _iter_range(fh, start, length):
+    try:
+        yield from _read_range(fh, start, length)
+    finally:
+        fh.close()
+
+
+def _iter_multipart(fh, ranges, size, boundary, content_type):
+    try:
+        for start, end in ranges:
+            yield _part_header(boundary, start, end, size, content_type)
+            yield from _read_range(fh, start, end - start + 1)
+            yield b'\r\n'
+        yield f'--{boundary}--\r\n'.encode()
+    finally:
+        fh.close()
+
+
+def _part_header(boundary, start, end, size, content_type):
+    return (
+        f'--{boundary}\r\n'
+        f'Content-Type: {content_type}\r\n'
+        f'Content-Range: bytes {start}-{end}/{size}\r\n\r\n'
+    ).encode()
+
+
+def range_response(fh, ranges, size, content_type=DOWNLOAD_CONTENT_TYPE):
+    """206 응답 (구간 하나면 그 구간, 여러 개면 multipart/byteranges)"""
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        response = StreamingHttpResponse(_iter_range(fh, start, end - start + 1), status=206,
+                                         content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+        return response
+
+    boundary = uuid.uuid4().hex
+    length = sum(
+        len(_part_header(boundary, start, end, size, content_type)) + (end - start + 1) + 2
+        for start, end in ranges
+    )
+    length += len(f'--{boundary}--\r\n')
+    response = StreamingHttpResponse(_iter_multipart(fh, ranges, size, boundary, content_type), status=206,
+                                     content_type=f'multipart/byteranges; boundary={boundary}')
+    response['Content-Length'] = str(length)
+    return response
+
+
+def file_download_response(request, field_file, filename, content_type=DOWNLOAD_CONTENT_TYPE):
+    """
+    FileField 값 → 첨부 파일 다운로드 응답 (Range / If-Range / 조건부 요청 처리)
+    파일이 없거나 열 수 없으면 OSError (저장소에 따라 FileNotFoundError 등)
+    """
+    path = local_path(field_file)
+    response = offload_response(field_file, path, content_type) if path else None
+    if response is not None:
+        # 앞단 웹 서버가 Range / 검증값까지 처리
+        response['Content-Disposition'] = attachment_header(filename)
+        return response
+
+    size, etag, last_modified = file_validators(field_file, path)
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    ranges = None
+    if request.method in ('GET', 'HEAD') and if_range_matches(request.headers.get('If-Range'), etag, last_modified):
+        ranges = parse_range_header(request.headers.get('Range'), size)
+
+    if ranges == []:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+    else:
+        fh = open(path, 'rb') if path else field_file.open('rb')
+        if ranges:
+            response = range_response(fh, ranges, size, content_type)
+        else:
+            response = DownloadResponse(fh, content_type=content_type)
+
+    response['Accept-Ranges'] = 'bytes'
+    if etag:
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+    response['Content-Disposition'] = attachment_header(filename)
+    return response
@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.conf import settings
 from teams.models import Team
@@ -9,5 +11,45 @@ class File(models.Model):
     filename = models.CharField(max_length=255) # 원본 파일 이름
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 팀 파일 목록 최신순
+            models.Index(fields=['team', 'uploaded_at'], name='file_team_uploaded_idx'),
+        ]
+
+    def __str__(self):
+        return f"[{self.team.name}] {self.filename}"
+
+
+class UploadSession(models.Model):
+    """
+    청크 업로드 진행 중인 파일 (files/uploads.py)
+    데이터는 임시 파일에 바로 쓰고, 받은 청크 번호만 UploadChunk로 기록 → 완료하면 File로 바뀌고 삭제
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='upload_sessions')
+    uploader = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)  # 오래된 업로드 정리
+
+    @property
+    def chunk_count(self):
+        return -(-self.size // self.chunk_size)
+
+    def chunk_length(self, index):
+        """index번째 청크의 바이트 수 (마지막 청크만 짧을 수 있음)"""
+        return min(self.chunk_size, self.size - index * self.chunk_size)
+
     def __str__(self):
-        return f"[{self.team.name}] {self.filename}"
\ No newline at end of file
+        return f"[{self.team_id}] {self.filename} (업로드 중)"
+
+
+class UploadChunk(models.Model):
+    """업로드 세션에서 임시 파일에 다 쓴 청크 번호"""
+    session = models.ForeignKey(UploadSession, on_delete=models.CASCADE, related_name='chunks')
+    index = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = ('session', 'index')
@@ -1,3 +1,487 @@
-from django.test import TestCase
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from datetime import datetime, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from teams.models import Team, TeamMember
+from .downloads import DOWNLOAD_CHUNK_SIZE
+from .archives import archive_dir
+from .uploads import temp_path
+from .models import File, UploadSession
+from .zipstream import ZipEntry, compress_chunks, iter_zip
+
+
+class FileTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.user = User.objects.create_user(username='owner', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.user, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.user)
+        self.client.force_login(self.user)
+
+    def create_file(self, name, content):
+        file_instance = File(team=self.team, uploader=self.user, filename=name)
+        file_instance.file.save(name, ContentFile(content), save=False)
+        file_instance.save()
+        return file_instance
+
+
+class FileDownloadTests(FileTestCase):
+    def test_download_is_streamed(self):
+        content = bytes(range(256)) * (DOWNLOAD_CHUNK_SIZE // 128 + 3)
+        file_instance = self.create_file('보고서.pdf', content)
+
+        response = self.client.get(f'/api/files/{file_instance.id}/download/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Length'], str(len(content)))
+        self.assertEqual(response['Content-Disposition'], "attachment; filename*=UTF-8''%EB%B3%B4%EA%B3%A0%EC%84%9C.pdf")
+        chunks = list(response.streaming_content)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b''.join(chunks), content)
+
+    def test_offload_modes(self):
+        file_instance = self.create_file('notes.txt', b'hello')
+        url = f'/api/files/{file_instance.id}/download/'
+
+        with self.settings(FILES_DOWNLOAD_OFFLOAD='x-accel-redirect'):
+            response = self.client.get(url)
+        self.assertFalse(response.streaming)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{file_instance.file.name}')
+
+        with self.settings(FILES_DOWNLOAD_OFFLOAD='x-sendfile'):
+            response = self.client.get(url)
+        self.assertEqual(response['X-Sendfile'], file_instance.file.path)
+
+    def test_missing_file_and_permission(self):
+        file_instance = self.create_file('notes.txt', b'hello')
+        file_instance.file.storage.delete(file_instance.file.name)
+        self.assertEqual(self.client.get(f'/api/files/{file_instance.id}/download/').status_code, 404)
+
+        outsider = User.objects.create_user(username='outsider', password='pw')
+        self.client.force_login(outsider)
+        self.assertEqual(self.client.get(f'/api/files/{file_instance.id}/download/').status_code, 403)
+
+
+class FileRangeTests(FileTestCase):
+    def setUp(self):
+        super().setUp()
+        self.content = bytes(range(256)) * 40
+        self.file = self.create_file('video.mp4', self.content)
+        self.url = f'/api/files/{self.file.id}/download/'
+
+    def get(self, **headers):
+        return self.client.get(self.url, headers=headers)
+
+    def body(self, response):
+        return b''.join(response.streaming_content) if response.streaming else response.content
+
+    def test_full_response_has_validators(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertTrue(response['ETag'].startswith('"'))
+        self.assertIn('Last-Modified', response)
+        self.assertEqual(self.body(response), self.content)
+
+        self.assertEqual(self.get(if_none_match=response['ETag']).status_code, 304)
+
+    def test_single_ranges(self):
+        size = len(self.content)
+        for header, (start, end) in [
+            ('bytes=0-99', (0, 99)),
+            ('bytes=100-', (100, size - 1)),
+            ('bytes=-50', (size - 50, size - 1)),
+            (f'bytes=10-{size * 2}', (10, size - 1)),
+        ]:
+            response = self.get(range=header)
+            self.assertEqual(response.status_code, 206, header)
+            self.assertEqual(response['Content-Range'], f'bytes {start}-{end}/{size}')
+            self.assertEqual(self.body(response), self.content[start:end + 1])
+
+    def test_multiple_ranges(self):
+        response = self.get(range='bytes=0-9, 20-29')
+        self.assertEqual(response.status_code, 206)
+        content_type = response['Content-Type']
+        self.assertTrue(content_type.startswith('multipart/byteranges; boundary='))
+        boundary = content_type.split('=', 1)[1]
+        body = self.body(response)
+        self.assertEqual(int(response['Content-Length']), len(body))
+
+        parts = body.split(f'--{boundary}'.encode())
+        self.assertEqual(parts[-1], b'--\r\n')
+        self.assertIn(f'Content-Range: bytes 0-9/{len(self.content)}'.encode(), parts[1])
+        self.assertTrue(parts[1].endswith(b'\r\n\r\n' + self.content[0:10] + b'\r\n'))
+        self.assertTrue(parts[2].endswith(b'\r\n\r\n' + self.content[20:30] + b'\r\n'))
+
+    def test_unsatisfiable_and_invalid_ranges(self):
+        response = self.get(range=f'bytes={len(self.content)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.content)}')
+
+        for header in ('bytes=abc', 'items=0-10', 'bytes=10-5'):
+            self.assertEqual(self.get(range=header).status_code, 200, header)
+
+    def test_if_range(self):
+        etag = self.get()['ETag']
+        self.assertEqual(self.get(range='bytes=0-9', if_range=etag).status_code, 206)
+        self.assertEqual(self.get(range='bytes=0-9', if_range='"stale"').status_code, 200)
+        last_modified = self.get()['Last-Modified']
+        self.assertEqual(self.get(range='bytes=0-9', if_range=last_modified).status_code, 206)
+
+    def test_storage_without_local_path(self):
+        with mock.patch('files.downloads.local_path', return_value=None):
+            response = self.get(range='bytes=5-14')
+            self.assertEqual(response.status_code, 206)
+            self.assertEqual(self.body(response), self.content[5:15])
+            self.assertEqual(self.body(self.get()), self.content)
+
+
+class StreamingZipTests(FileTestCase):
+    @mock.patch('files.views.team_archive', return_value=None)
+    def test_batch_download_is_valid_streamed_zip(self, _):
+        text = ('팀 회의록 ' * 5000).encode()
+        image = bytes(range(256)) * 500
+        self.create_file('회의록.txt', text)
+        self.create_file('photo.JPG', image)
+        self.create_file('회의록.txt', b'second')
+        missing = self.create_file('missing.txt', b'gone')
+        missing.file.storage.delete(missing.file.name)
+
+        response = self.client.get(f'/api/teams/{self.team.id}/files/download-all/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/zip')
+
+        with zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content))) as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertEqual(archive.namelist(), ['회의록.txt', 'photo.JPG', '회의록 (2).txt'])
+            self.assertEqual(archive.read('회의록.txt'), text)
+            self.assertEqual(archive.read('photo.JPG'), image)
+            self.assertEqual(archive.read('회의록 (2).txt'), b'second')
+            self.assertEqual(archive.getinfo('회의록.txt').compress_type, zipfile.ZIP_DEFLATED)
+            self.assertLess(archive.getinfo('회의록.txt').compress_size, len(text))
+            self.assertEqual(archive.getinfo('photo.JPG').compress_type, zipfile.ZIP_STORED)
+
+    def test_entries_are_opened_lazily(self):
+        opened = []
+
+        def entry(name, content):
+            def open_file():
+                opened.append(name)
+                return io.BytesIO(content)
+            return ZipEntry(name=name, open=open_file, modified=datetime(2030, 1, 2, 3, 4, 6))
+
+        chunks = iter_zip(entry(f'{i}.bin', b'x' * 10) for i in range(3))
+        body = next(chunks)
+        self.assertEqual(opened, ['0.bin'])
+
+        body += b''.join(chunks)
+        self.assertEqual(opened, ['0.bin', '1.bin', '2.bin'])
+        with zipfile.ZipFile(io.BytesIO(body)) as archive:
+            self.assertEqual(archive.read('2.bin'), b'x' * 10)
+            self.assertEqual(archive.getinfo('0.bin').date_time, (2030, 1, 2, 3, 4, 6))
+
+
+class TeamArchiveCacheTests(FileTestCase):
+    def download_all(self, **headers):
+        response = self.client.get(f'/api/teams/{self.team.id}/files/download-all/', headers=headers)
+        self.assertIn(response.status_code, (200, 206))
+        return response
+
+    def read_archive(self, response):
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertIsNone(archive.testzip())
+        return archive
+
+    def archive_root(self):
+        return os.path.join(self.media_root, archive_dir(self.team.id))
+
+    def archive_dir_files(self):
+        root = self.archive_root()
+        if not os.path.isdir(root):
+            return []
+        return sorted(name for name in os.listdir(root) if os.path.isfile(os.path.join(root, name)))
+
+    def archive_names(self):
+        return [name for name in self.archive_dir_files() if name.endswith('.zip')]
+
+    def member_files(self):
+        return sorted(os.listdir(os.path.join(self.archive_root(), 'members')))
+
+    def test_first_download_streams_then_reuses_archive(self):
+        text = ('회의록 ' * 3000).encode()
+        self.create_file('회의록.txt', text)
+        self.create_file('photo.png', bytes(range(256)) * 40)
+
+        # 캐시가 없으면 미리 만들지 않고 바로 스트리밍, 다 보낸 뒤에 캐시에 들어감
+        first = self.download_all()
+        self.assertEqual(first['Content-Type'], 'application/zip')
+        self.assertNotIn('ETag', first)
+        self.assertEqual(self.archive_names(), [])
+        with self.read_archive(first) as archive:
+            self.assertEqual(archive.namelist(), ['회의록.txt', 'photo.png'])
+            self.assertEqual(archive.read('회의록.txt'), text)
+            self.assertEqual(archive.getinfo('회의록.txt').compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(archive.getinfo('photo.png').compress_type, zipfile.ZIP_STORED)
+        self.assertEqual(len(self.archive_names()), 1)
+        self.assertEqual(self.archive_dir_files(), self.archive_names())
+
+        with mock.patch('files.views.stream_archive') as stream:
+            second = self.download_all()
+            stream.assert_not_called()
+        self.assertIn('ETag', second)
+        with self.read_archive(second) as archive:
+            self.assertEqual(archive.read('회의록.txt'), text)
+        self.assertEqual(self.download_all()['ETag'], second['ETag'])
+
+        partial_response = self.download_all(Range='bytes=0-3')
+        self.assertEqual(partial_response.status_code, 206)
+        self.assertEqual(b''.join(partial_response.streaming_content), b'PK\x03\x04')
+
+    def test_changed_file_recompresses_only_its_member(self):
+        self.create_file('a.txt', b'a' * 5000)
+        changed = self.create_file('b.txt', b'b' * 5000)
+        png = self.create_file('photo.png', bytes(range(256)) * 40)
+        with mock.patch('files.zipstream.compress_chunks', wraps=compress_chunks) as compress:
+            self.read_archive(self.download_all()).close()
+        self.assertEqual(compress.call_count, 3)
+        # 압축하지 않는 형식은 원본을 두 번 두지 않음 (헤더만 보관)
+        self.assertEqual(len(self.member_files()), 3)
+        png_member = [name for name in self.member_files() if name.startswith(f'{png.id}-')][0]
+        self.assertLess(os.path.getsize(os.path.join(self.archive_root(), 'members', png_member)), 64)
+
+        with open(changed.file.path, 'wb') as fh:
+            fh.write(b'B' * 7000)
+        with mock.patch('files.zipstream.compress_chunks', wraps=compress_chunks) as compress:
+            with self.read_archive(self.download_all()) as archive:
+                self.assertEqual(archive.namelist(), ['a.txt', 'b.txt', 'photo.png'])
+                self.assertEqual(archive.read('a.txt'), b'a' * 5000)
+                self.assertEqual(archive.read('b.txt'), b'B' * 7000)
+                self.assertEqual(archive.read('photo.png'), bytes(range(256)) * 40)
+        self.assertEqual(compress.call_count, 1)
+        # 바뀌기 전 b.txt 항목은 정리
+        self.assertEqual(len(self.member_files()), 3)
+
+    def test_missing_storage_file_is_not_cached(self):
+        self.create_file('a.txt', b'a' * 5000)
+        missing = self.create_file('missing.txt', b'gone')
+        missing.file.storage.delete(missing.file.name)
+
+        for _ in range(2):
+            response = self.download_all()
+            self.assertNotIn('ETag', response)
+            with self.read_archive(response) as archive:
+                self.assertEqual(archive.namelist(), ['a.txt'])
+            self.assertEqual(self.archive_dir_files(), [])
+
+    def test_unreadable_file_is_not_cached(self):
+        self.create_file('a.txt', b'a' * 5000)
+        self.create_file('b.txt', b'b' * 5000)
+        real_open = open
+
+        def fail_b(path, *args, **kwargs):
+            if str(path).endswith('b.txt'):
+                raise PermissionError(path)
+            return real_open(path, *args, **kwargs)
+
+        with mock.patch('files.archives.open', side_effect=fail_b, create=True):
+            with self.read_archive(self.download_all()) as archive:
+                self.assertEqual(archive.namelist(), ['a.txt'])
+        self.assertEqual(self.archive_dir_files(), [])
+
+        with self.read_archive(self.download_all()) as archive:
+            self.assertEqual(archive.namelist(), ['a.txt', 'b.txt'])
+        self.assertEqual(len(self.archive_names()), 1)
+
+    def test_interrupted_download_is_not_cached(self):
+        self.create_file('a.bin', os.urandom(300 * 1024))
+        response = self.download_all()
+        next(iter(response.streaming_content))
+        self.assertEqual(len(self.archive_dir_files()), 1)  # 쓰는 중인 임시 파일
+        response.close()
+        self.assertEqual(self.archive_dir_files(), [])
+        self.assertEqual(self.member_files(), [])
+
+    def test_cache_write_error_keeps_streaming(self):
+        self.create_file('a.txt', b'a' * 5000)
+        with mock.patch('files.archives.os.replace', side_effect=OSError):
+            with self.read_archive(self.download_all()) as archive:
+                self.assertEqual(archive.read('a.txt'), b'a' * 5000)
+        self.assertEqual(self.archive_dir_files(), [])
+
+    def age_archives(self, minutes):
+        for name in self.archive_names():
+            path = os.path.join(self.archive_root(), name)
+            moment = os.stat(path).st_mtime - minutes * 60
+            os.utime(path, (moment, moment))
+
+    @override_settings(FILES_ARCHIVE_KEEP_MINUTES=60)
+    def test_replaced_archives_are_kept_for_a_while(self):
+        self.create_file('a.txt', b'a' * 5000)
+        removed = self.create_file('b.txt', b'b' * 5000)
+        self.read_archive(self.download_all()).close()
+        first_names = self.archive_names()
+
+        # 방금 바뀐 ZIP은 전송 중일 수 있으므로 남김
+        self.create_file('c.txt', b'c' * 5000)
+        with self.read_archive(self.download_all()) as archive:
+            self.assertEqual(archive.namelist(), ['a.txt', 'b.txt', 'c.txt'])
+        self.assertEqual(len(self.archive_names()), 2)
+        self.assertTrue(set(first_names) <= set(self.archive_names()))
+
+        # 다음 ZIP으로 바뀐 지 KEEP_MINUTES가 지난 ZIP만 삭제
+        self.age_archives(61)
+        self.client.post(f'/api/files/{removed.id}/delete')
+        with self.read_archive(self.download_all()) as archive:
+            self.assertEqual(archive.namelist(), ['a.txt', 'c.txt'])
+        self.assertEqual(len(self.archive_names()), 2)
+        self.assertFalse(set(first_names) & set(self.archive_names()))
+
+
+@override_settings(FILES_UPLOAD_CHUNK_SIZE=1024, FILES_UPLOAD_MAX_SIZE=1024 * 1024)
+class ChunkedUploadTests(FileTestCase):
+    content = bytes(range(256)) * 10  # 2560바이트 → 1024 / 1024 / 512 세 청크
+
+    def start(self, filename='발표 자료.pdf', size=None):
+        response = self.client.post(
+            f'/api/teams/{self.team.id}/files/uploads',
+            {'filename': filename, 'size': len(self.content) if size is None else size},
+            content_type='application/json',
+        )
+        return response
+
+    def put_chunk(self, upload_id, index, data=None):
+        offset = index * 1024
+        if data is None:
+            data = self.content[offset:offset + 1024]
+        return self.client.put(f'/api/uploads/{upload_id}?offset={offset}', data,
+                               content_type='application/octet-stream')
+
+    def status(self, upload_id):
+        return self.client.get(f'/api/uploads/{upload_id}').json()['data']
+
+    def test_chunks_in_any_order_then_complete(self):
+        response = self.start()
+        self.assertEqual(response.status_code, 201)
+        upload = response.json()['data']
+        self.assertEqual((upload['chunk_size'], upload['chunk_count'], upload['received']), (1024, 3, []))
+        upload_id = upload['upload_id']
+
+        self.assertEqual(self.put_chunk(upload_id, 2).status_code, 200)
+        self.assertEqual(self.put_chunk(upload_id, 0).status_code, 200)
+        self.assertEqual(self.status(upload_id)['received'], [0, 2])
+
+        # 빠진 청크가 있으면 완료 불가
+        response = self.client.post(f'/api/uploads/{upload_id}/complete')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['data']['received'], [0, 2])
+
+        self.put_chunk(upload_id, 1)
+        self.put_chunk(upload_id, 1)  # 재전송은 덮어쓰기
+        path = temp_path(UploadSession.objects.get(id=upload_id))
+        response = self.client.post(f'/api/uploads/{upload_id}/complete')
+        self.assertEqual(response.status_code, 200)
+
+        file_instance = File.objects.get(id=response.json()['data']['id'])
+        self.assertEqual(file_instance.filename, '발표 자료.pdf')
+        self.assertEqual(file_instance.team, self.team)
+        with file_instance.file.open('rb') as fh:
+            self.assertEqual(fh.read(), self.content)
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(UploadSession.objects.exists())
+
+        # 두 번째 완료 요청은 파일을 또 만들지 않음
+        self.assertEqual(self.client.post(f'/api/uploads/{upload_id}/complete').status_code, 404)
+        self.assertEqual(File.objects.count(), 1)
+
+    def test_assembly_moves_temp_file(self):
+        upload_id = self.start(size=0).json()['data']['upload_id']
+        with mock.patch('django.core.files.storage.filesystem.file_move_safe') as move:
+            move.side_effect = lambda old, new, **kwargs: os.rename(old, new)
+            response = self.client.post(f'/api/uploads/{upload_id}/complete')
+        self.assertEqual(response.status_code, 200)
+        move.assert_called_once()
+
+    def test_failed_completion_keeps_session(self):
+        upload_id = self.start().json()['data']['upload_id']
+        for index in range(3):
+            self.put_chunk(upload_id, index)
+        path = temp_path(UploadSession.objects.get(id=upload_id))
+
+        # File 생성이 실패하면 세션과 임시 파일이 남아 있어 다시 완료 요청 가능
+        with mock.patch('files.uploads.File.objects.create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.client.post(f'/api/uploads/{upload_id}/complete')
+        self.assertTrue(UploadSession.objects.filter(id=upload_id).exists())
+        with open(path, 'rb') as fh:
+            self.assertEqual(fh.read(), self.content)
+        self.assertEqual(os.listdir(os.path.dirname(path)), [os.path.basename(path)])
+
+        response = self.client.post(f'/api/uploads/{upload_id}/complete')
+        self.assertEqual(response.status_code, 200)
+        with File.objects.get().file.open('rb') as fh:
+            self.assertEqual(fh.read(), self.content)
+        self.assertEqual(File.objects.count(), 1)
+
+    def test_chunk_after_completion_is_rejected(self):
+        upload_id = self.start().json()['data']['upload_id']
+        for index in range(3):
+            self.put_chunk(upload_id, index)
+        session = UploadSession.objects.get(id=upload_id)
+        os.remove(temp_path(session))  # 다른 요청이 완료 처리 중
+        response = self.put_chunk(upload_id, 0)
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(response.json()['success'])
+
+    def test_invalid_chunks_are_rejected(self):
+        upload_id = self.start().json()['data']['upload_id']
+        self.assertEqual(self.client.put(f'/api/uploads/{upload_id}?offset=100', b'x' * 1024,
+                                         content_type='application/octet-stream').status_code, 400)
+        self.assertEqual(self.client.put(f'/api/uploads/{upload_id}?offset=4096', b'x',
+                                         content_type='application/octet-stream').status_code, 400)
+        self.assertEqual(self.put_chunk(upload_id, 2, b'short').status_code, 400)
+        self.assertEqual(self.status(upload_id)['received'], [])
+
+    def test_start_validation_and_permissions(self):
+        self.assertEqual(self.start(size=1024 * 1024 + 1).status_code, 400)
+        self.assertEqual(self.start(filename='').status_code, 400)
+        self.assertEqual(self.start(size='big').status_code, 400)
+
+        upload_id = self.start().json()['data']['upload_id']
+        other = User.objects.create_user(username='other', password='pw')
+        TeamMember.objects.create(team=self.team, user=other)
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}').status_code, 404)
+        self.assertEqual(self.put_chunk(upload_id, 0).status_code, 404)
+
+        outsider = User.objects.create_user(username='outsider', password='pw')
+        self.client.force_login(outsider)
+        self.assertEqual(self.start().status_code, 403)
+
+    def test_cancel_and_expired_uploads_remove_temp_files(self):
+        upload_id = self.start().json()['data']['upload_id']
+        path = temp_path(UploadSession.objects.get(id=upload_id))
+        self.assertEqual(os.path.getsize(path), len(self.content))
+        self.assertEqual(self.client.delete(f'/api/uploads/{upload_id}').status_code, 200)
+        self.assertFalse(os.path.exists(path))
+
+        old = UploadSession.objects.get(id=self.start().json()['data']['upload_id'])
+        UploadSession.objects.filter(id=old.id).update(created_at=timezone.now() - timedelta(days=2))
+        self.start()
+        self.assertFalse(UploadSession.objects.filter(id=old.id).exists())
+        self.assertFalse(os.path.exists(temp_path(old)))
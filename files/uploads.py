@@ -0,0 +1,203 @@
+# files/uploads.py
+
+# ========================================
+# 청크(이어 올리기) 업로드
+# - 시작: 파일 이름/크기 → UploadSession + 크기만큼 잡아 둔 임시 파일 (FILES_UPLOAD_TEMP_DIR/<세션 ID>.part)
+# - 청크: PUT 본문을 UPLOAD_READ_SIZE 단위로 읽어서 임시 파일의 offset 위치에 바로 씀
+#   → 요청 본문을 메모리에 모으지 않으므로 청크/파일 크기와 무관하게 메모리 사용량 일정
+#   다 쓴 청크만 UploadChunk로 기록 → 끊긴 뒤에는 받은 청크 목록을 보고 나머지만 다시 보냄
+#   청크마다 다른 위치에 쓰므로 여러 청크 / 여러 탭의 업로드를 동시에 받아도 됨
+# - 완료: 모든 청크를 받았으면 임시 파일을 저장소로 이동 (로컬 저장소는 rename, 복사 없음) → File 생성
+#   File이 생긴 뒤에 세션 삭제 (실패하면 임시 파일을 되돌려 두고 세션 유지 → 다시 완료 요청 가능)
+# - 오래된(FILES_UPLOAD_EXPIRE_HOURS) 미완료 업로드는 새 업로드를 시작할 때 정리
+# ========================================
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File as DjangoFile
+from django.db import transaction
+from django.utils import timezone
+
+from .models import File, UploadChunk, UploadSession
+
+UPLOAD_READ_SIZE = 64 * 1024
+
+
+class UploadError(ValueError):
+    pass
+
+
+class AssembledUpload(DjangoFile):
+    """
+    다 받은 임시 파일
+    temporary_file_path가 있으면 FileSystemStorage가 복사하지 않고 rename으로 옮김
+    (다른 저장소는 조각 단위로 읽어서 저장)
+    """
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def file_storage():
+    return File._meta.get_field('file').storage
+
+
+def temp_dir():
+    """임시 파일 디렉터리 (로컬 저장소면 같은 파일 시스템 안 → 완료 시 rename 가능)"""
+    name = settings.FILES_UPLOAD_TEMP_DIR
+    try:
+        return file_storage().path(name)
+    except NotImplementedError:
+        return os.path.join(settings.FILE_UPLOAD_TEMP_DIR or tempfile.gettempdir(), name)
+
+
+def temp_path(session):
+    return os.path.join(temp_dir(), f'{session.id}.part')
+
+
+def start_upload(team, user, filename, size):
+    """UploadSession과 임시 파일 생성 (잘못된 값이면 UploadError)"""
+    filename = os.path.basename(str(filename or '')).strip()
+    if not filename:
+        raise UploadError('파일 이름이 필요합니다.')
+    if len(filename) > File._meta.get_field('filename').max_length:
+        raise UploadError('파일 이름이 너무 깁니다.')
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        raise UploadError('size는 정수여야 합니다.')
+    max_size = settings.FILES_UPLOAD_MAX_SIZE
+    if not 0 <= size <= max_size:
+        raise UploadError(f'파일 크기는 {max_size // (1024 * 1024)}MB를 넘을 수 없습니다.')
+
+    purge_expired_uploads()
+    session = UploadSession.objects.create(
+        team=team, uploader=user, filename=filename, size=size, chunk_size=settings.FILES_UPLOAD_CHUNK_SIZE,
+    )
+    os.makedirs(temp_dir(), exist_ok=True)
+    # 크기만 잡아 둠 (sparse) → 청크는 도착 순서와 관계없이 제 위치에 씀
+    with open(temp_path(session), 'wb') as fh:
+        fh.truncate(size)
+    return session
+
+
+def received_chunks(session):
+    return list(session.chunks.order_by('index').values_list('index', flat=True))
+
+
+def upload_status(session):
+    return {
+        'upload_id': str(session.id),
+        'filename': session.filename,
+        'size': session.size,
+        'chunk_size': session.chunk_size,
+        'chunk_count': session.chunk_count,
+        'received': received_chunks(session),
+    }
+
+
+def write_chunk(session, offset, stream, content_length):
+    """
+    stream(요청 본문)을 임시 파일의 offset 위치에 씀 → 청크 번호
+    offset은 chunk_size의 배수, 본문 길이는 해당 청크 길이와 같아야 함
+    """
+    try:
+        offset, content_length = int(offset), int(content_length)
+    except (TypeError, ValueError):
+        raise UploadError('offset과 Content-Length가 필요합니다.')
+    index, remainder = divmod(offset, session.chunk_size)
+    if offset < 0 or remainder or index >= session.chunk_count:
+        raise UploadError(f'offset은 {session.chunk_size}의 배수이고 파일 크기보다 작아야 합니다.')
+    expected = session.chunk_length(index)
+    if content_length != expected:
+        raise UploadError(f'청크 크기가 맞지 않습니다. ({expected}바이트 필요)')
+
+    written = 0
+    with open(temp_path(session), 'r+b') as fh:
+        fh.seek(offset)
+        while written < expected:
+            piece = stream.read(min(UPLOAD_READ_SIZE, expected - written))
+            if not piece:
+                break
+            fh.write(piece)
+            written += len(piece)
+    if written != expected:
+        # 중간에 끊긴 청크는 기록하지 않음 → 다시 보내면 덮어씀
+        raise UploadError('청크를 끝까지 받지 못했습니다.')
+
+    UploadChunk.objects.bulk_create([UploadChunk(session=session, index=index)], ignore_conflicts=True)
+    return index
+
+
+def finish_upload(session):
+    """
+    모든 청크를 받았으면 임시 파일을 저장소로 옮기고 File 생성
+    빠진 청크가 있으면 UploadError, 다른 요청이 먼저 완료했으면 None
+    저장/File 생성이 실패하면 임시 파일을 되돌려 두므로 세션 그대로 다시 완료 요청 가능
+    """
+    missing = session.chunk_count - session.chunks.count()
+    if missing:
+        raise UploadError(f'아직 받지 못한 청크가 {missing}개 있습니다.')
+
+    # 임시 파일 이름을 먼저 바꾼 요청만 완료 처리 (완료 요청이 동시에 와도 File은 하나)
+    # 이후 도착한 청크는 임시 파일이 없어 거절됨
+    path = temp_path(session)
+    claimed_path = f'{path}.{uuid.uuid4().hex}.finishing'
+    try:
+        os.rename(path, claimed_path)
+    except FileNotFoundError:
+        return None
+
+    storage = file_storage()
+    name = None
+    try:
+        name = File._meta.get_field('file').generate_filename(None, session.filename)
+        with open(claimed_path, 'rb') as fh:
+            name = storage.save(name, AssembledUpload(fh))
+        # File이 생긴 뒤에만 세션 삭제
+        with transaction.atomic():
+            file_instance = File.objects.create(team_id=session.team_id, uploader_id=session.uploader_id,
+                                                file=name, filename=session.filename)
+            UploadSession.objects.filter(pk=session.pk).delete()
+    except BaseException:
+        _restore(storage, name, claimed_path, path)
+        raise
+    _remove(claimed_path)
+    return file_instance
+
+
+def _restore(storage, name, claimed_path, path):
+    """완료 실패 시 임시 파일을 원래 위치로 (저장소로 이미 옮겨졌으면 다시 가져옴)"""
+    if os.path.exists(claimed_path):
+        os.rename(claimed_path, path)
+        if name is not None and storage.exists(name):
+            storage.delete(name)
+    elif name is not None and storage.exists(name):
+        with storage.open(name, 'rb') as src, open(path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, UPLOAD_READ_SIZE)
+        storage.delete(name)
+
+
+def discard_upload(session):
+    path = temp_path(session)  # delete() 뒤에는 id가 None
+    session.delete()
+    _remove(path)
+
+
+def purge_expired_uploads():
+    expired = UploadSession.objects.filter(
+        created_at__lt=timezone.now() - timedelta(hours=settings.FILES_UPLOAD_EXPIRE_HOURS),
+    )
+    for session in expired:
+        discard_upload(session)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
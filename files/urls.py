@@ -3,6 +3,9 @@ from . import views
 
 urlpatterns = [
     path('teams/<int:team_id>/files/upload', views.file_upload_view, name='file_upload'),
+    path('teams/<int:team_id>/files/uploads', views.file_upload_start_view, name='file_upload_start'),
+    path('uploads/<uuid:upload_id>', views.file_upload_session_view, name='file_upload_session'),
+    path('uploads/<uuid:upload_id>/complete', views.file_upload_complete_view, name='file_upload_complete'),
     path('files/<int:file_id>/delete', views.file_delete_view, name='file_delete'),
     path('files/<int:file_id>/download/', views.file_download_view, name='file_download'),
     path('teams/<int:team_id>/files/download-all/', views.files_batch_download_view, name='files_batch_download'),
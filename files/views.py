@@ -1,13 +1,17 @@
-from django.http import JsonResponse, HttpResponse, Http404, HttpResponseForbidden
+import json
+from functools import partial
+
+from django.http import JsonResponse, Http404, HttpResponseForbidden, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.utils import timezone
 from django.views.decorators.http import require_http_methods
-from .models import File
+from .archives import stream_archive, team_archive
+from .downloads import attachment_header, file_download_response
+from .models import File, UploadSession
+from .uploads import UploadError, discard_upload, finish_upload, start_upload, upload_status, write_chunk
+from .zipstream import ZipEntry, iter_zip, unique_names
 from teams.models import Team
-from urllib.parse import quote
-import os
-import io
-import zipfile
 
 @login_required
 def file_list_view(request, team_id):
@@ -44,14 +48,79 @@ def file_upload_view(request, team_id):
         filename=uploaded_file.name
     )
 
-    data = {
+    return JsonResponse({"success": True, "data": _file_data(file_instance)})
+
+def _file_data(file_instance):
+    return {
         "id": file_instance.id,
         "filename": file_instance.filename,
         "url": file_instance.file.url,
         "uploader_name": file_instance.uploader.username,
         "uploaded_at": file_instance.uploaded_at.strftime('%Y-%m-%d %H:%M'),
     }
-    return JsonResponse({"success": True, "data": data})
+
+# ========================================
+# 청크(이어 올리기) 업로드 API (files/uploads.py)
+# 1. POST   /api/teams/<team_id>/files/uploads       {"filename", "size"} → upload_id, chunk_size, received
+# 2. PUT    /api/uploads/<upload_id>?offset=N         본문 = 해당 청크 바이트 (여러 청크 동시 전송 가능)
+#    GET    /api/uploads/<upload_id>                  받은 청크 목록 (끊긴 뒤 이어 올리기)
+#    DELETE /api/uploads/<upload_id>                  업로드 취소
+# 3. POST   /api/uploads/<upload_id>/complete         모든 청크를 받았으면 파일 생성
+# ========================================
+@login_required
+@require_http_methods(["POST"])
+def file_upload_start_view(request, team_id):
+    team = get_object_or_404(Team, id=team_id)
+    if not team.members.filter(id=request.user.id).exists():
+        return JsonResponse({"success": False, "error": "팀 멤버만 파일을 업로드할 수 있습니다."}, status=403)
+
+    try:
+        data = json.loads(request.body)
+        session = start_upload(team, request.user, data.get('filename'), data.get('size'))
+    except (ValueError, AttributeError) as e:
+        message = str(e) if isinstance(e, UploadError) else "잘못된 요청 형식입니다."
+        return JsonResponse({"success": False, "error": message}, status=400)
+    return JsonResponse({"success": True, "data": upload_status(session)}, status=201)
+
+@login_required
+@require_http_methods(["GET", "PUT", "DELETE"])
+def file_upload_session_view(request, upload_id):
+    # 업로드를 시작한 사람만 접근 가능 (다른 사용자에게는 존재 여부도 알리지 않음)
+    session = get_object_or_404(UploadSession, id=upload_id, uploader=request.user)
+
+    if request.method == 'GET':
+        return JsonResponse({"success": True, "data": upload_status(session)})
+
+    if request.method == 'DELETE':
+        discard_upload(session)
+        return JsonResponse({"success": True})
+
+    # 본문을 request.body로 읽지 않고 스트림에서 조각 단위로 임시 파일에 씀
+    try:
+        index = write_chunk(session, request.GET.get('offset'), request, request.META.get('CONTENT_LENGTH'))
+    except UploadError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    except FileNotFoundError:
+        # 완료/취소 처리 중이라 임시 파일이 이미 옮겨지거나 지워진 경우
+        return JsonResponse({"success": False, "error": "이미 완료되었거나 취소된 업로드입니다."}, status=409)
+    except OSError:
+        return JsonResponse({"success": False, "error": "청크를 저장하지 못했습니다. 다시 보내 주세요."}, status=503)
+    return JsonResponse({"success": True, "data": {"index": index}})
+
+@login_required
+@require_http_methods(["POST"])
+def file_upload_complete_view(request, upload_id):
+    session = get_object_or_404(UploadSession, id=upload_id, uploader=request.user)
+    if not session.team.members.filter(id=request.user.id).exists():
+        return JsonResponse({"success": False, "error": "팀 멤버만 파일을 업로드할 수 있습니다."}, status=403)
+
+    try:
+        file_instance = finish_upload(session)
+    except UploadError as e:
+        return JsonResponse({"success": False, "error": str(e), "data": upload_status(session)}, status=409)
+    if file_instance is None:
+        return JsonResponse({"success": False, "error": "이미 완료된 업로드입니다."}, status=409)
+    return JsonResponse({"success": True, "data": _file_data(file_instance)})
 
 @login_required
 @require_http_methods(["POST"]) # HTML form과의 호환성을 위해 POST 사용
@@ -78,33 +147,14 @@ def file_download_view(request, file_id):
     if not file_instance.team.members.filter(id=request.user.id).exists():
         return HttpResponseForbidden("파일을 다운로드할 권한이 없습니다.")
 
-    # 2. 파일 경로를 가져와 파일을 엽니다.
-    #    (로컬/클라우드 상관없이 file.path 또는 file.open()으로 동작)
+    # 2. 파일 내용을 메모리에 읽지 않고 스트리밍 (또는 설정에 따라 nginx 등 앞단 서버가 전송)
+    #    Range(이어받기) / If-Range / ETag 처리 포함
+    #    로컬/클라우드 저장소 모두 files/downloads.py에서 처리
     try:
-        # settings.DEFAULT_FILE_STORAGE에 따라 자동으로 올바른 저장소에서 파일을 엽니다.
-        file_path = file_instance.file.path
-        if os.path.exists(file_path):
-            with open(file_path, 'rb') as fh:
-                # 3. HttpResponse 객체에 파일 내용을 담아 반환합니다.
-                response = HttpResponse(fh.read(), content_type="application/octet-stream")
-                
-                # 4. 파일 이름을 UTF-8로 인코딩하여 헤더에 추가합니다.
-                filename_header = f'attachment; filename*=UTF-8\'\'{quote(file_instance.filename)}'
-                response['Content-Disposition'] = filename_header
-                
-                return response
-        raise FileNotFoundError
-    except (FileNotFoundError, AttributeError):
-        # 클라우드 스토리지 등 .path를 지원하지 않는 경우 .open() 사용
-        try:
-            with file_instance.file.open('rb') as fh:
-                response = HttpResponse(fh.read(), content_type="application/octet-stream")
-                filename_header = f'attachment; filename*=UTF-8\'\'{quote(file_instance.filename)}'
-                response['Content-Disposition'] = filename_header
-                return response
-        except Exception:
-            raise Http404("파일을 찾을 수 없거나 열 수 없습니다.")
-        
+        return file_download_response(request, file_instance.file, file_instance.filename)
+    except (OSError, ValueError):
+        raise Http404("파일을 찾을 수 없거나 열 수 없습니다.")
+
 @login_required
 def files_batch_download_view(request, team_id):
     """
@@ -114,21 +164,32 @@ def files_batch_download_view(request, team_id):
     if not team.members.filter(id=request.user.id).exists():
         return HttpResponseForbidden("파일을 다운로드할 권한이 없습니다.")
 
-    files = team.files.all()
+    files = list(team.files.order_by('uploaded_at', 'id'))
     if not files:
         raise Http404("다운로드할 파일이 없습니다.")
 
-    # 메모리 상에서 zip 파일을 생성합니다.
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, 'w') as zip_file:
-        for file_instance in files:
-            with file_instance.file.open('rb') as f:
-                # 각 파일을 zip 아카이브에 추가합니다.
-                zip_file.writestr(file_instance.filename, f.read())
-    
-    buffer.seek(0)
-    
-    # zip 파일을 HttpResponse로 반환합니다.
-    response = HttpResponse(buffer, content_type='application/zip')
-    response['Content-Disposition'] = f'attachment; filename="{team.name}_files.zip"'
-    return response
\ No newline at end of file
+    # 파일 구성이 그대로면 만들어 둔 ZIP을 정적 파일로 전송 (files/archives.py)
+    archive_name = f'{team.name}_files.zip'
+    archive = team_archive(team, files)
+    if archive is not None and archive.exists():
+        try:
+            return file_download_response(request, archive, archive_name, content_type='application/zip')
+        except OSError:
+            # 오래된 ZIP 정리로 방금 지워진 경우 → 아래에서 다시 만들면서 전송
+            pass
+
+    if archive is not None:
+        # 캐시가 없으면 ZIP을 만들면서 바로 전송하고 같은 바이트를 캐시 ZIP으로 저장 (보관된 항목은 다시 압축하지 않음)
+        chunks = stream_archive(archive)
+    else:
+        # 파일마다 조각 단위로 읽어 압축하면서 바로 전송 (ZIP 전체를 메모리에 만들지 않음, files/zipstream.py)
+        names = unique_names([file_instance.filename for file_instance in files])
+        entries = (
+            ZipEntry(name=name, open=partial(file_instance.file.open, 'rb'),
+                     modified=timezone.localtime(file_instance.uploaded_at))
+            for name, file_instance in zip(names, files)
+        )
+        chunks = iter_zip(entries)
+    response = StreamingHttpResponse(chunks, content_type='application/zip')
+    response['Content-Disposition'] = attachment_header(archive_name)
+    return response
@@ -0,0 +1,263 @@
+# files/zipstream.py
+
+# ========================================
+# 스트리밍 ZIP 생성기
+# - ZIP 전체를 메모리에 만들지 않고 항목(local header → 데이터 → data descriptor) 단위로 바로 출력
+#   CRC/압축 크기는 데이터를 다 보낸 뒤 data descriptor(flag bit 3)로 알려주므로 미리 읽을 필요 없음
+# - 각 파일은 CHUNK_SIZE 단위로 읽어서 압축 → 메모리 사용량은 아카이브 크기와 무관
+# - 이미 압축된 형식(zip, jpg, png, mp4, pdf 등)은 다시 압축하지 않고 그대로 저장(stored)
+# - 파일 이름은 UTF-8 플래그(bit 11)로 저장 (한글 이름), 4GB 이상 항목/아카이브는 ZIP64
+# - 크기/CRC를 이미 아는 항목(files/archives.py의 미리 압축해 둔 항목)은 local header에 바로 기록
+# ========================================
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+CHUNK_SIZE = 64 * 1024
+COMPRESS_LEVEL = 6
+
+STORED_EXTENSIONS = frozenset({
+    'zip', '7z', 'rar', 'gz', 'tgz', 'bz2', 'xz',
+    'jpg', 'jpeg', 'png', 'gif', 'webp', 'heic',
+    'mp3', 'm4a', 'aac', 'ogg', 'mp4', 'm4v', 'mov', 'avi', 'mkv', 'webm',
+    'pdf', 'docx', 'xlsx', 'pptx', 'hwpx',
+})
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP16_LIMIT = 0xFFFF
+FLAG_UTF8 = 0x800
+FLAGS = 0x08 | FLAG_UTF8  # data descriptor + UTF-8 이름
+VERSION = 20
+VERSION_ZIP64 = 45
+
+_LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+_CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+_DESCRIPTOR = struct.Struct('<IIII')
+_DESCRIPTOR64 = struct.Struct('<IIQQ')
+_END = struct.Struct('<IHHHHIIH')
+_ZIP64_END = struct.Struct('<IQHHIIQQQQ')
+_ZIP64_LOCATOR = struct.Struct('<IIQI')
+
+
+@dataclass
+class ZipEntry:
+    """아카이브에 넣을 파일 하나 (open: 바이너리 파일 객체를 여는 함수)"""
+    name: str
+    open: Callable
+    modified: datetime
+
+
+@dataclass
+class ZipMember:
+    """아카이브에 기록된 항목 하나 (central directory를 만들 때 사용)"""
+    name: bytes
+    method: int
+    dos_time: int
+    dos_date: int
+    crc: int
+    compressed_size: int
+    size: int
+    offset: int
+    zip64: bool
+    flags: int = FLAGS
+
+
+def should_store(name):
+    """다시 압축해도 거의 줄지 않는 형식인지 (확장자 기준)"""
+    return os.path.splitext(name)[1].lower().lstrip('.') in STORED_EXTENSIONS
+
+
+def dos_datetime(moment):
+    """datetime → (DOS 시간, DOS 날짜) (1980년 이전은 1980-01-01)"""
+    if moment.year < 1980:
+        return 0, (1 << 5) | 1
+    return (
+        (moment.hour << 11) | (moment.minute << 5) | (moment.second // 2),
+        ((moment.year - 1980) << 9) | (moment.month << 5) | moment.day,
+    )
+
+
+def unique_names(names):
+    """중복된 이름에 " (2)", " (3)" ... 을 붙임"""
+    seen, result = set(), []
+    for name in names:
+        candidate, number = name, 1
+        while candidate.lower() in seen:
+            number += 1
+            stem, ext = os.path.splitext(name)
+            candidate = f'{stem} ({number}){ext}'
+        seen.add(candidate.lower())
+        result.append(candidate)
+    return result
+
+
+def _needs_zip64(size):
+    # deflate는 압축되지 않는 데이터에서 약간 커질 수 있으므로 여유를 둠
+    return size + size // 1000 + 1024 >= ZIP64_LIMIT
+
+
+def _file_size(fh):
+    """열린 파일의 크기 (Django File은 .size, 그 외는 끝으로 이동해서 확인)"""
+    size = getattr(fh, 'size', None)
+    if size is None:
+        position = fh.tell()
+        size = fh.seek(0, os.SEEK_END)
+        fh.seek(position)
+    return size
+
+
+def read_chunks(fh):
+    while True:
+        chunk = fh.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def compress_chunks(chunks, method):
+    """
+    원본 조각 → 저장할 조각 (method가 ZIP_DEFLATED면 압축)
+    yield from의 결과로 (crc, 원본 크기, 압축 크기) 반환
+    """
+    crc, size, compressed_size = 0, 0, 0
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15) if method == ZIP_DEFLATED else None
+    for chunk in chunks:
+        crc = zlib.crc32(chunk, crc)
+        size += len(chunk)
+        if compressor:
+            chunk = compressor.compress(chunk)
+            if not chunk:
+                continue
+        compressed_size += len(chunk)
+        yield chunk
+    if compressor:
+        tail = compressor.flush()
+        compressed_size += len(tail)
+        yield tail
+    return crc, size, compressed_size
+
+
+def iter_entry(entry, offset, on_data=None):
+    """
+    항목 하나의 바이트 조각을 출력하고 마지막에 ZipMember를 반환 (yield from의 결과)
+    파일을 열 수 없으면 아무것도 출력하지 않고 None 반환 (아카이브에서 제외)
+    on_data: 헤더/descriptor를 뺀 저장 데이터 조각마다 호출 (files/archives.py의 항목 보관용)
+    """
+    try:
+        fh = entry.open()
+    except OSError:
+        return None
+
+    with fh:
+        name = entry.name.encode('utf-8')
+        method = ZIP_STORED if should_store(entry.name) else ZIP_DEFLATED
+        zip64 = _needs_zip64(_file_size(fh))
+        dos_time, dos_date = dos_datetime(entry.modified)
+
+        extra = struct.pack('<HHQQ', 0x0001, 16, 0, 0) if zip64 else b''
+        placeholder = ZIP64_LIMIT if zip64 else 0
+        yield _LOCAL_HEADER.pack(
+            0x04034B50, VERSION_ZIP64 if zip64 else VERSION, FLAGS, method, dos_time, dos_date,
+            0, placeholder, placeholder, len(name), len(extra),
+        ) + name + extra
+
+        pieces = compress_chunks(read_chunks(fh), method)
+        while True:
+            try:
+                chunk = next(pieces)
+            except StopIteration as done:
+                crc, size, compressed_size = done.value
+                break
+            if on_data is not None:
+                on_data(chunk)
+            yield chunk
+
+    if zip64:
+        yield _DESCRIPTOR64.pack(0x08074B50, crc, compressed_size, size)
+    else:
+        yield _DESCRIPTOR.pack(0x08074B50, crc, compressed_size, size)
+    return ZipMember(name, method, dos_time, dos_date, crc, compressed_size, size, offset, zip64)
+
+
+def known_member(name, method, modified, crc, compressed_size, size, offset):
+    """크기/CRC를 이미 아는 항목 (data descriptor 없이 local header에 기록)"""
+    dos_time, dos_date = dos_datetime(modified)
+    zip64 = compressed_size >= ZIP64_LIMIT or size >= ZIP64_LIMIT
+    return ZipMember(name.encode('utf-8'), method, dos_time, dos_date, crc, compressed_size, size,
+                     offset, zip64, flags=FLAG_UTF8)
+
+
+def local_header(member):
+    """known_member의 local header (이 뒤에 저장된 데이터를 그대로 이어 씀)"""
+    extra = b''
+    compressed_size, size = member.compressed_size, member.size
+    if member.zip64:
+        extra = struct.pack('<HHQQ', 0x0001, 16, size, compressed_size)
+        compressed_size = size = ZIP64_LIMIT
+    return _LOCAL_HEADER.pack(
+        0x04034B50, VERSION_ZIP64 if member.zip64 else VERSION, member.flags, member.method,
+        member.dos_time, member.dos_date, member.crc, compressed_size, size, len(member.name), len(extra),
+    ) + member.name + extra
+
+
+def _central_record(written):
+    zip64_values = []
+    size, compressed_size, offset = written.size, written.compressed_size, written.offset
+    if size >= ZIP64_LIMIT:
+        zip64_values.append(size)
+        size = ZIP64_LIMIT
+    if compressed_size >= ZIP64_LIMIT:
+        zip64_values.append(compressed_size)
+        compressed_size = ZIP64_LIMIT
+    if offset >= ZIP64_LIMIT:
+        zip64_values.append(offset)
+        offset = ZIP64_LIMIT
+    extra = b''
+    if zip64_values:
+        extra = struct.pack(f'<HH{len(zip64_values)}Q', 0x0001, 8 * len(zip64_values), *zip64_values)
+    version = VERSION_ZIP64 if written.zip64 or zip64_values else VERSION
+    return _CENTRAL_HEADER.pack(
+        0x02014B50, version, version, written.flags, written.method, written.dos_time, written.dos_date,
+        written.crc, compressed_size, size, len(written.name), len(extra), 0, 0, 0, 0, offset,
+    ) + written.name + extra
+
+
+def iter_zip(entries):
+    """ZipEntry 이터러블 → ZIP 파일 바이트 조각"""
+    position, written = 0, []
+    for entry in entries:
+        chunks = iter_entry(entry, position)
+        while True:
+            try:
+                chunk = next(chunks)
+            except StopIteration as done:
+                if done.value is not None:
+                    written.append(done.value)
+                break
+            position += len(chunk)
+            yield chunk
+    yield from central_directory(written, position)
+
+
+def central_directory(written, central_offset):
+    """ZipMember 목록 → central directory + 끝 레코드 조각 (central_offset: 항목 데이터가 끝난 위치)"""
+    central = b''.join(_central_record(item) for item in written)
+    yield central
+
+    count, central_size = len(written), len(central)
+    if count >= ZIP16_LIMIT or central_offset >= ZIP64_LIMIT or central_size >= ZIP64_LIMIT:
+        zip64_end_offset = central_offset + central_size
+        yield _ZIP64_END.pack(
+            0x06064B50, _ZIP64_END.size - 12, VERSION_ZIP64, VERSION_ZIP64, 0, 0,
+            count, count, central_size, central_offset,
+        )
+        yield _ZIP64_LOCATOR.pack(0x07064B50, 0, zip64_end_offset, 1)
+        count = min(count, ZIP16_LIMIT)
+        central_size = min(central_size, ZIP64_LIMIT)
+        central_offset = min(central_offset, ZIP64_LIMIT)
+    yield _END.pack(0x06054B50, 0, 0, count, count, central_size, central_offset, 0)
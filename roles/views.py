@@ -10,6 +10,7 @@ from django.contrib.auth.models import User
 import json
 from .models import Role, MemberRoleAssignment
 from teams.models import Team, TeamMember
+from teams.versioning import team_etag
 from users.models import Profile
 from .clova_ai import call_clova_recommendation, make_prompt
 import logging
@@ -56,6 +57,7 @@ def roles_page(request, team_id):
 # 역할 목록 조회 API
 @login_required
 @require_http_methods(["GET"])
+@team_etag
 def roles_list_api(request, team_id):
     team = get_object_or_404(Team, id=team_id)
     roles = Role.objects.filter(team=team).values('id', 'name', 'description', 'is_ai_generated')
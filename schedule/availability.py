@@ -0,0 +1,243 @@
+# schedule/availability.py
+
+# ========================================
+# 일정 조율(When2Meet) 가능 시간 비트마스크
+# - 요일마다 정수 하나: 30분 칸 하나당 1비트 (비트 i = i * 30분, "0000" → 0, "0930" → 19, "2400" → 48)
+# - 투표(Vote)는 available_slots(JSON)와 함께 요일별 마스크(day_masks)를 저장
+# - 집계는 비트 단위 카운터(bit-sliced counter)로 처리
+#   planes[k]의 비트 i = i번째 칸 투표 수의 k번째 비트 → 투표자 한 명 추가 = 정수 연산 몇 번 (칸 수와 무관)
+# ========================================
+DAYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+SLOT_MINUTES = 30
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES + 1  # 예전 그리드의 24:00 행까지 포함
+DAY_SLOTS = 24 * 60 // SLOT_MINUTES  # 실제 하루 (00:00 ~ 23:30 시작 칸), 연속 구간 검색 범위
+EMPTY_MASKS = (0,) * len(DAYS)
+
+
+def slot_index(label):
+    """"HHMM" → 칸 번호 (잘못된 값이면 None)"""
+    if not isinstance(label, str) or len(label) != 4 or not label.isdigit():
+        return None
+    minutes = int(label[:2]) * 60 + int(label[2:])
+    if minutes % SLOT_MINUTES or int(label[2:]) >= 60:
+        return None
+    index = minutes // SLOT_MINUTES
+    return index if index < SLOTS_PER_DAY else None
+
+
+def slot_label(index):
+    """칸 번호 → "HHMM" """
+    minutes = index * SLOT_MINUTES
+    return f'{minutes // 60:02d}{minutes % 60:02d}'
+
+
+def iter_bits(mask):
+    """마스크에서 켜진 비트 번호를 작은 것부터"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def slots_to_masks(available_slots):
+    """{"mon": ["0900", "0930"], ...} → 요일별 마스크 리스트 (알 수 없는 요일/칸은 무시)"""
+    masks = [0] * len(DAYS)
+    if not isinstance(available_slots, dict):
+        return masks
+    for day_index, day in enumerate(DAYS):
+        slots = available_slots.get(day)
+        if not isinstance(slots, list):
+            continue
+        for label in slots:
+            index = slot_index(label)
+            if index is not None:
+                masks[day_index] |= 1 << index
+    return masks
+
+
+def masks_to_slots(masks):
+    """요일별 마스크 → {"mon": ["0900", ...]} (비어 있는 요일은 생략)"""
+    return {
+        day: [slot_label(index) for index in iter_bits(mask)]
+        for day, mask in zip(DAYS, masks) if mask
+    }
+
+
+def mask_changes(old_masks, new_masks):
+    """투표 한 명의 선택 변경 → (새로 선택한 칸, 선택 해제한 칸) 각각 {요일 번호: [칸 번호, ...]}"""
+    added, removed = {}, {}
+    for day, (old, new) in enumerate(zip(old_masks or EMPTY_MASKS, new_masks or EMPTY_MASKS)):
+        if new & ~old:
+            added[day] = list(iter_bits(new & ~old))
+        if old & ~new:
+            removed[day] = list(iter_bits(old & ~new))
+    return added, removed
+
+
+class AvailabilityTally:
+    """
+    요일별 비트 단위 카운터
+    add(masks)로 투표자를 더하고, counts / max_count / masks_with_count로 칸별 투표 수와 최다 칸을 구함
+    """
+
+    def __init__(self):
+        self.planes = [[] for _ in DAYS]
+        self.voters = 0
+
+    def add(self, masks):
+        self.voters += 1
+        for planes, mask in zip(self.planes, masks):
+            # 칸마다 1비트 덧셈을 동시에 (ripple carry)
+            carry = mask
+            for k in range(len(planes)):
+                if not carry:
+                    break
+                planes[k], carry = planes[k] ^ carry, planes[k] & carry
+            if carry:
+                planes.append(carry)
+
+    def count(self, day_index, slot):
+        return sum(((plane >> slot) & 1) << k for k, plane in enumerate(self.planes[day_index]))
+
+    def counts(self, day_index):
+        """해당 요일에서 투표가 있는 칸 → 투표 수"""
+        planes = self.planes[day_index]
+        occupied = 0
+        for plane in planes:
+            occupied |= plane
+        return {slot: self.count(day_index, slot) for slot in iter_bits(occupied)}
+
+    def max_count(self):
+        """전체 요일 중 가장 많은 투표 수"""
+        best = 0
+        for planes in self.planes:
+            # 상위 비트부터 켜진 칸을 좁혀가며 최댓값 계산
+            candidates, value = -1, 0
+            for k in range(len(planes) - 1, -1, -1):
+                narrowed = candidates & planes[k]
+                if narrowed:
+                    candidates, value = narrowed, value | (1 << k)
+            best = max(best, value)
+        return best
+
+    def masks_with_count(self, target):
+        """요일별로 투표 수가 정확히 target인 칸 마스크"""
+        result = []
+        for planes in self.planes:
+            if target >> len(planes):
+                result.append(0)
+                continue
+            match = (1 << SLOTS_PER_DAY) - 1
+            for k, plane in enumerate(planes):
+                match &= plane if (target >> k) & 1 else ~plane
+            result.append(match)
+        return result
+
+
+# 응답 키("mon-0900") 미리 만들어 둠
+_SLOT_KEYS = [[f'{day}-{slot_label(index)}' for index in range(SLOTS_PER_DAY)] for day in DAYS]
+
+
+def free_users(voters):
+    """
+    voters: [(username, day_masks)] → {"mon-0900": [가능한 사람, ...]} (가능한 사람이 있는 칸만)
+    요일마다 투표가 있는 칸만 돌면서 비트 AND로 확인
+    """
+    voters = list(voters)
+    users_by_slot = {}
+    for day_index, keys in enumerate(_SLOT_KEYS):
+        day_voters = [(username, masks[day_index]) for username, masks in voters if masks[day_index]]
+        occupied = 0
+        for _, mask in day_voters:
+            occupied |= mask
+        for index in iter_bits(occupied):
+            bit = 1 << index
+            users_by_slot[keys[index]] = [username for username, mask in day_voters if mask & bit]
+    return users_by_slot
+
+
+def slot_key(day_index, slot):
+    return _SLOT_KEYS[day_index][slot]
+
+
+def availability_summary(voters):
+    """
+    voters: [(username, day_masks)] → (availability, best_slots)
+    availability: {"mon-0900": {"count": n, "users": [...]}} (투표가 있는 칸만)
+    best_slots: 투표 수가 가장 많은 칸 키 목록
+    """
+    voters = list(voters)
+    tally = AvailabilityTally()
+    for _, masks in voters:
+        tally.add(masks)
+
+    availability = {
+        key: {'count': len(users), 'users': users}
+        for key, users in free_users(voters).items()
+    }
+
+    best_slots = []
+    max_votes = tally.max_count()
+    if max_votes > 0:
+        for keys, mask in zip(_SLOT_KEYS, tally.masks_with_count(max_votes)):
+            best_slots.extend(keys[index] for index in iter_bits(mask))
+    return availability, best_slots
+
+
+# ========================================
+# 연속 회의 구간 검색
+# - 투표자별로 "length칸 연속으로 가능한 구간의 시작 칸" 마스크를 시프트-AND로 계산
+#   (구간 길이를 두 배씩 늘려가므로 투표자·요일마다 정수 연산 O(log length)번, 칸 수와 무관)
+# - 그 마스크들을 AvailabilityTally로 더하면 시작 칸별 "구간 전체에 참석 가능한 인원"이 나옴
+# - 인원 많은 순 → 요일/시각 빠른 순으로 정렬하고, 같은 요일에서 이미 고른 구간과 겹치는 구간은 제외
+# ========================================
+def window_starts(mask, length):
+    """mask에서 length칸 연속으로 켜진 구간의 시작 칸 마스크"""
+    result, covered = mask, 1
+    while covered < length:
+        step = min(covered, length - covered)
+        result &= result >> step
+        covered += step
+    return result
+
+
+def find_meeting_windows(voters, length, min_attendance=1, top=5):
+    """
+    voters: [(username, day_masks)], length: 구간 길이(칸 수)
+    → [{"day", "start", "end", "attendance", "users"}] 최대 top개 (참석 가능 인원 min_attendance 이상)
+    """
+    if not 1 <= length <= DAY_SLOTS:
+        return []
+    start_limit = (1 << (DAY_SLOTS - length + 1)) - 1  # 구간이 24:00을 넘지 않는 시작 칸
+
+    tally = AvailabilityTally()
+    starts_by_voter = []
+    for username, masks in voters:
+        starts = [window_starts(mask, length) & start_limit for mask in masks]
+        tally.add(starts)
+        starts_by_voter.append((username, starts))
+
+    candidates = sorted(
+        (-count, day, slot)
+        for day in range(len(DAYS))
+        for slot, count in tally.counts(day).items()
+        if count >= max(min_attendance, 1)
+    )
+
+    windows, taken = [], [0] * len(DAYS)
+    window_bits = (1 << length) - 1
+    for negative_count, day, slot in candidates:
+        bits = window_bits << slot
+        if taken[day] & bits:
+            continue
+        taken[day] |= bits
+        windows.append({
+            'day': DAYS[day],
+            'start': slot_label(slot),
+            'end': slot_label(slot + length),
+            'attendance': -negative_count,
+            'users': [username for username, starts in starts_by_voter if (starts[day] >> slot) & 1],
+        })
+        if len(windows) >= top:
+            break
+    return windows
@@ -0,0 +1,36 @@
+import json
+
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncWebsocketConsumer
+
+from teams.models import TeamMember
+from .realtime import poll_group_name
+
+
+class SchedulePollConsumer(AsyncWebsocketConsumer):
+    """
+    일정 조율 칸별 투표 수 변경을 팀원에게 실시간으로 전달 (서버 → 클라이언트 단방향)
+    메시지 형식은 schedule/realtime.py 참고
+    """
+
+    async def connect(self):
+        self.team_id = self.scope['url_route']['kwargs']['team_id']
+        self.group_name = poll_group_name(self.team_id)
+        self.user = self.scope['user']
+
+        if not self.user.is_authenticated or not await self.is_team_member():
+            await self.close()
+            return
+
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, close_code):
+        await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    @database_sync_to_async
+    def is_team_member(self):
+        return TeamMember.objects.filter(team_id=self.team_id, user=self.user).exists()
+
+    async def slot_counts_update(self, event):
+        await self.send(text_data=json.dumps(event))
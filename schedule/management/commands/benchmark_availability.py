@@ -0,0 +1,86 @@
+# ========================================
+# 일정 조율 집계 속도 비교 (기존 dict 집계 vs 비트마스크 집계)
+# 사용법:
+#   python manage.py benchmark_availability                          # 투표자 50명 × 7일 × 48칸
+#   python manage.py benchmark_availability --voters 200 --density 0.3
+# DB 없이 메모리에서 같은 투표 데이터로 두 방식의 처리 시간(최솟값)을 비교
+# ========================================
+import random
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from schedule.availability import DAYS, AvailabilityTally, availability_summary, slot_label, slots_to_masks
+
+
+def dict_summary(votes):
+    """기존 schedule_mediate_view의 집계 방식"""
+    availability_data = defaultdict(lambda: {'count': 0, 'users': []})
+    for username, available_slots in votes:
+        for day, slots in available_slots.items():
+            for slot in slots:
+                slot_key = f"{day}-{slot}"
+                availability_data[slot_key]['count'] += 1
+                availability_data[slot_key]['users'].append(username)
+
+    best_slots = []
+    if availability_data:
+        max_votes = max((data['count'] for data in availability_data.values()), default=0)
+        if max_votes > 0:
+            best_slots = [slot for slot, data in availability_data.items() if data['count'] == max_votes]
+    return availability_data, best_slots
+
+
+class Command(BaseCommand):
+    help = '일정 조율 가능 시간 집계(dict / 비트마스크)의 처리 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--voters', type=int, default=50, help='투표자 수')
+        parser.add_argument('--slots', type=int, default=48, help='요일별 칸 수 (30분 단위)')
+        parser.add_argument('--density', type=float, default=0.5, help='칸마다 가능으로 표시할 확률')
+        parser.add_argument('--repeat', type=int, default=20, help='반복 횟수 (최솟값 사용)')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        labels = [slot_label(i) for i in range(options['slots'])]
+        votes = [
+            (f'user{v}', {day: [label for label in labels if rng.random() < options['density']] for day in DAYS})
+            for v in range(options['voters'])
+        ]
+        # 비트마스크는 투표 저장 시 계산해 두므로 측정에서 제외
+        masked = [(username, slots_to_masks(slots)) for username, slots in votes]
+
+        paths = [
+            ('dict 집계', lambda: dict_summary(votes)),
+            ('비트마스크 집계', lambda: availability_summary(masked)),
+            ('비트마스크 최다 칸만', lambda: self.best_only(masked)),
+        ]
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"투표자 {options['voters']}명 × {len(DAYS)}일 × {options['slots']}칸 (가능 비율 {options['density']:.0%})"
+        ))
+        timings, results = [], []
+        for name, run in paths:
+            best = None
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                result = run()
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            timings.append(best)
+            results.append(result)
+            speedup = f'  ({timings[0] / best:.1f}배)'
+            self.stdout.write(f'  {name:<16}{best * 1000:>9.2f} ms{speedup}')
+
+        expected_availability, expected_best = results[0]
+        availability, best_slots = results[1]
+        if dict(expected_availability) != availability or sorted(expected_best) != sorted(best_slots):
+            self.stdout.write(self.style.ERROR('  ! 두 방식의 결과가 다릅니다.'))
+
+    def best_only(self, masked):
+        """사용자 목록 없이 칸별 투표 수 / 최다 칸만 필요한 경우 (비트 카운터만 사용)"""
+        tally = AvailabilityTally()
+        for _, masks in masked:
+            tally.add(masks)
+        return tally.masks_with_count(tally.max_count())
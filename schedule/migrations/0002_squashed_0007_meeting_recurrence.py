@@ -0,0 +1,173 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:30
+# 0002 ~ 0007 합침: 중간에 추가했다가 지운 회의 인덱스(team+start_time, team+end_time+start_time) 없이
+# 범위 조회용 meeting_team_series_end_idx만 추가
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+# 마이그레이션 작성 시점의 변환 규칙을 그대로 고정 (schedule.availability가 바뀌어도 결과가 같도록)
+DAYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+SLOT_MINUTES = 30
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES + 1
+
+
+def slot_index(label):
+    """"HHMM" → 칸 번호 (잘못된 값이면 None)"""
+    if not isinstance(label, str) or len(label) != 4 or not label.isdigit():
+        return None
+    minutes = int(label[:2]) * 60 + int(label[2:])
+    if minutes % SLOT_MINUTES or int(label[2:]) >= 60:
+        return None
+    index = minutes // SLOT_MINUTES
+    return index if index < SLOTS_PER_DAY else None
+
+
+def slots_to_masks(available_slots):
+    """{"mon": ["0900", "0930"], ...} → 요일별 마스크 리스트 (알 수 없는 요일/칸은 무시)"""
+    masks = [0] * len(DAYS)
+    if not isinstance(available_slots, dict):
+        return masks
+    for day_index, day in enumerate(DAYS):
+        slots = available_slots.get(day)
+        if not isinstance(slots, list):
+            continue
+        for label in slots:
+            index = slot_index(label)
+            if index is not None:
+                masks[day_index] |= 1 << index
+    return masks
+
+
+def backfill_day_masks(apps, schema_editor):
+    """기존 투표의 available_slots를 요일별 비트마스크로 변환"""
+    Vote = apps.get_model('schedule', 'Vote')
+    votes = list(Vote.objects.only('id', 'available_slots'))
+    for vote in votes:
+        vote.day_masks = slots_to_masks(vote.available_slots)
+    Vote.objects.bulk_update(votes, ['day_masks'], batch_size=1000)
+
+
+def backfill_slot_counts(apps, schema_editor):
+    """기존 투표의 day_masks(요일 7개의 정수, 비트 i = i번째 30분 칸)로 칸별 투표 수 계산"""
+    Vote = apps.get_model('schedule', 'Vote')
+    PollSlotCount = apps.get_model('schedule', 'PollSlotCount')
+
+    counts = {}
+    for poll_id, masks in Vote.objects.values_list('poll_id', 'day_masks'):
+        for day, mask in enumerate((masks or [])[:7]):
+            slot = 0
+            while mask:
+                if mask & 1:
+                    key = (poll_id, day, slot)
+                    counts[key] = counts.get(key, 0) + 1
+                mask >>= 1
+                slot += 1
+    PollSlotCount.objects.bulk_create([
+        PollSlotCount(poll_id=poll_id, day=day, slot=slot, count=count)
+        for (poll_id, day, slot), count in counts.items()
+    ], batch_size=1000)
+
+
+def backfill_series_end(apps, schema_editor):
+    """기존 회의는 모두 한 번짜리이므로 series_end = end_time"""
+    Meeting = apps.get_model('schedule', 'Meeting')
+    Meeting.objects.update(series_end=F('end_time'))
+
+
+class Migration(migrations.Migration):
+
+    replaces = [
+        ('schedule', '0002_meeting_meeting_team_start_idx'),
+        ('schedule', '0003_meeting_meeting_team_end_idx'),
+        ('schedule', '0004_vote_day_masks'),
+        ('schedule', '0005_pollslotcount'),
+        ('schedule', '0006_meeting_recurrence'),
+        ('schedule', '0007_remove_meeting_team_start_idx'),
+    ]
+
+    dependencies = [
+        ('schedule', '0001_initial'),
+        ('teams', '0003_team_ai_roles_assigned'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vote',
+            name='day_masks',
+            field=models.JSONField(default=list),
+        ),
+        migrations.RunPython(backfill_day_masks, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='PollSlotCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.PositiveSmallIntegerField()),
+                ('slot', models.PositiveSmallIntegerField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('poll', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='slot_counts', to='schedule.schedulepoll')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['poll', 'count'], name='pollslot_poll_count_idx')],
+                'unique_together': {('poll', 'day', 'slot')},
+            },
+        ),
+        migrations.RunPython(backfill_slot_counts, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='MeetingException',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_start', models.DateTimeField()),
+                ('is_cancelled', models.BooleanField(default=False)),
+                ('title', models.CharField(blank=True, max_length=200)),
+                ('start_time', models.DateTimeField(blank=True, null=True)),
+                ('end_time', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='recurrence_count',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='recurrence_days',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='recurrence_freq',
+            field=models.CharField(blank=True, choices=[('daily', '매일'), ('weekly', '매주')], default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='recurrence_interval',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='recurrence_until',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='series_end',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_series_end, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['team', 'series_end', 'start_time'], name='meeting_team_series_end_idx'),
+        ),
+        migrations.AddField(
+            model_name='meetingexception',
+            name='meeting',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exceptions', to='schedule.meeting'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='meetingexception',
+            unique_together={('meeting', 'original_start')},
+        ),
+    ]
@@ -1,18 +1,81 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.utils import timezone
 from teams.models import Team
+from .availability import DAYS, EMPTY_MASKS, AvailabilityTally, mask_changes, slot_label, slots_to_masks
+from .realtime import broadcast_slot_changes
+from .recurrence import FREQ_CHOICES, FREQ_WEEKLY, RecurrenceRule
 
 class Meeting(models.Model):
-    """FullCalendar에 표시될 회의 일정 모델"""
+    """
+    FullCalendar에 표시될 회의 일정 모델
+    반복 회의는 첫 회차(start_time ~ end_time)와 반복 규칙만 저장하고, 회차는 조회 범위 안에서만 계산
+    (schedule/recurrence.py)
+    """
     team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='meetings')
     title = models.CharField(max_length=200)
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
 
+    # 반복 규칙 (recurrence_freq가 비어 있으면 한 번만)
+    recurrence_freq = models.CharField(max_length=10, choices=FREQ_CHOICES, blank=True, default='')
+    recurrence_interval = models.PositiveSmallIntegerField(default=1)
+    # 매주 반복 요일 비트마스크 (비트 0 = 월 ~ 6 = 일, availability.DAYS 순서)
+    recurrence_days = models.PositiveSmallIntegerField(default=0)
+    recurrence_until = models.DateField(null=True, blank=True)  # 마지막 회차 날짜 (현지 날짜, 포함)
+    recurrence_count = models.PositiveIntegerField(null=True, blank=True)  # 전체 회차 수
+    # 마지막 회차 종료 시각 (반복 없으면 end_time, 끝없이 반복하면 NULL) - 범위 조회용
+    series_end = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # 캘린더 보이는 범위와 겹치는 회의/반복 회의 (series_end > start AND start_time < end)
+            models.Index(fields=['team', 'series_end', 'start_time'], name='meeting_team_series_end_idx'),
+        ]
+
     def __str__(self):
         return f"[{self.team.name}] {self.title}"
 
+    @property
+    def is_recurring(self):
+        return bool(self.recurrence_freq)
+
+    @property
+    def rule(self):
+        return RecurrenceRule(self)
+
+    def update_series_end(self):
+        """반복 규칙으로 recurrence_days / series_end 맞춤 (save()가 호출, bulk_create 전에는 직접 호출)"""
+        if self.is_recurring:
+            if self.recurrence_freq == FREQ_WEEKLY:
+                # 첫 회차 요일은 항상 반복 요일에 포함
+                self.recurrence_days |= 1 << timezone.localtime(self.start_time).weekday()
+            self.series_end = self.rule.series_end()
+        else:
+            self.series_end = self.end_time
+
+    def save(self, *args, **kwargs):
+        self.update_series_end()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'recurrence_days', 'series_end'}
+        super().save(*args, **kwargs)
+
+
+class MeetingException(models.Model):
+    """반복 회의의 특정 회차 취소/변경 (original_start: 규칙상 원래 회차 시작 시각)"""
+    meeting = models.ForeignKey(Meeting, on_delete=models.CASCADE, related_name='exceptions')
+    original_start = models.DateTimeField()
+    is_cancelled = models.BooleanField(default=False)
+    # 변경된 회차 (취소가 아니면 항상 채움, 제목은 비어 있으면 회의 제목)
+    title = models.CharField(max_length=200, blank=True)
+    start_time = models.DateTimeField(null=True, blank=True)
+    end_time = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ('meeting', 'original_start')
+
 class SchedulePoll(models.Model):
     """'일정 조율' 자체를 나타내는 모델"""
     team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='schedule_polls')
@@ -27,6 +90,92 @@ class Vote(models.Model):
     # 사용자가 선택한 시간 슬롯을 JSON 형태로 저장
     # 예: {"mon": ["0900", "0930"], "tue": ["1400"]}
     available_slots = models.JSONField(default=dict)
+    # available_slots를 요일별 비트마스크로 변환한 값 (schedule/availability.py, 집계용)
+    # 예: [mask_mon, mask_tue, ..., mask_sun], 비트 i = i * 30분 칸
+    day_masks = models.JSONField(default=list)
 
     class Meta:
-        unique_together = ('poll', 'voter')
\ No newline at end of file
+        unique_together = ('poll', 'voter')
+
+    def save(self, *args, **kwargs):
+        self.day_masks = slots_to_masks(self.available_slots)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'available_slots' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'day_masks'}
+
+        # 이전 선택과 비교해서 칸별 투표 수(PollSlotCount)를 같은 트랜잭션에서 +1/-1
+        with transaction.atomic():
+            old_masks = None
+            if self.pk:
+                old_masks = (
+                    Vote.objects.select_for_update().filter(pk=self.pk)
+                    .values_list('day_masks', flat=True).first()
+                )
+            super().save(*args, **kwargs)
+            added, removed = PollSlotCount.apply_change(self.poll_id, old_masks, self.day_masks)
+            # 커밋된 뒤에 팀원들에게 바뀐 칸만 전송 (schedule/realtime.py)
+            if added or removed:
+                team_id, poll_id, username = self.poll.team_id, self.poll_id, self.voter.username
+                transaction.on_commit(
+                    lambda: broadcast_slot_changes(team_id, poll_id, username, added, removed)
+                )
+
+
+class PollSlotCount(models.Model):
+    """
+    일정 조율 칸별 투표 수 (투표 저장/삭제 시 바뀐 칸만 증감)
+    조회 시 투표 전체를 다시 집계하지 않고 이 테이블의 값과 최댓값을 바로 사용
+    """
+    poll = models.ForeignKey(SchedulePoll, on_delete=models.CASCADE, related_name='slot_counts')
+    day = models.PositiveSmallIntegerField()   # 0=월 ~ 6=일 (availability.DAYS 순서)
+    slot = models.PositiveSmallIntegerField()  # 30분 칸 번호 (availability.slot_index)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('poll', 'day', 'slot')
+        indexes = [
+            # 최다 투표 칸 조회
+            models.Index(fields=['poll', 'count'], name='pollslot_poll_count_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.poll_id} {DAYS[self.day]}-{slot_label(self.slot)}: {self.count}"
+
+    @staticmethod
+    def _slots_q(slots_by_day):
+        condition = models.Q(pk__in=[])
+        for day, slots in slots_by_day.items():
+            condition |= models.Q(day=day, slot__in=slots)
+        return condition
+
+    @classmethod
+    def apply_change(cls, poll_id, old_masks, new_masks):
+        """
+        투표 한 명의 선택이 old_masks → new_masks로 바뀐 만큼 증감 (없으면 None)
+        반환: (added, removed) - 증가/감소한 칸 {요일 번호: [칸 번호, ...]} (실시간 알림용)
+        """
+        added, removed = mask_changes(old_masks, new_masks)
+
+        slot_counts = cls.objects.filter(poll_id=poll_id)
+        if added:
+            # 동시에 같은 칸이 처음 선택되어도 충돌하지 않도록 행을 먼저 만들고 증가
+            cls.objects.bulk_create([
+                cls(poll_id=poll_id, day=day, slot=slot, count=0)
+                for day, slots in added.items() for slot in slots
+            ], ignore_conflicts=True)
+            slot_counts.filter(cls._slots_q(added)).update(count=models.F('count') + 1)
+        if removed:
+            slot_counts.filter(cls._slots_q(removed)).update(count=models.F('count') - 1)
+        return added, removed
+
+    @classmethod
+    def rebuild(cls, poll_id):
+        """투표 전체로 다시 계산 (데이터 이전 / 불일치 복구용)"""
+        tally = AvailabilityTally()
+        for masks in Vote.objects.filter(poll_id=poll_id).values_list('day_masks', flat=True):
+            tally.add(masks or EMPTY_MASKS)
+        cls.objects.filter(poll_id=poll_id).delete()
+        cls.objects.bulk_create([
+            cls(poll_id=poll_id, day=day, slot=slot, count=count)
+            for day in range(len(DAYS)) for slot, count in tally.counts(day).items()
+        ])
\ No newline at end of file
@@ -0,0 +1,42 @@
+# schedule/realtime.py
+
+# ========================================
+# 일정 조율 실시간 알림 (Channels)
+# - 투표가 저장/삭제되면 팀 그룹(schedule_poll_team_<id>)에 바뀐 칸만 전송
+#   {"type": "slot_counts_update", "poll_id", "voter", "added": ["mon-0900", ...], "removed": [...]}
+#   → 클라이언트는 added 칸 +1, removed 칸 -1 (mediate 전체를 다시 받지 않음)
+# - 채널 레이어(Redis)에 연결할 수 없어도 투표 저장은 실패하지 않음 (클라이언트는 다음 조회 때 반영)
+# ========================================
+import logging
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+from .availability import slot_key
+
+logger = logging.getLogger(__name__)
+
+
+def poll_group_name(team_id):
+    return f'schedule_poll_team_{team_id}'
+
+
+def _slot_keys(slots_by_day):
+    return [slot_key(day, slot) for day, slots in sorted(slots_by_day.items()) for slot in slots]
+
+
+def broadcast_slot_changes(team_id, poll_id, voter, added, removed):
+    """added/removed: {요일 번호: [칸 번호, ...]} (PollSlotCount.apply_change 반환값)"""
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    try:
+        async_to_sync(channel_layer.group_send)(poll_group_name(team_id), {
+            'type': 'slot_counts_update',
+            'poll_id': poll_id,
+            'voter': voter,
+            'added': _slot_keys(added),
+            'removed': _slot_keys(removed),
+        })
+    except Exception:
+        logger.warning('일정 조율 실시간 알림 전송 실패 (team=%s)', team_id, exc_info=True)
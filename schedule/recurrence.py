@@ -0,0 +1,176 @@
+# schedule/recurrence.py
+
+# ========================================
+# 반복 회의 규칙 (RRULE 일부: FREQ=DAILY/WEEKLY, INTERVAL, BYDAY, UNTIL, COUNT)
+# - 반복 회의는 Meeting 한 행(첫 회차 시각 + 규칙)과 예외(MeetingException) 행만 저장
+#   → 저장 공간은 회차 수와 무관 (시리즈 수 + 예외 수)
+# - 회차는 주기(period) 단위로 계산: 매일 = interval일, 매주 = 7 * interval일
+#   주기 안의 회차 위치(offsets) = 주 시작(월요일)부터의 요일 번호 (매일은 [0])
+#   → n번째 회차 날짜와 어떤 날짜의 회차 번호를 바로 계산할 수 있으므로
+#     보이는 범위의 첫 주기로 건너뛰어 범위 안 회차만 만듦 (시리즈 길이와 무관)
+# - 회차 시각은 현지 시각(TIME_ZONE) 기준으로 첫 회차와 같은 벽시계 시각
+# ========================================
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .availability import DAYS, iter_bits
+
+FREQ_DAILY = 'daily'
+FREQ_WEEKLY = 'weekly'
+FREQ_CHOICES = [
+    (FREQ_DAILY, '매일'),
+    (FREQ_WEEKLY, '매주'),
+]
+MAX_INTERVAL = 52
+
+
+class InvalidRecurrence(ValueError):
+    pass
+
+
+def parse_recurrence(data):
+    """
+    요청 JSON의 recurrence 값 → Meeting 반복 필드 dict
+    예: {"freq": "weekly", "interval": 1, "days": ["mon", "wed"], "until": "2026-12-31", "count": 10}
+    None이나 빈 값이면 반복 없음
+    """
+    if not data:
+        return {
+            'recurrence_freq': '', 'recurrence_interval': 1, 'recurrence_days': 0,
+            'recurrence_until': None, 'recurrence_count': None,
+        }
+    if not isinstance(data, dict):
+        raise InvalidRecurrence('recurrence는 객체여야 합니다.')
+
+    freq = data.get('freq')
+    if freq not in (FREQ_DAILY, FREQ_WEEKLY):
+        raise InvalidRecurrence('freq는 daily 또는 weekly여야 합니다.')
+    try:
+        interval = int(data.get('interval') or 1)
+        count = int(data['count']) if data.get('count') not in (None, '') else None
+    except (TypeError, ValueError):
+        raise InvalidRecurrence('interval, count는 정수여야 합니다.')
+    if not 1 <= interval <= MAX_INTERVAL:
+        raise InvalidRecurrence(f'interval은 1 ~ {MAX_INTERVAL} 사이여야 합니다.')
+    if count is not None and count < 1:
+        raise InvalidRecurrence('count는 1 이상이어야 합니다.')
+
+    days = 0
+    for day in data.get('days') or []:
+        if day not in DAYS:
+            raise InvalidRecurrence(f'알 수 없는 요일입니다: {day}')
+        days |= 1 << DAYS.index(day)
+
+    until = None
+    if data.get('until'):
+        until = parse_date(str(data['until'])) if len(str(data['until'])) == 10 else None
+        if until is None:
+            raise InvalidRecurrence('until은 YYYY-MM-DD 형식이어야 합니다.')
+
+    return {
+        'recurrence_freq': freq, 'recurrence_interval': interval,
+        'recurrence_days': days if freq == FREQ_WEEKLY else 0,
+        'recurrence_until': until, 'recurrence_count': count,
+    }
+
+
+class RecurrenceRule:
+    """Meeting 한 건의 반복 규칙 (회차 번호 ↔ 날짜 계산)"""
+
+    def __init__(self, meeting):
+        local_start = timezone.localtime(meeting.start_time)
+        self.tzinfo = local_start.tzinfo
+        self.wall_time = local_start.time().replace(tzinfo=None)
+        self.duration = meeting.end_time - meeting.start_time
+        first = local_start.date()
+        # until이 첫 회차보다 앞서면 첫 회차만
+        self.until = max(meeting.recurrence_until, first) if meeting.recurrence_until else None
+        self.count = meeting.recurrence_count
+
+        interval = meeting.recurrence_interval or 1
+        if meeting.recurrence_freq == FREQ_WEEKLY:
+            # 첫 회차 요일은 항상 포함 (Meeting.save에서도 맞춰 둠)
+            days = (meeting.recurrence_days or 0) | (1 << first.weekday())
+            self.base = first - timedelta(days=first.weekday())
+            self.offsets = list(iter_bits(days))
+            self.period = 7 * interval
+        else:
+            self.base, self.offsets, self.period = first, [0], interval
+        # 첫 주기에서 첫 회차보다 앞선 요일은 건너뜀
+        self.skip = self.offsets.index((first - self.base).days)
+        self.first_period_count = len(self.offsets) - self.skip
+
+    def date_of(self, index):
+        """index번째(0부터) 회차 날짜"""
+        if index < self.first_period_count:
+            period, position = 0, self.skip + index
+        else:
+            period, position = divmod(index - self.first_period_count, len(self.offsets))
+            period += 1
+        return self.base + timedelta(days=period * self.period + self.offsets[position])
+
+    def index_of(self, period, position):
+        if period == 0:
+            return position - self.skip
+        return self.first_period_count + (period - 1) * len(self.offsets) + position
+
+    def start_on(self, day):
+        return datetime.combine(day, self.wall_time, tzinfo=self.tzinfo)
+
+    def last_date(self):
+        """마지막 회차 날짜 (끝이 없으면 None)"""
+        if self.until is None and self.count is None:
+            return None
+        candidates = []
+        if self.count is not None:
+            candidates.append(self.date_of(self.count - 1))
+        if self.until is not None:
+            candidates.append(self._last_date_until(self.until))
+        return min(candidates)
+
+    def _last_date_until(self, until):
+        days = (until - self.base).days
+        period, remainder = divmod(days, self.period)
+        positions = [p for p, offset in enumerate(self.offsets) if offset <= remainder]
+        if period > 0 and not positions:
+            period, positions = period - 1, [len(self.offsets) - 1]
+        if period < 0 or self.index_of(period, positions[-1] if positions else -1) < 0:
+            return self.date_of(0)
+        return self.base + timedelta(days=period * self.period + self.offsets[positions[-1]])
+
+    def series_end(self):
+        """마지막 회차 종료 시각 (끝이 없으면 None)"""
+        last = self.last_date()
+        return None if last is None else self.start_on(last) + self.duration
+
+    def occurrences(self, start, end):
+        """[start, end) 범위와 겹치는 회차 시작 시각 (시간순)"""
+        first_day = timezone.localtime(start - self.duration).date()
+        last_day = timezone.localtime(end).date()
+        if self.until is not None:
+            last_day = min(last_day, self.until)
+
+        period = max(0, (first_day - self.base).days // self.period)
+        while True:
+            period_start = self.base + timedelta(days=period * self.period)
+            if period_start > last_day:
+                return
+            for position, offset in enumerate(self.offsets):
+                if period == 0 and position < self.skip:
+                    continue
+                if self.count is not None and self.index_of(period, position) >= self.count:
+                    return
+                day = period_start + timedelta(days=offset)
+                if day > last_day:
+                    return
+                occurrence = self.start_on(day)
+                if occurrence < end and occurrence + self.duration > start:
+                    yield occurrence
+            period += 1
+
+    def is_occurrence(self, moment):
+        """moment가 회차 시작 시각인지"""
+        tick = timedelta(microseconds=1)
+        return moment in self.occurrences(moment - tick, moment + tick)
@@ -0,0 +1,6 @@
+from django.urls import path
+from . import consumers
+
+websocket_urlpatterns = [
+    path("ws/schedule/<int:team_id>/poll/", consumers.SchedulePollConsumer.as_asgi()),
+]
@@ -0,0 +1,34 @@
+# schedule/signals.py
+
+# ========================================
+# 일정 조율 칸별 투표 수 / 활성 조율 캐시 정리
+# - 투표 삭제(팀원 탈퇴 등) 시 칸별 투표 수(PollSlotCount)에서 빼고 팀원들에게 알림 (저장은 Vote.save에서 처리)
+# - 조율 생성/수정/삭제 시 팀의 활성 조율 ID 캐시 삭제
+# ========================================
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import PollSlotCount, SchedulePoll, Vote
+from .realtime import broadcast_slot_changes
+from .utils import forget_active_poll
+
+
+@receiver(post_delete, sender=Vote)
+def remove_vote_from_slot_counts(sender, instance, **kwargs):
+    # 조율 삭제로 함께 지워지는 경우 PollSlotCount도 함께 삭제되므로 갱신할 행이 없음
+    added, removed = PollSlotCount.apply_change(instance.poll_id, instance.day_masks, None)
+    if not removed:
+        return
+    team_id = SchedulePoll.objects.filter(pk=instance.poll_id).values_list('team_id', flat=True).first()
+    if team_id is None:
+        return
+    poll_id = instance.poll_id
+    username = get_user_model().objects.filter(pk=instance.voter_id).values_list('username', flat=True).first()
+    transaction.on_commit(lambda: broadcast_slot_changes(team_id, poll_id, username, added, removed))
+
+
+@receiver([post_save, post_delete], sender=SchedulePoll)
+def forget_active_poll_on_change(sender, instance, **kwargs):
+    forget_active_poll(instance.team_id)
@@ -1,3 +1,543 @@
-from django.test import TestCase
+import json
+import random
+from datetime import date, datetime, time, timedelta
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from tasks.models import Task
+from teams.models import Team, TeamMember
+from .recurrence import FREQ_DAILY, FREQ_WEEKLY
+from .availability import (
+    DAY_SLOTS, DAYS, SLOTS_PER_DAY, AvailabilityTally, availability_summary, find_meeting_windows, masks_to_slots,
+    slot_index, slot_label, slots_to_masks,
+)
+from .management.commands.benchmark_availability import dict_summary
+from .models import Meeting, MeetingException, PollSlotCount, SchedulePoll, Vote
+from .realtime import poll_group_name
+from .routing import websocket_urlpatterns
+from .utils import MAX_WINDOW, WINDOW_END_HEADER, meetings_in_window, stream_json_array
+
+
+def local(day, hour=0):
+    return timezone.make_aware(datetime.combine(day, time(hour)))
+
+
+class ScheduleWindowTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='owner', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.user, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.user)
+        self.client.force_login(self.user)
+        self.url = f'/api/teams/{self.team.id}/schedule/detail'
+        self.start = date(2030, 3, 1)
+        self.end = date(2030, 4, 1)
+
+    def meeting(self, title, start, end):
+        return Meeting.objects.create(team=self.team, title=title, start_time=start, end_time=end)
+
+    def task(self, name, due_date):
+        return Task.objects.create(name=name, team=self.team, assignee=self.user, due_date=due_date)
+
+    def get_ids(self, **params):
+        response = self.client.get(self.url, {'start': self.start.isoformat(), 'end': self.end.isoformat(), **params})
+        self.assertEqual(response.status_code, 200)
+        return {event['id'] for event in response.json()}, response
+
+    def test_only_events_in_window(self):
+        inside = self.meeting('안', local(self.start, 10), local(self.start, 11))
+        overlapping = self.meeting('걸침', local(self.start - timedelta(days=1), 23), local(self.start, 1))
+        self.meeting('이전', local(self.start - timedelta(days=2)), local(self.start - timedelta(days=1)))
+        self.meeting('이후', local(self.end, 9), local(self.end, 10))
+        first_day = self.task('첫날', self.start)
+        last_day = self.task('마지막날', self.end - timedelta(days=1))
+        self.task('이전', self.start - timedelta(days=1))
+        self.task('이후', self.end)
+        self.task('마감일 없음', None)
+
+        ids, _ = self.get_ids()
+        self.assertEqual(ids, {
+            f'meeting_{inside.id}', f'meeting_{overlapping.id}', f'task_{first_day.id}', f'task_{last_day.id}',
+        })
+
+    def test_oversized_window_is_truncated(self):
+        within = self.task('범위 안', self.start + MAX_WINDOW - timedelta(days=1))
+        self.task('범위 밖', self.start + MAX_WINDOW)
+
+        ids, response = self.get_ids(end=(self.start + MAX_WINDOW * 2).isoformat())
+        self.assertEqual(ids, {f'task_{within.id}'})
+        self.assertEqual(response[WINDOW_END_HEADER], local(self.start + MAX_WINDOW).isoformat())
+
+    def test_invalid_window(self):
+        response = self.client.get(self.url, {'start': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(self.url, {'start': '2030-03-02', 'end': '2030-03-01'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_streaming_matches_json_response(self):
+        other = User.objects.create_user(username='member', password='pw', first_name='팀원')
+        self.meeting('회의', local(self.start, 10), local(self.start, 11))
+        for i in range(5):
+            task = self.task(f'작업 "{i}"', self.start + timedelta(days=i))
+            task.assignees.set([self.user, other])
+
+        params = {'start': self.start.isoformat(), 'end': self.end.isoformat()}
+        expected = self.client.get(self.url, params)
+        streamed = self.client.get(self.url, {**params, 'stream': 1})
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(b''.join(streamed.streaming_content), expected.content)
+        self.assertEqual(len(expected.json()), 6)
+
+    def test_stream_json_array_batches(self):
+        items = [{'id': i, 'day': date(2030, 1, i + 1)} for i in range(5)]
+        for batch_size in (1, 2, 10):
+            chunks = list(stream_json_array(iter(items), batch_size=batch_size))
+            self.assertEqual(''.join(chunks), json.dumps(items, cls=DjangoJSONEncoder))
+        self.assertEqual(''.join(stream_json_array(iter([]))), '[]')
+
+
+    def test_window_query_plan_is_bounded_by_series_end(self):
+        # 지난 회의가 많아도 (team, series_end) 인덱스 범위 탐색만 (팀 전체 기록을 훑지 않음)
+        past = timezone.make_aware(datetime(2029, 1, 1, 9))
+        Meeting.objects.bulk_create([
+            Meeting(team=self.team, title='지난 회의', start_time=past - timedelta(hours=3 * i),
+                    end_time=past - timedelta(hours=3 * i - 1), series_end=past - timedelta(hours=3 * i - 1))
+            for i in range(500)
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+        start = timezone.make_aware(datetime.combine(self.start, time.min))
+        end = timezone.make_aware(datetime.combine(self.end, time.min))
+        plan = meetings_in_window(Meeting.objects.filter(team=self.team), start, end).order_by().explain()
+        steps = [line for line in plan.splitlines() if 'schedule_meeting' in line]
+        self.assertEqual(len(steps), 2, plan)
+        for step in steps:
+            self.assertIn('USING INDEX meeting_team_series_end_idx (team_id=? AND series_end', step)
+        self.assertIn('series_end>?', plan)
+
+
+class AvailabilityBitmaskTests(TestCase):
+    def test_slot_labels_round_trip(self):
+        slots = {'mon': ['0000', '0930', '2400'], 'sun': ['1200']}
+        masks = slots_to_masks({**slots, 'tue': ['0915', 'abc'], 'xyz': ['1000']})
+        self.assertEqual(masks[0], (1 << 0) | (1 << 19) | (1 << 48))
+        self.assertEqual(masks[1], 0)
+        self.assertEqual(masks_to_slots(masks), slots)
+
+    def test_summary_matches_dict_aggregation(self):
+        rng = random.Random(1)
+        labels = [slot_label(i) for i in range(SLOTS_PER_DAY)]
+        votes = [
+            (f'user{v}', {day: [label for label in labels if rng.random() < 0.4] for day in DAYS})
+            for v in range(23)
+        ]
+        availability, best_slots = availability_summary(
+            (username, slots_to_masks(slots)) for username, slots in votes
+        )
+        expected, expected_best = dict_summary(votes)
+        self.assertEqual(availability, dict(expected))
+        self.assertEqual(sorted(best_slots), sorted(expected_best))
+
+        tally = AvailabilityTally()
+        for _, slots in votes:
+            tally.add(slots_to_masks(slots))
+        self.assertEqual(tally.counts(2), {
+            slot_index(key[4:]): data['count'] for key, data in expected.items() if key.startswith('wed-')
+        })
+
+    def test_mediate_view_uses_masks(self):
+        owner = User.objects.create_user(username='owner', password='pw')
+        member = User.objects.create_user(username='member', password='pw')
+        team = Team.objects.create(name='팀', owner=owner, invite_code='ABC123')
+        TeamMember.objects.create(team=team, user=owner)
+        TeamMember.objects.create(team=team, user=member)
+        poll = SchedulePoll.objects.create(team=team)
+        Vote.objects.create(poll=poll, voter=owner, available_slots={'mon': ['0900', '1000']})
+        Vote.objects.create(poll=poll, voter=member, available_slots={'mon': ['1000']})
+
+        cache.clear()
+        self.client.force_login(owner)
+        data = self.client.get(f'/api/teams/{team.id}/schedule/mediate').json()
+        self.assertEqual(data['availability'], {
+            'mon-0900': {'count': 1, 'users': ['owner']},
+            'mon-1000': {'count': 2, 'users': ['owner', 'member']},
+        })
+        self.assertEqual(data['best_slots'], ['mon-1000'])
+        self.assertEqual(data['my_vote'], {'mon': ['0900', '1000']})
+
+
+class PollSlotCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username='owner', password='pw')
+        self.member = User.objects.create_user(username='member', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.owner, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.owner)
+        TeamMember.objects.create(team=self.team, user=self.member)
+        self.client.force_login(self.owner)
+
+    def counts(self, poll):
+        return set(poll.slot_counts.filter(count__gt=0).values_list('day', 'slot', 'count'))
+
+    def save_vote(self, user, slots):
+        self.client.force_login(user)
+        response = self.client.post(
+            f'/api/teams/{self.team.id}/schedule/save_vote',
+            {'available_slots': slots}, content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_counts_follow_vote_changes(self):
+        self.save_vote(self.owner, {'mon': ['0900', '0930'], 'tue': ['1000']})
+        self.save_vote(self.member, {'mon': ['0930']})
+        self.save_vote(self.owner, {'mon': ['0930', '1000']})
+        poll = SchedulePoll.objects.get(team=self.team)
+        self.assertEqual(self.counts(poll), {(0, 19, 2), (0, 20, 1)})
+
+        incremental = self.counts(poll)
+        PollSlotCount.rebuild(poll.id)
+        self.assertEqual(self.counts(poll), incremental)
+
+        Vote.objects.get(voter=self.member).delete()
+        self.assertEqual(self.counts(poll), {(0, 19, 1), (0, 20, 1)})
+
+    def test_mediate_reads_counts_without_creating_poll(self):
+        url = f'/api/teams/{self.team.id}/schedule/mediate'
+        data = self.client.get(url).json()
+        self.assertIsNone(data['poll_id'])
+        self.assertEqual(data['availability'], {})
+        self.assertFalse(SchedulePoll.objects.exists())
+
+        self.save_vote(self.owner, {'wed': ['1400']})
+        self.save_vote(self.member, {'wed': ['1400', '1430']})
+        data = self.client.get(url).json()
+        self.assertEqual(data['poll_id'], SchedulePoll.objects.get().id)
+        self.assertEqual(data['availability']['wed-1400'], {'count': 2, 'users': ['owner', 'member']})
+        self.assertEqual(data['best_slots'], ['wed-1400'])
+        self.assertEqual(data['my_vote'], {'wed': ['1400', '1430']})
+
+
+class MeetingWindowTests(TestCase):
+    def brute_force_counts(self, voters, length):
+        """(요일, 시작 칸) → 구간 전체에 가능한 인원 (칸을 하나씩 확인)"""
+        counts = {}
+        for day in range(len(DAYS)):
+            for start in range(DAY_SLOTS - length + 1):
+                free = sum(
+                    all((masks[day] >> slot) & 1 for slot in range(start, start + length))
+                    for _, masks in voters
+                )
+                if free:
+                    counts[(day, start)] = free
+        return counts
+
+    def test_windows_match_brute_force(self):
+        rng = random.Random(7)
+        voters = [
+            (f'user{v}', [rng.getrandbits(SLOTS_PER_DAY) | rng.getrandbits(SLOTS_PER_DAY) for _ in DAYS])
+            for v in range(12)
+        ]
+        for length in (1, 2, 3, 5, 8):
+            counts = self.brute_force_counts(voters, length)
+            windows = find_meeting_windows(voters, length, min_attendance=2, top=10)
+            best = max(counts.values())
+            self.assertEqual(windows[0]['attendance'], best)
+
+            taken = set()
+            for window in windows:
+                day, start = DAYS.index(window['day']), slot_index(window['start'])
+                self.assertEqual(slot_index(window['end']), start + length)
+                self.assertEqual(window['attendance'], counts[(day, start)])
+                self.assertEqual(len(window['users']), window['attendance'])
+                self.assertGreaterEqual(window['attendance'], 2)
+                span = {(day, slot) for slot in range(start, start + length)}
+                self.assertFalse(taken & span)
+                taken |= span
+            attendances = [window['attendance'] for window in windows]
+            self.assertEqual(attendances, sorted(attendances, reverse=True))
+
+    def test_window_must_not_pass_midnight(self):
+        voters = [('owner', slots_to_masks({'mon': ['2300', '2330', '2400']}))]
+        self.assertEqual(find_meeting_windows(voters, 3), [])
+        self.assertEqual(find_meeting_windows(voters, 2), [
+            {'day': 'mon', 'start': '2300', 'end': '2400', 'attendance': 1, 'users': ['owner']},
+        ])
+
+    def test_windows_view(self):
+        owner = User.objects.create_user(username='owner', password='pw')
+        member = User.objects.create_user(username='member', password='pw')
+        outsider = User.objects.create_user(username='outsider', password='pw')
+        team = Team.objects.create(name='팀', owner=owner, invite_code='ABC123')
+        TeamMember.objects.create(team=team, user=owner)
+        TeamMember.objects.create(team=team, user=member)
+        poll = SchedulePoll.objects.create(team=team)
+        Vote.objects.create(poll=poll, voter=owner, available_slots={'tue': ['0900', '0930', '1000', '1030']})
+        Vote.objects.create(poll=poll, voter=member, available_slots={'tue': ['0930', '1000'], 'fri': ['1500']})
+
+        cache.clear()
+        url = f'/api/teams/{team.id}/schedule/mediate/windows'
+        self.client.force_login(owner)
+        data = self.client.get(url, {'length': 60, 'min_attendance': 2}).json()
+        self.assertEqual(data['windows'], [
+            {'day': 'tue', 'start': '0930', 'end': '1030', 'attendance': 2, 'users': ['owner', 'member']},
+        ])
+        data = self.client.get(url, {'length': 60}).json()
+        self.assertEqual([w['start'] for w in data['windows']], ['0930'])  # 0900/1000 시작은 0930과 겹침
+
+        self.assertEqual(self.client.get(url, {'length': 45}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'top': 'abc'}).status_code, 400)
+        self.client.force_login(outsider)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+
+class RecurringMeetingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='owner', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.user, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.user)
+        self.client.force_login(self.user)
+        self.url = f'/api/teams/{self.team.id}/schedule/detail'
+
+    def series(self, start, hours=1, **rule):
+        return Meeting.objects.create(
+            team=self.team, title='스탠드업', start_time=start, end_time=start + timedelta(hours=hours), **rule,
+        )
+
+    def brute_force(self, meeting, horizon):
+        """첫 회차부터 하루씩 규칙을 확인한 회차 시작 시각 목록"""
+        first = timezone.localtime(meeting.start_time)
+        days = meeting.recurrence_days
+        result, day = [], first.date()
+        while day <= horizon and (meeting.recurrence_count is None or len(result) < meeting.recurrence_count):
+            if meeting.recurrence_until and day > meeting.recurrence_until:
+                break
+            elapsed = (day - first.date()).days
+            if meeting.recurrence_freq == FREQ_DAILY:
+                matches = elapsed % meeting.recurrence_interval == 0
+            else:
+                weeks = (day - (first.date() - timedelta(days=first.weekday()))).days // 7
+                matches = (days >> day.weekday()) & 1 and weeks % meeting.recurrence_interval == 0
+            if matches:
+                result.append(local(day, first.hour))
+            day += timedelta(days=1)
+        return result
+
+    def test_occurrences_match_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(40):
+            freq = rng.choice([FREQ_DAILY, FREQ_WEEKLY])
+            rule = {
+                'recurrence_freq': freq,
+                'recurrence_interval': rng.randint(1, 3),
+                'recurrence_days': rng.getrandbits(7) if freq == FREQ_WEEKLY else 0,
+                'recurrence_count': rng.choice([None, rng.randint(1, 40)]),
+                'recurrence_until': rng.choice([None, date(2030, 1, 1) + timedelta(days=rng.randint(0, 300))]),
+            }
+            meeting = self.series(local(date(2030, 1, 1) + timedelta(days=rng.randint(0, 6)), 9), hours=2, **rule)
+            expected = self.brute_force(meeting, date(2031, 6, 1))
+            if rule['recurrence_count'] or rule['recurrence_until']:
+                self.assertEqual(meeting.series_end, expected[-1] + timedelta(hours=2))
+            else:
+                self.assertIsNone(meeting.series_end)
+
+            for _ in range(5):
+                start = local(date(2029, 12, 25) + timedelta(days=rng.randint(0, 400)), rng.randint(0, 23))
+                end = start + timedelta(days=rng.randint(1, 60))
+                self.assertEqual(
+                    list(meeting.rule.occurrences(start, end)),
+                    [o for o in expected if o < end and o + timedelta(hours=2) > start],
+                )
+
+    def test_feed_expands_only_window(self):
+        meeting = self.series(local(date(2020, 1, 6), 10), recurrence_freq=FREQ_WEEKLY, recurrence_days=0b101)
+        self.assertIsNone(meeting.series_end)
+        self.assertEqual(Meeting.objects.count(), 1)
+
+        response = self.client.get(self.url, {'start': '2030-03-04', 'end': '2030-03-18'})
+        events = response.json()
+        self.assertEqual([event['start'] for event in events], [
+            local(date(2030, 3, d), 10).isoformat() for d in (4, 6, 11, 13)
+        ])
+        self.assertTrue(all(event['extendedProps']['recurring'] for event in events))
+        self.assertEqual(len({event['id'] for event in events}), 4)
+
+        ended = self.series(local(date(2020, 1, 6), 15), recurrence_freq=FREQ_DAILY, recurrence_count=3)
+        self.assertEqual(ended.series_end, local(date(2020, 1, 8), 16))
+        response = self.client.get(self.url, {'start': '2030-03-04', 'end': '2030-03-18'})
+        self.assertEqual(len(response.json()), 4)
+
+    def test_exceptions(self):
+        meeting = self.series(local(date(2030, 3, 4), 10), recurrence_freq=FREQ_WEEKLY)
+        occurrence_url = f'/api/teams/{self.team.id}/schedule/{meeting.id}/occurrence'
+
+        def post(**data):
+            return self.client.post(occurrence_url, data, content_type='application/json')
+
+        self.assertEqual(post(original_start=local(date(2030, 3, 11), 10).isoformat(), cancel=True).status_code, 200)
+        # 범위 밖 회차(3/25)를 범위 안(3/19)으로 옮김
+        self.assertEqual(post(
+            original_start=local(date(2030, 3, 25), 10).isoformat(),
+            start=local(date(2030, 3, 19), 14).isoformat(), end=local(date(2030, 3, 19), 15).isoformat(),
+            title='옮긴 회의',
+        ).status_code, 200)
+        self.assertEqual(post(original_start=local(date(2030, 3, 12), 10).isoformat(), cancel=True).status_code, 400)
+        self.assertEqual(MeetingException.objects.count(), 2)
+
+        events = self.client.get(self.url, {'start': '2030-03-04', 'end': '2030-03-21'}).json()
+        self.assertEqual(
+            sorted((event['start'], event['title']) for event in events),
+            [
+                (local(date(2030, 3, 4), 10).isoformat(), '스탠드업'),
+                (local(date(2030, 3, 18), 10).isoformat(), '스탠드업'),
+                (local(date(2030, 3, 19), 14).isoformat(), '옮긴 회의'),
+            ],
+        )
+        events = self.client.get(self.url, {'start': '2030-03-24', 'end': '2030-03-27'}).json()
+        self.assertEqual(events, [])
+
+    def test_create_view_validates_recurrence(self):
+        create_url = f'/api/teams/{self.team.id}/schedule/create'
+        payload = {'title': '회의', 'start': '2030-03-04T10:00', 'end': '2030-03-04T11:00'}
+        response = self.client.post(create_url, {**payload, 'recurrence': {'freq': 'weekly', 'days': ['mon', 'thu'], 'count': 4}},
+                                    content_type='application/json')
+        meeting = Meeting.objects.get(id=response.json()['id'])
+        self.assertEqual(meeting.series_end, local(date(2030, 3, 14), 11))
+
+        for recurrence in ({'freq': 'yearly'}, {'freq': 'weekly', 'days': ['xyz']}, {'freq': 'daily', 'until': 'soon'}):
+            response = self.client.post(create_url, {**payload, 'recurrence': recurrence}, content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+
+
+IN_MEMORY_CHANNEL_LAYERS = {'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}}
+
+
+@override_settings(CHANNEL_LAYERS=IN_MEMORY_CHANNEL_LAYERS)
+class PollRealtimeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username='owner', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.owner, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.owner)
+        self.client.force_login(self.owner)
+        self.layer = get_channel_layer()
+        self.channel = async_to_sync(self.layer.new_channel)()
+        async_to_sync(self.layer.group_add)(poll_group_name(self.team.id), self.channel)
+
+    def receive(self):
+        return async_to_sync(self.layer.receive)(self.channel)
+
+    def save_vote(self, slots):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                f'/api/teams/{self.team.id}/schedule/save_vote',
+                {'available_slots': slots}, content_type='application/json',
+            )
+
+    def test_vote_changes_are_broadcast_as_deltas(self):
+        self.save_vote({'mon': ['0900', '0930']})
+        poll = SchedulePoll.objects.get()
+        self.assertEqual(self.receive(), {
+            'type': 'slot_counts_update', 'poll_id': poll.id, 'voter': 'owner',
+            'added': ['mon-0900', 'mon-0930'], 'removed': [],
+        })
+
+        self.save_vote({'mon': ['0930'], 'fri': ['1200']})
+        message = self.receive()
+        self.assertEqual((message['added'], message['removed']), (['fri-1200'], ['mon-0900']))
+
+        # 변경 없는 저장은 알리지 않음 (알렸다면 아래 receive가 그 메시지를 받음)
+        with self.captureOnCommitCallbacks(execute=True):
+            Vote.objects.get().save()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Vote.objects.get().delete()
+        message = self.receive()
+        self.assertEqual((message['added'], message['removed']), ([], ['mon-0930', 'fri-1200']))
+
+
+@override_settings(CHANNEL_LAYERS=IN_MEMORY_CHANNEL_LAYERS)
+class SchedulePollConsumerTests(TransactionTestCase):
+    def test_only_team_members_can_subscribe(self):
+        member = User.objects.create_user(username='member', password='pw')
+        outsider = User.objects.create_user(username='outsider', password='pw')
+        team = Team.objects.create(name='팀', owner=member, invite_code='ABC123')
+        TeamMember.objects.create(team=team, user=member)
+        application = URLRouter(websocket_urlpatterns)
+
+        async def connect(user):
+            communicator = WebsocketCommunicator(application, f'/ws/schedule/{team.id}/poll/')
+            communicator.scope['user'] = user
+            connected, _ = await communicator.connect()
+            return communicator, connected
+
+        async def scenario():
+            communicator, connected = await connect(outsider)
+            self.assertFalse(connected)
+
+            communicator, connected = await connect(member)
+            self.assertTrue(connected)
+            await get_channel_layer().group_send(poll_group_name(team.id), {
+                'type': 'slot_counts_update', 'poll_id': 1, 'voter': 'member', 'added': ['mon-0900'], 'removed': [],
+            })
+            message = await communicator.receive_json_from()
+            self.assertEqual(message['added'], ['mon-0900'])
+            await communicator.disconnect()
+
+        async_to_sync(scenario)()
+
+
+class MyCalendarTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='owner', password='pw')
+        self.client.force_login(self.user)
+        self.day = date(2030, 3, 4)
+
+    def team_with_events(self, index, member=True):
+        team = Team.objects.create(name=f'팀{index}', owner=self.user, invite_code=f'ABC{index:03d}')
+        if member:
+            TeamMember.objects.create(team=team, user=self.user)
+        meeting = Meeting.objects.create(
+            team=team, title='회의', start_time=local(self.day, 10), end_time=local(self.day, 11),
+        )
+        task = Task.objects.create(name='작업', team=team, assignee=self.user, due_date=self.day)
+        return team, meeting, task
+
+    def get(self):
+        response = self.client.get('/api/me/calendar', {'start': '2030-03-01', 'end': '2030-04-01'})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_events_from_all_teams_tagged_by_team(self):
+        first, first_meeting, first_task = self.team_with_events(1)
+        second, second_meeting, second_task = self.team_with_events(2)
+        self.team_with_events(3, member=False)
+        Task.objects.create(name='범위 밖', team=first, assignee=self.user, due_date=date(2030, 5, 1))
+
+        events = {event['id']: event['extendedProps'] for event in self.get()}
+        self.assertEqual(set(events), {
+            f'meeting_{first_meeting.id}', f'task_{first_task.id}',
+            f'meeting_{second_meeting.id}', f'task_{second_task.id}',
+        })
+        self.assertEqual(events[f'task_{second_task.id}']['team_id'], second.id)
+        self.assertEqual(events[f'meeting_{first_meeting.id}']['team_name'], '팀1')
+
+    def test_query_count_does_not_grow_with_teams(self):
+        self.team_with_events(1)
+        with self.assertNumQueries(5):  # 세션, 사용자, 회의, 작업, 작업 담당자 prefetch
+            self.assertEqual(len(self.get()), 2)
+        for index in range(2, 6):
+            self.team_with_events(index)
+        with self.assertNumQueries(5):
+            self.assertEqual(len(self.get()), 10)
@@ -9,9 +9,14 @@ urlpatterns = [
     path('teams/<int:team_id>/schedule/detail', views.schedule_list_view, name='schedule_list'),
     path('teams/<int:team_id>/schedule/create', views.schedule_create_view, name='schedule_create'),
     path('teams/<int:team_id>/schedule/<int:schedule_id>/update', views.schedule_update_view, name='schedule_update'),
+    path('teams/<int:team_id>/schedule/<int:schedule_id>/occurrence', views.schedule_occurrence_view, name='schedule_occurrence'),
     path('teams/<int:team_id>/schedule/<int:schedule_id>/delete', views.schedule_delete_view, name='schedule_delete'),
     
+    # 내가 속한 모든 팀의 일정 (/api/me/calendar)
+    path('me/calendar', views.my_calendar_view, name='my_calendar'),
+
     # 일정 조율 API
     path('teams/<int:team_id>/schedule/mediate', views.schedule_mediate_view, name='schedule_mediate'),
+    path('teams/<int:team_id>/schedule/mediate/windows', views.schedule_windows_view, name='schedule_windows'),
     path('teams/<int:team_id>/schedule/save_vote', views.save_vote_view, name='save_vote'),
 ]
\ No newline at end of file
@@ -0,0 +1,305 @@
+# schedule/utils.py
+
+# ========================================
+# 캘린더 피드 조회 범위
+# FullCalendar는 화면에 보이는 범위를 ?start=...&end=... (ISO 8601)로 보냄
+# - 회의: 범위와 겹치는 것만 (series_end > start AND start_time < end, (team, series_end) 인덱스)
+#   끝없는 반복 회의(series_end IS NULL)는 따로 조회해서 UNION ALL
+#   반복 회의는 시리즈 한 행으로 찾고 회차는 범위 안에서만 계산 (schedule/recurrence.py)
+# - 작업: 마감일이 범위 안에 있는 것만 (담당자 통합 테이블의 (user, team, due_date) 인덱스)
+# - 범위가 MAX_WINDOW보다 길면 MAX_WINDOW까지만 반환하고 실제 끝을 응답 헤더로 알려줌
+#   (클라이언트는 그 시점부터 다시 요청)
+# ========================================
+import json
+from datetime import datetime, time, timedelta
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from teams.models import TeamMember
+from .models import MeetingException, SchedulePoll
+
+DEFAULT_WINDOW = timedelta(days=42)  # 월 보기 6주
+MAX_WINDOW = timedelta(days=100)
+WINDOW_END_HEADER = 'X-Calendar-Window-End'
+
+
+class InvalidWindow(ValueError):
+    pass
+
+
+def parse_moment(value):
+    """ISO 날짜/일시 문자열 → aware datetime (날짜만 오면 그날 0시)"""
+    if not isinstance(value, str):
+        raise InvalidWindow('날짜가 필요합니다.')
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise InvalidWindow(f'잘못된 날짜 형식입니다: {value}')
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def parse_window(params):
+    """
+    start/end 쿼리 파라미터 → (start, end, 잘렸는지 여부)
+    start가 없으면 오늘 0시, end가 없으면 start + DEFAULT_WINDOW
+    """
+    try:
+        start = parse_moment(params['start']) if params.get('start') else timezone.make_aware(
+            datetime.combine(timezone.localdate(), time.min)
+        )
+        end = parse_moment(params['end']) if params.get('end') else start + DEFAULT_WINDOW
+    except ValueError as e:
+        raise InvalidWindow(str(e))
+    if end <= start:
+        raise InvalidWindow('end는 start보다 뒤여야 합니다.')
+    if end - start > MAX_WINDOW:
+        return start, start + MAX_WINDOW, True
+    return start, end, False
+
+
+def window_dates(start, end):
+    """
+    종일 일정(작업 마감일)용 날짜 범위 [first, last)
+    마감일 D는 D 0시 ~ D+1 0시를 차지하므로 범위와 겹치는 날짜만 포함
+    """
+    first = timezone.localtime(start).date()
+    end_local = timezone.localtime(end)
+    last = end_local.date() if end_local.time() == time.min else end_local.date() + timedelta(days=1)
+    return first, last
+
+
+def meetings_in_window(meetings, start, end):
+    """
+    범위와 겹치는 회의 + 범위 안에 회차가 있을 수 있는 반복 회의 (끝없는 반복은 series_end가 NULL)
+    OR 조건 하나로 묻으면 SQLite가 (team, series_end) 인덱스를 쓰지 못하고 팀 전체 회의를 훑으므로
+    끝이 있는 회의(series_end > start)와 끝없는 반복(series_end IS NULL)을 UNION ALL로 나눠서 조회
+    (결과는 union QuerySet → 이후 filter 불가, order_by / iterator만 사용)
+    """
+    bounded = meetings.filter(series_end__gt=start, start_time__lt=end).order_by()
+    open_ended = meetings.filter(series_end__isnull=True, start_time__lt=end).order_by()
+    return bounded.union(open_ended, all=True)
+
+
+def tasks_in_window(tasks, user, team_id, start, end):
+    """담당자 통합 테이블의 마감일(Task.due_date 복사본)로 범위 조회"""
+    first, last = window_dates(start, end)
+    return tasks.filter(
+        assignments__user=user, assignments__team_id=team_id,
+        assignments__due_date__gte=first, assignments__due_date__lt=last,
+    )
+
+
+# ========================================
+# 내 전체 캘린더 (/api/me/calendar)
+# 팀별 QuerySet을 따로 만들지 않고 사용자의 팀 ID 서브쿼리(team_id IN (SELECT ...)) 하나로
+# 회의는 (team, series_end), 작업은 담당자 통합 테이블의 (user, team, due_date) 인덱스를 팀마다 바로 탐색
+# ========================================
+def member_team_ids(user):
+    return TeamMember.objects.filter(user=user).values('team_id')
+
+
+def my_meetings_in_window(meetings, user, start, end):
+    return meetings_in_window(meetings.filter(team_id__in=member_team_ids(user)), start, end)
+
+
+def my_tasks_in_window(tasks, user, start, end):
+    first, last = window_dates(start, end)
+    return tasks.filter(
+        assignments__user=user, assignments__team_id__in=member_team_ids(user),
+        assignments__due_date__gte=first, assignments__due_date__lt=last,
+    )
+
+
+# ========================================
+# 캘린더 이벤트 생성 / 스트리밍
+# - 회의/작업 QuerySet을 .iterator()로 읽으면서 이벤트 dict를 하나씩 생성 (목록 전체를 메모리에 두지 않음)
+# - 작업 담당자 필드는 prefetch된 assignees를 한 번만 순회해서 계산
+# - stream_json_array: JsonResponse(events, safe=False)와 같은 JSON을 조각 단위로 출력
+# ========================================
+MEETING_COLOR = '#3498db'  # 회의는 파란색
+ITERATOR_CHUNK_SIZE = 500
+STREAM_BATCH_SIZE = 100
+
+
+def meeting_event(meeting):
+    return {
+        'id': f"meeting_{meeting.id}",
+        'title': meeting.title,
+        'start': meeting.start_time.isoformat(),
+        'end': meeting.end_time.isoformat(),
+        'color': MEETING_COLOR,
+        'extendedProps': {
+            'type': 'meeting',
+            'description': '팀 회의 일정입니다.'
+        }
+    }
+
+
+def task_event(task, color):
+    usernames, ids, first_names = [], [], []
+    for assignee in task.assignees.all():
+        usernames.append(assignee.username)
+        ids.append(assignee.id)
+        first_names.append(assignee.first_name)
+
+    return {
+        'id': f"task_{task.id}",
+        'title': f"[작업] {task.name}",
+        'start': task.due_date.isoformat(),
+        'allDay': True,
+        'color': color,
+        'extendedProps': {
+            'type': 'task',
+            'description': task.description,
+            'assignee': ', '.join(usernames) if usernames else '미지정',
+            'status': task.get_status_display(),
+            'assigneeIds': ids,
+            'assignee_first_name': ', '.join(first_names) if first_names else '미지정',
+        }
+    }
+
+
+def occurrence_event(meeting, original_start, start, end, title=None):
+    """반복 회의 한 회차 (id에 원래 회차 시각을 붙여 회차마다 다르게)"""
+    event = meeting_event(meeting)
+    event.update({
+        'id': f"meeting_{meeting.id}_{original_start:%Y%m%dT%H%M%S}",
+        'title': title or meeting.title,
+        'start': timezone.localtime(start).isoformat(),
+        'end': timezone.localtime(end).isoformat(),
+    })
+    event['extendedProps'].update({
+        'recurring': True,
+        'original_start': timezone.localtime(original_start).isoformat(),
+    })
+    return event
+
+
+def exceptions_in_window(series, start, end):
+    """
+    반복 회의들의 예외 중 범위와 관련된 것 → {meeting_id: [예외, ...]}
+    원래 회차가 범위와 겹치는 것(숨김/변경 대상) + 변경된 시각이 범위와 겹치는 것(범위 밖에서 옮겨 온 회차)
+    """
+    longest = max(meeting.end_time - meeting.start_time for meeting in series)
+    exceptions = MeetingException.objects.filter(meeting_id__in=[meeting.id for meeting in series]).filter(
+        Q(original_start__gt=start - longest, original_start__lt=end)
+        | Q(is_cancelled=False, start_time__lt=end, end_time__gt=start)
+    )
+    by_meeting = {}
+    for exception in exceptions:
+        by_meeting.setdefault(exception.meeting_id, []).append(exception)
+    return by_meeting
+
+
+def iter_occurrence_events(meeting, start, end, exceptions):
+    """반복 회의의 범위 안 회차 이벤트 (예외로 취소/변경된 회차 반영)"""
+    rule = meeting.rule
+    changed = {exception.original_start: exception for exception in exceptions}
+    for occurrence in rule.occurrences(start, end):
+        if occurrence not in changed:
+            yield occurrence_event(meeting, occurrence, occurrence, occurrence + rule.duration)
+    for exception in exceptions:
+        if not exception.is_cancelled and exception.start_time < end and exception.end_time > start:
+            yield occurrence_event(
+                meeting, exception.original_start, exception.start_time, exception.end_time, exception.title,
+            )
+
+
+def tag_team(event, team):
+    """여러 팀 일정을 한 캘린더에 보여줄 때 팀 정보 추가 (select_related('team') 필요)"""
+    event['extendedProps'].update({'team_id': team.id, 'team_name': team.name})
+    return event
+
+
+def iter_meeting_events(meetings, start, end, tag_teams=False):
+    """
+    한 번짜리 회의는 읽는 대로 이벤트로, 반복 회의는 모아 두었다가 예외를 한 번에 조회해서 회차로 펼침
+    (반복 회의 수만큼만 메모리에 둠)
+    """
+    series = []
+    for meeting in meetings.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        if meeting.is_recurring:
+            series.append(meeting)
+        else:
+            event = meeting_event(meeting)
+            yield tag_team(event, meeting.team) if tag_teams else event
+    if not series:
+        return
+    exceptions = exceptions_in_window(series, start, end)
+    for meeting in series:
+        for event in iter_occurrence_events(meeting, start, end, exceptions.get(meeting.id, [])):
+            yield tag_team(event, meeting.team) if tag_teams else event
+
+
+def iter_calendar_events(meetings, tasks, task_color, start, end, tag_teams=False):
+    """
+    회의 → 작업 순서로 이벤트 dict 생성 (task_color: 작업 → 색상, 반복 회의는 [start, end) 안의 회차만)
+    tag_teams: 이벤트마다 team_id / team_name 추가 (회의/작업 모두 select_related('team')로 불러와야 함)
+    """
+    yield from iter_meeting_events(meetings, start, end, tag_teams)
+    # prefetch_related는 chunk_size를 지정해야 iterator()에서도 묶음 단위로 적용됨
+    for task in tasks.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        event = task_event(task, task_color(task))
+        yield tag_team(event, task.team) if tag_teams else event
+
+
+def stream_json_array(items, batch_size=STREAM_BATCH_SIZE):
+    """dict 이터레이터 → JSON 배열 조각 (JsonResponse와 같은 인코더/구분자)"""
+    encoder = DjangoJSONEncoder()
+    yield '['
+    buffer = []
+    for index, item in enumerate(items):
+        buffer.append((', ' if index else '') + encoder.encode(item))
+        if len(buffer) >= batch_size:
+            yield ''.join(buffer)
+            buffer = []
+    yield ''.join(buffer) + ']'
+
+
+# ========================================
+# 팀의 활성 일정 조율
+# 조회(mediate)에서는 캐시된 ID만 읽고 만들지 않음, 투표 저장 시에만 없으면 생성
+# SchedulePoll 저장/삭제 시 schedule/signals.py에서 캐시 삭제
+# ========================================
+ACTIVE_POLL_TIMEOUT = 60 * 60
+NO_POLL = 0  # "활성 조율 없음"도 캐시해서 매번 조회하지 않음
+
+
+def _active_poll_key(team_id):
+    return f'schedule:team:{team_id}:active_poll'
+
+
+def get_active_poll_id(team_id):
+    """팀의 활성 조율 ID (없으면 None)"""
+    key = _active_poll_key(team_id)
+    poll_id = cache.get(key)
+    if poll_id is None:
+        poll_id = (
+            SchedulePoll.objects.filter(team_id=team_id, is_active=True)
+            .order_by('id').values_list('id', flat=True).first()
+        ) or NO_POLL
+        cache.set(key, poll_id, ACTIVE_POLL_TIMEOUT)
+    return poll_id or None
+
+
+def get_or_create_active_poll(team_id):
+    """투표 저장용: 활성 조율이 없으면 생성"""
+    poll_id = get_active_poll_id(team_id)
+    if poll_id:
+        poll = SchedulePoll.objects.filter(id=poll_id, is_active=True).first()
+        if poll:
+            return poll
+    poll = SchedulePoll.objects.filter(team_id=team_id, is_active=True).order_by('id').first()
+    return poll or SchedulePoll.objects.create(team_id=team_id)
+
+
+def forget_active_poll(team_id):
+    cache.delete(_active_poll_key(team_id))
@@ -1,15 +1,22 @@
 import json
-from collections import defaultdict
 from datetime import date, timedelta
 
-from django.http import JsonResponse, HttpResponse, HttpResponseForbidden
+from django.http import JsonResponse, HttpResponse, HttpResponseForbidden, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_http_methods
 
-from teams.models import Team
-from tasks.models import Task
-from .models import Meeting, SchedulePoll, Vote
+from teams.models import Team, TeamMember
+from teams.versioning import team_etag
+from tasks.models import URGENCY_COMPLETED, URGENCY_IMMINENT, URGENCY_OVERDUE, Task
+from .availability import DAY_SLOTS, EMPTY_MASKS, SLOT_MINUTES, find_meeting_windows, free_users, slot_key
+from .models import Meeting, MeetingException, PollSlotCount, Vote
+from .recurrence import parse_recurrence
+from .utils import (
+    InvalidWindow, WINDOW_END_HEADER, get_active_poll_id, get_or_create_active_poll, iter_calendar_events,
+    meetings_in_window, my_meetings_in_window, my_tasks_in_window, parse_moment, parse_window, stream_json_array,
+    tasks_in_window,
+)
 
 # ===================================================================
 # 페이지 렌더링 뷰
@@ -30,78 +37,82 @@ def calendar_page_view(request, team_id):
 # API 뷰 (JSON 응답)
 # ===================================================================
 
+# 캘린더 작업 색상: 완료 > 지난 작업 > 마감 임박 순으로 우선, 나머지는 작업 유형별
+TASK_URGENCY_COLORS = {
+    URGENCY_COMPLETED: '#adb5bd',  # 완료된 작업은 회색
+    URGENCY_OVERDUE: '#343a40',    # 지난 작업은 검은색 계열
+    URGENCY_IMMINENT: '#e74c3c',   # 마감 임박은 빨간색
+}
+TASK_TYPE_COLORS = {
+    'personal': '#2ecc71',  # 개인 할 일은 초록색
+    'team': '#f1c40f',      # 팀 할 일은 노란색
+}
+
+
+def task_color(task):
+    """with_urgency()로 불러온 작업의 캘린더 색상"""
+    return TASK_URGENCY_COLORS.get(task.urgency) or TASK_TYPE_COLORS.get(task.type, '#808080')
+
 @login_required
+@team_etag
 def schedule_list_view(request, team_id):
     """
-    GET /api/teams/{team_id}/schedule/detail
-    FullCalendar에 표시할 모든 일정(회의, 과제)을 JSON으로 반환합니다.
+    GET /api/teams/{team_id}/schedule/detail?start=...&end=...
+    FullCalendar 화면에 보이는 범위(start ~ end)의 일정(회의, 과제)을 JSON으로 반환합니다.
+    범위가 MAX_WINDOW보다 길면 잘라서 반환하고 실제 끝을 X-Calendar-Window-End 헤더로 알려줍니다.
     """
     team = get_object_or_404(Team, id=team_id)
     if not team.members.filter(id=request.user.id).exists():
         return HttpResponseForbidden("팀 멤버가 아닙니다.")
 
-    events = []
-    today = date.today()
-    
-    # 1. 회의 일정을 events 리스트에 추가
-    meetings = Meeting.objects.filter(team_id=team_id)
-    for meeting in meetings:
-        events.append({
-            'id': f"meeting_{meeting.id}",
-            'title': meeting.title,
-            'start': meeting.start_time.isoformat(),
-            'end': meeting.end_time.isoformat(),
-            'color': '#3498db', # 회의는 파란색
-            'extendedProps': {
-                'type': 'meeting',
-                'description': '팀 회의 일정입니다.'
-            }
-        })
-    
-    # 2. Task(할 일) 데이터를 가져와 events 리스트에 추가
-    from django.db.models import Q
-    tasks = Task.objects.filter(
-        Q(team_id=team_id) & (Q(assignee=request.user) | Q(assignees=request.user))
-    ).distinct().prefetch_related('assignees')
-    for task in tasks:
-        if not task.due_date:
-            continue
-
-        color = '#808080' # 기본 색상
-        
-        if task.status == 'completed':
-            color = '#adb5bd' # 완료된 작업은 회색 (가장 높은 우선순위)
-        elif task.due_date < today:
-            color = '#343a40' # 지난 작업은 검은색 계열
-        elif task.is_deadline_imminent:
-            color = '#e74c3c' # 마감 임박은 빨간색
-        elif task.type == 'personal':
-            color = '#2ecc71' # 개인 할 일은 초록색
-        elif task.type == 'team':
-            color = '#f1c40f' # 팀 할 일은 노란색
-
-        assignee_usernames = [assignee.username for assignee in task.assignees.all()]
-        assignee_ids = [assignee.id for assignee in task.assignees.all()]
-        assignee_first_names = [user.first_name for user in task.assignees.all()]
-
-        events.append({
-            'id': f"task_{task.id}",
-            'title': f"[작업] {task.name}",
-            'start': task.due_date.isoformat(),
-            'allDay': True,
-            'color': color,
-            'extendedProps': {
-                'type': 'task',
-                'description': task.description,
-                'assignee': ', '.join(assignee_usernames) if assignee_usernames else '미지정',
-                'status': task.get_status_display(),
-                'assigneeIds': assignee_ids,
-                'assignee_first_name': ', '.join(assignee_first_names) if assignee_first_names else '미지정',
-                
-            }
-        })
-
-    return JsonResponse(events, safe=False)
+    try:
+        start, end, truncated = parse_window(request.GET)
+    except InvalidWindow as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    # 1. 회의 일정 (보이는 범위와 겹치는 것만)
+    meetings = meetings_in_window(Meeting.objects.filter(team_id=team_id), start, end).order_by()
+
+    # 2. Task(할 일) 일정
+    # 담당자 통합 테이블의 (user, team, due_date) 인덱스로 조회 (중복 없음 → DISTINCT 불필요)
+    # 캘린더는 순서가 필요 없으므로 기본 정렬 제거, 색상용 긴급도는 SQL에서 계산
+    tasks = tasks_in_window(Task.objects.all(), request.user, team_id, start, end).order_by().with_people().with_urgency()
+
+    events = iter_calendar_events(meetings, tasks, task_color, start, end)
+    if request.GET.get('stream'):
+        # 스트리밍 모드: 이벤트를 만드는 대로 내보냄 (큰 캘린더에서 메모리 일정, 첫 바이트가 빨라짐)
+        response = StreamingHttpResponse(stream_json_array(events), content_type='application/json')
+    else:
+        response = JsonResponse(list(events), safe=False)
+    if truncated:
+        response[WINDOW_END_HEADER] = end.isoformat()
+    return response
+
+@login_required
+def my_calendar_view(request):
+    """
+    GET /api/me/calendar?start=...&end=...
+    내가 속한 모든 팀의 회의와 나에게 배정된 작업을 한 번에 반환합니다. (이벤트마다 team_id / team_name 포함)
+    범위/스트리밍/잘림 헤더는 schedule_list_view와 같습니다.
+    """
+    try:
+        start, end, truncated = parse_window(request.GET)
+    except InvalidWindow as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    meetings = my_meetings_in_window(Meeting.objects.select_related('team'), request.user, start, end).order_by()
+    tasks = my_tasks_in_window(
+        Task.objects.select_related('team'), request.user, start, end,
+    ).order_by().with_people().with_urgency()
+
+    events = iter_calendar_events(meetings, tasks, task_color, start, end, tag_teams=True)
+    if request.GET.get('stream'):
+        response = StreamingHttpResponse(stream_json_array(events), content_type='application/json')
+    else:
+        response = JsonResponse(list(events), safe=False)
+    if truncated:
+        response[WINDOW_END_HEADER] = end.isoformat()
+    return response
 
 @login_required
 @require_http_methods(["POST"])
@@ -115,12 +126,22 @@ def schedule_create_view(request, team_id):
         return HttpResponseForbidden("팀 멤버가 아닙니다.")
         
     data = json.loads(request.body)
+    # recurrence: {"freq": "weekly", "interval": 1, "days": ["mon", "wed"], "until": "YYYY-MM-DD", "count": n}
+    try:
+        start_time, end_time = parse_moment(data.get('start')), parse_moment(data.get('end'))
+        recurrence = parse_recurrence(data.get('recurrence'))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    if end_time < start_time:
+        return JsonResponse({'error': '종료 시간은 시작 시간보다 뒤여야 합니다.'}, status=400)
+
     meeting = Meeting.objects.create(
         team_id=team_id,
         title=data.get('title'),
-        start_time=data.get('start'),
-        end_time=data.get('end'),
-        created_by=request.user
+        start_time=start_time,
+        end_time=end_time,
+        created_by=request.user,
+        **recurrence,
     )
     return JsonResponse({'success': True, 'message': '회의가 추가되었습니다.', 'id': meeting.id})
 
@@ -147,58 +168,161 @@ def schedule_update_view(request, team_id, schedule_id):
     """
     meeting = get_object_or_404(Meeting, id=schedule_id, team_id=team_id)
     data = json.loads(request.body)
-    
+
+    try:
+        start_time = parse_moment(data['start']) if 'start' in data else meeting.start_time
+        end_time = parse_moment(data['end']) if 'end' in data else meeting.end_time
+        recurrence = parse_recurrence(data['recurrence']) if 'recurrence' in data else {}
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    if end_time < start_time:
+        return JsonResponse({'error': '종료 시간은 시작 시간보다 뒤여야 합니다.'}, status=400)
+
+    # 시각이나 반복 규칙이 바뀌면 기존 회차 예외는 더 이상 맞지 않으므로 삭제
+    rule_changed = start_time != meeting.start_time or end_time != meeting.end_time or recurrence
     meeting.title = data.get('title', meeting.title)
-    meeting.start_time = data.get('start', meeting.start_time)
-    meeting.end_time = data.get('end', meeting.end_time)
+    meeting.start_time = start_time
+    meeting.end_time = end_time
+    for field, value in recurrence.items():
+        setattr(meeting, field, value)
     meeting.save()
-    
+    if rule_changed:
+        meeting.exceptions.all().delete()
+
     return JsonResponse({'success': True, 'message': '일정이 수정되었습니다.'})
 
 @login_required
+@require_http_methods(["POST"])
+def schedule_occurrence_view(request, team_id, schedule_id):
+    """
+    POST /api/teams/{team_id}/schedule/{schedule_id}/occurrence
+    반복 회의의 한 회차만 취소하거나 시간/제목을 바꿉니다.
+    {"original_start": "...", "cancel": true} 또는 {"original_start": "...", "start": "...", "end": "...", "title": "..."}
+    """
+    meeting = get_object_or_404(Meeting, id=schedule_id, team_id=team_id)
+    if not TeamMember.objects.filter(team_id=team_id, user=request.user).exists():
+        return HttpResponseForbidden("팀 멤버가 아닙니다.")
+    if not meeting.is_recurring:
+        return JsonResponse({'error': '반복 회의가 아닙니다.'}, status=400)
+
+    data = json.loads(request.body)
+    try:
+        original_start = parse_moment(data.get('original_start'))
+        rule = meeting.rule
+        start_time = parse_moment(data['start']) if data.get('start') else original_start
+        end_time = parse_moment(data['end']) if data.get('end') else start_time + rule.duration
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    if not rule.is_occurrence(original_start):
+        return JsonResponse({'error': '해당 시각에 회차가 없습니다.'}, status=400)
+    if end_time < start_time:
+        return JsonResponse({'error': '종료 시간은 시작 시간보다 뒤여야 합니다.'}, status=400)
+
+    cancelled = bool(data.get('cancel'))
+    MeetingException.objects.update_or_create(
+        meeting=meeting,
+        original_start=original_start,
+        defaults={
+            'is_cancelled': cancelled,
+            'title': '' if cancelled else data.get('title', ''),
+            'start_time': None if cancelled else start_time,
+            'end_time': None if cancelled else end_time,
+        },
+    )
+    message = '이 회차가 취소되었습니다.' if cancelled else '이 회차가 수정되었습니다.'
+    return JsonResponse({'success': True, 'message': message})
+
+@login_required
+@team_etag
 def schedule_mediate_view(request, team_id):
     """
     GET /api/teams/{team_id}/schedule/mediate
     When2Meet 그리드에 필요한 데이터와 가장 많이 겹치는 시간대, 그리고 이번 주 날짜를 계산하여 JSON으로 반환합니다.
     """
-    poll, _ = SchedulePoll.objects.get_or_create(team_id=team_id, is_active=True)
-    votes = Vote.objects.filter(poll=poll).select_related('voter')
-    
-    availability_data = defaultdict(lambda: {'count': 0, 'users': []})
-    
-    for vote in votes:
-        if isinstance(vote.available_slots, dict):
-            for day, slots in vote.available_slots.items():
-                for slot in slots:
-                    slot_key = f"{day}-{slot}"
-                    availability_data[slot_key]['count'] += 1
-                    availability_data[slot_key]['users'].append(vote.voter.username)
-    
-    best_slots = []
-    if availability_data:
-        max_votes = max((data['count'] for data in availability_data.values()), default=0)
-        if max_votes > 0:
-            best_slots = [
-                slot for slot, data in availability_data.items() 
-                if data['count'] == max_votes
-            ]
+    # 조회에서는 조율을 만들지 않음 (캐시된 활성 조율 ID만 사용, 없으면 빈 그리드)
+    poll_id = get_active_poll_id(team_id)
+
+    # 칸별 투표 수와 최댓값은 투표 저장 시 갱신된 PollSlotCount에서 바로 읽음
+    slot_counts = []
+    if poll_id:
+        slot_counts = list(
+            PollSlotCount.objects.filter(poll_id=poll_id, count__gt=0).values_list('day', 'slot', 'count')
+        )
+    max_votes = max((count for _, _, count in slot_counts), default=0)
+    best_slots = [slot_key(day, slot) for day, slot, count in slot_counts if count == max_votes]
+
+    # 칸별 가능한 팀원 이름 (툴팁용)은 요일별 비트마스크에서 계산
+    voters = Vote.objects.filter(poll_id=poll_id).order_by('id').values_list('voter__username', 'day_masks')
+    users_by_slot = free_users((username, masks or EMPTY_MASKS) for username, masks in voters) if poll_id else {}
+    availability_data = {
+        slot_key(day, slot): {'count': count, 'users': users_by_slot.get(slot_key(day, slot), [])}
+        for day, slot, count in slot_counts
+    }
 
     today = date.today()
     start_of_week = today - timedelta(days=today.weekday())
     week_dates = [(start_of_week + timedelta(days=i)).strftime('%m/%d') for i in range(7)]
 
-    my_vote = Vote.objects.filter(poll=poll, voter=request.user).first()
-    my_slots = my_vote.available_slots if my_vote else {}
+    my_slots = {}
+    if poll_id:
+        my_slots = Vote.objects.filter(poll_id=poll_id, voter=request.user).values_list(
+            'available_slots', flat=True
+        ).first() or {}
 
     return JsonResponse({
-        'poll_id': poll.id,
-        'team_members_count': poll.team.members.count(),
+        'poll_id': poll_id,
+        'team_members_count': TeamMember.objects.filter(team_id=team_id).count(),
         'availability': availability_data,
         'my_vote': my_slots,
         'best_slots': best_slots,
         'week_dates': week_dates,
     })
 
+# 연속 회의 구간 검색 파라미터 기본값/한도
+DEFAULT_WINDOW_COUNT = 5
+MAX_WINDOW_COUNT = 20
+
+
+def _int_param(params, name, default):
+    value = params.get(name)
+    if value in (None, ''):
+        return default
+    return int(value)  # 잘못된 값이면 ValueError
+
+
+@login_required
+@team_etag
+def schedule_windows_view(request, team_id):
+    """
+    GET /api/teams/{team_id}/schedule/mediate/windows?length=60&min_attendance=2&top=5
+    활성 조율에서 length분 동안 연속으로 참석 가능한 인원이 많은 시간대를 최대 top개 반환합니다.
+    (같은 요일에서 서로 겹치지 않는 구간만, 인원 많은 순 → 요일/시각 빠른 순)
+    """
+    if not TeamMember.objects.filter(team_id=team_id, user=request.user).exists():
+        return HttpResponseForbidden('팀 멤버만 조회할 수 있습니다.')
+
+    try:
+        length_minutes = _int_param(request.GET, 'length', 60)
+        min_attendance = _int_param(request.GET, 'min_attendance', 1)
+        top = _int_param(request.GET, 'top', DEFAULT_WINDOW_COUNT)
+    except ValueError:
+        return JsonResponse({'error': 'length, min_attendance, top은 정수여야 합니다.'}, status=400)
+    if length_minutes <= 0 or length_minutes % SLOT_MINUTES or length_minutes > DAY_SLOTS * SLOT_MINUTES:
+        return JsonResponse({'error': f'length는 {SLOT_MINUTES}분 단위로 24시간 이하여야 합니다.'}, status=400)
+    if not 1 <= top <= MAX_WINDOW_COUNT:
+        return JsonResponse({'error': f'top은 1 ~ {MAX_WINDOW_COUNT} 사이여야 합니다.'}, status=400)
+
+    poll_id = get_active_poll_id(team_id)
+    windows = []
+    if poll_id:
+        voters = Vote.objects.filter(poll_id=poll_id).order_by('id').values_list('voter__username', 'day_masks')
+        windows = find_meeting_windows(
+            ((username, masks or EMPTY_MASKS) for username, masks in voters),
+            length_minutes // SLOT_MINUTES, min_attendance, top,
+        )
+
+    return JsonResponse({'poll_id': poll_id, 'length': length_minutes, 'windows': windows})
+
 @login_required
 @require_http_methods(["POST"])
 def save_vote_view(request, team_id):
@@ -206,10 +330,11 @@ def save_vote_view(request, team_id):
     POST /api/teams/{team_id}/schedule/save_vote
     사용자의 '가능한 시간' 투표를 저장합니다.
     """
-    poll, _ = SchedulePoll.objects.get_or_create(team_id=team_id, is_active=True)
+    poll = get_or_create_active_poll(team_id)
     data = json.loads(request.body)
     available_slots = data.get('available_slots', {})
 
+    # Vote.save에서 이전 선택과 비교해 칸별 투표 수(PollSlotCount)를 같은 트랜잭션으로 갱신
     Vote.objects.update_or_create(
         poll=poll,
         voter=request.user,
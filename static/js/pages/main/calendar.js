@@ -45,6 +45,8 @@ document.addEventListener('DOMContentLoaded', function() {
     let isMouseDown = false;
     let myVoteData = {};
     let availabilityData = {};
+    let teamMembersCount = 1;
+    let pollSocket = null;
 
     // 초기화
     initializeTabs();
@@ -115,7 +117,11 @@ document.addEventListener('DOMContentLoaded', function() {
                 center: 'title', 
                 right: '' // 기존 버튼 제거
             },
-            events: `/api/teams/${teamId}/schedule/detail`,
+            // 보이는 범위(start/end)는 FullCalendar가 붙여줌, 응답은 스트리밍 모드로 받음
+            events: {
+                url: `/api/teams/${teamId}/schedule/detail`,
+                extraParams: { stream: 1 },
+            },
             editable: true,
             timeZone: 'local',
             height: 'auto',
@@ -184,8 +190,36 @@ document.addEventListener('DOMContentLoaded', function() {
         deleteEventBtn.addEventListener('click', async () => {
             if (!currentEventId || currentEventType !== 'meeting') return;
 
+            const [type, id] = currentEventId.split('_');
+            const event = calendar.getEventById(currentEventId);
+
+            // 반복 회의: 이 회차만 취소할지 먼저 확인
+            if (event && event.extendedProps.recurring && confirm('이 회차만 취소하시겠습니까? (취소를 누르면 반복 일정 전체 삭제를 묻습니다)')) {
+                try {
+                    const response = await fetch(`/api/teams/${teamId}/schedule/${id}/occurrence`, {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json',
+                            'X-CSRFToken': getCookie('csrftoken')
+                        },
+                        body: JSON.stringify({ original_start: event.extendedProps.original_start, cancel: true })
+                    });
+                    const result = await response.json();
+                    if (result.success) {
+                        showToast(result.message, 'success');
+                        detailModal.classList.remove('active');
+                        calendar.refetchEvents();
+                    } else {
+                        showToast(`취소 실패: ${result.error || '알 수 없는 오류'}`, 'error');
+                    }
+                } catch (error) {
+                    console.error('회차 취소 오류:', error);
+                    showToast('오류가 발생했습니다.', 'error');
+                }
+                return;
+            }
+
             if (confirm('정말로 이 일정을 삭제하시겠습니까?')) {
-                const [type, id] = currentEventId.split('_');
                 const deleteUrl = `/api/teams/${teamId}/schedule/${id}/delete`;
 
                 try {
@@ -267,6 +301,13 @@ document.addEventListener('DOMContentLoaded', function() {
             start: document.getElementById('schedule-start').value,
             end: document.getElementById('schedule-end').value
         };
+        const repeat = document.getElementById('schedule-repeat').value;
+        if (repeat) {
+            formData.recurrence = {
+                freq: repeat,
+                until: document.getElementById('schedule-repeat-until').value || null
+            };
+        }
 
         try {
             const response = await fetch(`/api/teams/${teamId}/schedule/create`, {
@@ -299,6 +340,58 @@ document.addEventListener('DOMContentLoaded', function() {
     function initializeWhen2Meet() {
         if (!when2meetGrid || !saveVoteBtn) return;
         saveVoteBtn.addEventListener('click', saveVote);
+        connectPollSocket();
+    }
+
+    /**
+     * 일정 조율 실시간 연결 (팀원이 투표를 저장하면 바뀐 칸만 전달받음)
+     */
+    function connectPollSocket() {
+        const wsProtocol = window.location.protocol === 'https:' ? 'wss' : 'ws';
+        pollSocket = new WebSocket(`${wsProtocol}://${window.location.host}/ws/schedule/${teamId}/poll/`);
+
+        pollSocket.onmessage = function(e) {
+            const data = JSON.parse(e.data);
+            if (data.type === 'slot_counts_update') {
+                applySlotCountsUpdate(data);
+            }
+        };
+        pollSocket.onclose = function() {
+            // 연결이 끊기면 저장 후 mediate를 다시 불러오는 방식으로 동작
+            pollSocket = null;
+        };
+    }
+
+    function applySlotCountsUpdate(data) {
+        data.added.forEach(key => {
+            const entry = availabilityData[key] || (availabilityData[key] = { count: 0, users: [] });
+            entry.count += 1;
+            if (!entry.users.includes(data.voter)) entry.users.push(data.voter);
+            updateGridCell(key);
+        });
+        data.removed.forEach(key => {
+            const entry = availabilityData[key];
+            if (!entry) return;
+            entry.count -= 1;
+            entry.users = entry.users.filter(user => user !== data.voter);
+            if (entry.count <= 0) delete availabilityData[key];
+            updateGridCell(key);
+        });
+    }
+
+    function updateGridCell(key) {
+        const [day, slot] = key.split('-');
+        const cell = when2meetGrid.querySelector(`.grid-cell[data-day="${day}"][data-slot="${slot}"]`);
+        if (!cell) return;
+        const availability = availabilityData[key];
+        cell.style.backgroundColor = availability ? cellColor(availability.count) : '';
+        cell.dataset.users = availability ? availability.users.join(', ') : '';
+        cell.textContent = availability ? availability.count : '';
+    }
+
+    function cellColor(count) {
+        const intensity = Math.min(count / teamMembersCount, 1);
+        return `rgba(35, 131, 226, ${0.1 + intensity * 0.7})`;
     }
 
     /**
@@ -311,6 +404,7 @@ document.addEventListener('DOMContentLoaded', function() {
             
             availabilityData = data.availability;
             myVoteData = data.my_vote || {};
+            teamMembersCount = data.team_members_count || 1;
             
             renderWhen2MeetGrid(data);
             setupGridInteractions();
@@ -327,8 +421,10 @@ document.addEventListener('DOMContentLoaded', function() {
         const days = ['월', '화', '수', '목', '금', '토', '일'];
         const timeSlots = [];
         
-        for (let hour = 0; hour <= 24; hour++) {
-            timeSlots.push(`${hour.toString().padStart(2, '0')}00`);
+        // 30분 단위 칸 (서버의 schedule.availability 칸과 동일: 00:00 ~ 23:30)
+        for (let hour = 0; hour < 24; hour++) {
+            const hh = hour.toString().padStart(2, '0');
+            timeSlots.push(`${hh}00`, `${hh}30`);
         }
 
         let gridHTML = '';
@@ -341,7 +437,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
         timeSlots.forEach(timeSlot => {
             const hour = parseInt(timeSlot.substring(0, 2));
-            const displayTime = `${hour}:00`;
+            const displayTime = `${hour}:${timeSlot.substring(2)}`;
             
             gridHTML += `<div class="time-label">${displayTime}</div>`;
             
@@ -356,11 +452,9 @@ document.addEventListener('DOMContentLoaded', function() {
                 let dataUsers = '';
                 
                 if (availability) {
-                    const count = availability.count;
                     const users = availability.users || [];
-                    const intensity = Math.min(count / data.team_members_count, 1);
-                    
-                    cellStyle = `background-color: rgba(35, 131, 226, ${0.1 + intensity * 0.7});`;
+
+                    cellStyle = `background-color: ${cellColor(availability.count)};`;
                     dataUsers = users.join(', ');
                 }
                 
@@ -471,7 +565,10 @@ document.addEventListener('DOMContentLoaded', function() {
             const result = await response.json();
             if (result.success) {
                 showToast('시간이 저장되었습니다.', 'success');
-                loadWhen2MeetData();
+                // 실시간 연결이 있으면 내 변경도 바뀐 칸만 전달받으므로 다시 불러오지 않음
+                if (!pollSocket || pollSocket.readyState !== WebSocket.OPEN) {
+                    loadWhen2MeetData();
+                }
             } else {
                 showToast('저장에 실패했습니다.', 'error');
             }
@@ -18,21 +18,11 @@ document.addEventListener('DOMContentLoaded', function() {
         uploadBtn.addEventListener('click', () => fileInput.click());
     }
     
-    // 파일 선택 시 즉시 업로드
+    // 파일 선택 시 즉시 업로드 (여러 파일 선택 가능, 크기 제한은 서버에서 확인)
     fileInput.addEventListener('change', function(e) {
-        const files = e.target.files;
-        if (files.length > 0) {
-            const file = files[0];
-            
-            // 파일 크기 제한 (50MB)
-            if (file.size > 50 * 1024 * 1024) {
-                showErrorMessage('파일 크기가 50MB를 초과할 수 없습니다.');
-                fileInput.value = ''; // 파일 선택 초기화
-            return;
-        }
-
-            uploadFile(file);
-        }
+        const files = Array.from(e.target.files);
+        fileInput.value = ''; // 같은 파일을 다시 선택할 수 있도록 초기화
+        files.forEach(file => uploadFile(file));
     });
 
 
@@ -52,36 +42,86 @@ document.addEventListener('DOMContentLoaded', function() {
 
 
     /**
-     * 파일 업로드 처리
+     * 파일 업로드 처리 (청크 업로드)
+     * - 파일을 서버가 정한 chunk_size로 잘라 PARALLEL_CHUNKS개씩 동시에 PUT
+     * - 업로드 ID를 localStorage에 저장해 두고, 새로고침/네트워크 오류 뒤 같은 파일을 다시 선택하면
+     *   서버가 받은 청크 목록을 확인해서 나머지만 전송
      */
+    const PARALLEL_CHUNKS = 3;
+    const CHUNK_RETRIES = 3;
+
     async function uploadFile(file) {
         if (!file) return;
 
-        const formData = new FormData();
-        formData.append('file', file);
-        
+        const resumeKey = `teamflow-upload:${teamId}:${file.name}:${file.size}:${file.lastModified}`;
         try {
-            const response = await fetch(`/api/teams/${teamId}/files/upload`, {
-                method: 'POST',
-                headers: {
-                    'X-CSRFToken': getCookie('csrftoken'),
-                },
-                body: formData,
+            let upload = await resumeUpload(localStorage.getItem(resumeKey));
+            if (!upload) {
+                upload = await uploadRequest('POST', `/api/teams/${teamId}/files/uploads`, {
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ filename: file.name, size: file.size }),
+                });
+                localStorage.setItem(resumeKey, upload.upload_id);
+            }
+
+            const received = new Set(upload.received);
+            const pending = [];
+            for (let index = 0; index < upload.chunk_count; index++) {
+                if (!received.has(index)) pending.push(index);
+            }
+
+            const workers = Array.from({ length: Math.min(PARALLEL_CHUNKS, pending.length) }, async () => {
+                while (pending.length > 0) {
+                    await putChunk(upload, file, pending.shift());
+                }
             });
+            await Promise.all(workers);
 
-            const result = await response.json();
+            const fileData = await uploadRequest('POST', `/api/uploads/${upload.upload_id}/complete`);
+            localStorage.removeItem(resumeKey);
+            showSuccessMessage('파일이 업로드되었습니다.');
+            addFileToList(fileData);
+        } catch (error) {
+            showErrorMessage('업로드 실패: ' + error.message);
+        }
+    }
 
-            if (result.success) {
-                showSuccessMessage('파일이 업로드되었습니다.');
-                addFileToList(result.data);
-            } else {
-                showErrorMessage('업로드 실패: ' + result.error);
-            }
+    async function resumeUpload(uploadId) {
+        if (!uploadId) return null;
+        try {
+            return await uploadRequest('GET', `/api/uploads/${uploadId}`);
         } catch (error) {
-            showErrorMessage('오류 발생: ' + error.message);
-        } finally {
-            fileInput.value = ''; // 항상 파일 input 초기화
+            return null; // 만료되었거나 이미 완료된 업로드 → 새로 시작
+        }
+    }
+
+    async function putChunk(upload, file, index) {
+        const offset = index * upload.chunk_size;
+        const chunk = file.slice(offset, offset + upload.chunk_size);
+        for (let attempt = 1; ; attempt++) {
+            try {
+                return await uploadRequest('PUT', `/api/uploads/${upload.upload_id}?offset=${offset}`, {
+                    headers: { 'Content-Type': 'application/octet-stream' },
+                    body: chunk,
+                });
+            } catch (error) {
+                if (attempt >= CHUNK_RETRIES) throw error;
+                await new Promise(resolve => setTimeout(resolve, 1000 * attempt));
+            }
+        }
+    }
+
+    async function uploadRequest(method, url, options = {}) {
+        const response = await fetch(url, {
+            method,
+            ...options,
+            headers: { 'X-CSRFToken': getCookie('csrftoken'), ...(options.headers || {}) },
+        });
+        const result = await response.json();
+        if (!result.success) {
+            throw new Error(result.error);
         }
+        return result.data;
     }
 
     /**
@@ -202,8 +202,8 @@ document.addEventListener('DOMContentLoaded', async function() {
 
             if (!response.ok) throw new Error('업데이트 실패');
 
-            // 서버 반영된 상태로 목록 다시 불러오기
-            await loadTasks();
+            // 서버 반영된 상태로 목록 갱신 (변경분만)
+            await syncTasks();
 
         } catch (error) {
             console.error('체크박스 상태 업데이트 오류:', error);
@@ -231,7 +231,7 @@ document.addEventListener('DOMContentLoaded', async function() {
             if (response.status === 204 || response.ok) {
                 taskItem.remove();
                 showNotification('작업이 삭제되었습니다.', 'success');
-                setTimeout(() => loadTasks(), 300);
+                setTimeout(() => syncTasks(), 300);
             } else {
                 throw new Error('작업 삭제 실패');
             }
@@ -289,11 +289,11 @@ document.addEventListener('DOMContentLoaded', async function() {
 
             if (response.status === 204) {
                 closeModal();
-                await loadTasks();
+                await syncTasks();
             } else if (response.ok) {
                 try { await response.json(); } catch {}
                 closeModal();
-                await loadTasks();
+                await syncTasks();
             } else {
                 let errorData = null;
                 try { errorData = await response.json(); } catch {}
@@ -397,6 +397,12 @@ function showNotification(message, type = 'info') {
     }, 3000);
 }
 
+// 목록별 다음 페이지 커서 (서버 커서 페이지네이션)
+const taskListCursors = { team: null, personal: null };
+// 현재 화면에 불러온 작업 목록 + 마지막 동기화 토큰 (delta 동기화)
+const taskListState = { team: [], personal: [] };
+let taskSyncToken = null;
+
 async function loadTasks() {
     try {
         const response = await fetch(`/api/dashboard/${window.currentTeamId}/tasks/list/`, {
@@ -410,8 +416,14 @@ async function loadTasks() {
 
         const data = await response.json();
 
+        taskListState.team = data.team_tasks;
+        taskListState.personal = data.personal_tasks;
+        taskSyncToken = data.sync_token || null;
+
         renderTaskList('team', data.team_tasks);
         renderTaskList('personal', data.personal_tasks);
+        setTaskListCursor('team', data.team_tasks_next);
+        setTaskListCursor('personal', data.personal_tasks_next);
 
     } catch (error) {
         console.error('작업 목록 갱신 오류:', error);
@@ -419,11 +431,117 @@ async function loadTasks() {
     }
 }
 
-function renderTaskList(type, tasks) {
+// 작업 생성/수정/삭제 후: 마지막 동기화 이후 변경분만 받아 목록에 반영
+// (토큰이 없거나 만료되었거나 실패하면 전체 다시 불러오기)
+async function syncTasks() {
+    if (!taskSyncToken) return loadTasks();
+
+    try {
+        const params = new URLSearchParams({ since: taskSyncToken });
+        const response = await fetch(`/api/dashboard/${window.currentTeamId}/tasks/list/?${params}`, {
+            method: 'GET',
+            headers: {
+                'X-CSRFToken': getCsrfToken()
+            }
+        });
+
+        if (!response.ok) throw new Error('작업 동기화 실패');
+
+        const data = await response.json();
+        if (data.reset) return loadTasks();
+
+        const changedIds = new Set([
+            ...data.team_tasks.map(task => task.id),
+            ...data.personal_tasks.map(task => task.id),
+            ...data.deleted_ids,
+        ]);
+        ['team', 'personal'].forEach(type => {
+            // 아직 불러오지 않은 페이지에 속하는 작업은 "더 보기"에서 불러오도록 제외
+            const loaded = taskListState[type];
+            const boundary = taskListCursors[type] && loaded.length ? loaded[loaded.length - 1] : null;
+
+            const merged = loaded
+                .filter(task => !changedIds.has(task.id))
+                .concat(data[`${type}_tasks`])
+                .filter(task => !boundary || compareTasks(task, boundary) <= 0)
+                .sort(compareTasks);
+
+            taskListState[type] = merged;
+            renderTaskList(type, merged);
+            setTaskListCursor(type, taskListCursors[type]);
+        });
+        taskSyncToken = data.sync_token;
+
+    } catch (error) {
+        console.error('작업 동기화 오류:', error);
+        await loadTasks();
+    }
+}
+
+// 서버 정렬 순서와 동일: 마감일(없으면 맨 앞) → 생성 시각 → id
+function compareTasks(a, b) {
+    if (a.due_date !== b.due_date) {
+        if (!a.due_date) return -1;
+        if (!b.due_date) return 1;
+        return a.due_date < b.due_date ? -1 : 1;
+    }
+    const createdDiff = new Date(a.created_at) - new Date(b.created_at);
+    if (createdDiff) return createdDiff;
+    return a.id - b.id;
+}
+
+// "더 보기": 해당 목록의 다음 페이지를 불러와 뒤에 추가
+async function loadMoreTasks(type) {
+    const cursor = taskListCursors[type];
+    if (!cursor) return;
+
+    try {
+        const params = new URLSearchParams({ [`${type}_tasks_cursor`]: cursor });
+        const response = await fetch(`/api/dashboard/${window.currentTeamId}/tasks/list/?${params}`, {
+            method: 'GET',
+            headers: {
+                'X-CSRFToken': getCsrfToken()
+            }
+        });
+
+        if (!response.ok) throw new Error('작업 더 불러오기 실패');
+
+        const data = await response.json();
+
+        taskListState[type] = taskListState[type].concat(data[`${type}_tasks`]);
+        renderTaskList(type, data[`${type}_tasks`], true);
+        setTaskListCursor(type, data[`${type}_tasks_next`]);
+
+    } catch (error) {
+        console.error('작업 더 불러오기 오류:', error);
+        showNotification('작업을 더 불러오지 못했습니다.', 'error');
+    }
+}
+
+function setTaskListCursor(type, cursor) {
+    taskListCursors[type] = cursor || null;
+
+    const container = document.querySelector(`#${type}-tasks .task-list`);
+    let button = container.parentElement.querySelector('.task-load-more');
+    if (!cursor) {
+        button?.remove();
+        return;
+    }
+    if (!button) {
+        button = document.createElement('button');
+        button.type = 'button';
+        button.className = 'btn btn-secondary task-load-more';
+        button.textContent = '더 보기';
+        button.addEventListener('click', () => loadMoreTasks(type));
+        container.after(button);
+    }
+}
+
+function renderTaskList(type, tasks, append = false) {
     const container = document.querySelector(`#${type}-tasks .task-list`);
-    container.innerHTML = ''; // 기존 목록 비우기
+    if (!append) container.innerHTML = ''; // 기존 목록 비우기
 
-    if (!tasks.length) {
+    if (!append && !tasks.length) {
         container.innerHTML = `<div class="empty-state"><p>${type === 'team' ? '팀 작업이 없습니다.' : '개인 작업이 없습니다.'}</p></div>`;
         return;
     }
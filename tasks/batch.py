@@ -0,0 +1,184 @@
+# tasks/batch.py
+
+# ========================================
+# 작업 일괄 처리 (POST /api/dashboard/<team_id>/tasks/batch/)
+# 요청: {"operations": [
+#     {"op": "create", "data": {...}},
+#     {"op": "update", "id": 3, "data": {...}},
+#     {"op": "status", "id": 4, "status": "completed"},
+#     {"op": "delete", "id": 5}
+# ]}
+# - 전체를 먼저 검증하고, 하나라도 실패하면 아무것도 반영하지 않음 (항목별 오류 반환)
+# - 반영은 트랜잭션 하나에서 bulk_create / bulk_update / 담당자 through 테이블 일괄 insert로 처리
+# - bulk 처리는 signal이 발생하지 않으므로 TaskAssignment 동기화, updated_at, 팀 버전 갱신을 직접 처리
+#   (삭제는 QuerySet.delete()라 post_delete signal로 삭제 기록/팀 버전이 처리됨)
+# ========================================
+import json
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from teams.versioning import bump_team_version
+from .models import Task, TaskAssignment
+from .serializers import TaskSerializer, serialize_task_rows, task_rows
+
+MAX_BATCH_SIZE = 200
+OPERATIONS = ('create', 'update', 'status', 'delete')
+
+
+class BatchError(ValueError):
+    """요청 전체가 잘못된 경우 (항목별 오류는 결과 목록으로 반환)"""
+
+
+def _parse_assignees(value):
+    # 단건 API와 같이 JSON 문자열도 허용
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return None
+    if not isinstance(value, list) or not all(isinstance(v, int) for v in value):
+        return None
+    return value
+
+
+def _validate(team, user, operations):
+    """
+    각 항목 검증 → (계획 목록, 오류 dict {index: errors})
+    계획: {'op', 'task', 'fields', 'assignees'}
+    """
+    operations = [op if isinstance(op, dict) else {} for op in operations]
+    task_ids = {op.get('id') for op in operations if isinstance(op.get('id'), int)}
+    tasks = Task.objects.filter(team=team, id__in=task_ids).in_bulk()
+    deleted_ids = {op['id'] for op in operations if op.get('op') == 'delete' and op.get('id') in tasks}
+
+    plans, errors, assignee_ids = [], {}, set()
+    for index, op in enumerate(operations):
+        kind = op.get('op')
+        if kind not in OPERATIONS:
+            errors[index] = {'op': [f"op는 {', '.join(OPERATIONS)} 중 하나여야 합니다."]}
+            continue
+
+        task = None
+        if kind != 'create':
+            task = tasks.get(op.get('id')) if isinstance(op.get('id'), int) else None
+            if task is None:
+                errors[index] = {'id': ['작업을 찾을 수 없습니다.']}
+                continue
+            if kind != 'delete' and task.id in deleted_ids:
+                errors[index] = {'id': ['같은 요청에서 삭제되는 작업입니다.']}
+                continue
+
+        plan = {'op': kind, 'task': task, 'fields': {}, 'assignees': None}
+        if kind == 'status':
+            if op.get('status') not in dict(Task.STATUS_CHOICES):
+                errors[index] = {'status': ['올바르지 않은 상태입니다.']}
+                continue
+            plan['fields'] = {'status': op['status']}
+
+        elif kind in ('create', 'update'):
+            data = dict(op.get('data') or {})
+            if 'assignees' in data:
+                plan['assignees'] = _parse_assignees(data.pop('assignees'))
+                if plan['assignees'] is None:
+                    errors[index] = {'assignees': ['사용자 ID 목록이어야 합니다.']}
+                    continue
+                assignee_ids.update(plan['assignees'])
+            if kind == 'create':
+                # TaskCreateView와 같은 기본값 (개인 작업은 본인 담당)
+                data['team'] = team.id
+                if data.get('type') == 'personal':
+                    data['assignee'] = user.id
+                serializer = TaskSerializer(data=data)
+            else:
+                data.pop('team', None)
+                serializer = TaskSerializer(task, data=data, partial=True)
+            if not serializer.is_valid():
+                errors[index] = serializer.errors
+                continue
+            plan['fields'] = serializer.validated_data
+            plan['fields'].pop('assignees', None)
+
+        plans.append((index, plan))
+
+    # 공동 담당자 ID는 쿼리 한 번으로 확인
+    known = set(User.objects.filter(id__in=assignee_ids).values_list('id', flat=True))
+    for index, plan in plans:
+        unknown = set(plan['assignees'] or ()) - known
+        if unknown:
+            errors[index] = {'assignees': [f'존재하지 않는 사용자입니다: {sorted(unknown)}']}
+    return [(index, plan) for index, plan in plans if index not in errors], errors
+
+
+def apply_batch(team, user, operations):
+    """
+    일괄 처리 실행 → (성공 여부, 항목별 결과 목록)
+    실패 시 아무것도 반영하지 않고 오류가 있는 항목만 ok: False
+    """
+    if not isinstance(operations, list) or not operations:
+        raise BatchError('operations 목록이 필요합니다.')
+    if len(operations) > MAX_BATCH_SIZE:
+        raise BatchError(f'한 번에 최대 {MAX_BATCH_SIZE}개까지 처리할 수 있습니다.')
+
+    plans, errors = _validate(team, user, operations)
+    if errors:
+        results = [
+            {'index': index, 'ok': index not in errors, **({'errors': errors[index]} if index in errors else {})}
+            for index in range(len(operations))
+        ]
+        return False, results
+
+    now = timezone.now()
+    with transaction.atomic():
+        # 생성
+        created = [Task(**plan['fields']) for _, plan in plans if plan['op'] == 'create']
+        Task.objects.bulk_create(created)
+        created_iter = iter(created)
+        for _, plan in plans:
+            if plan['op'] == 'create':
+                plan['task'] = next(created_iter)
+
+        # 수정 / 상태 변경 (같은 작업이 여러 번 나오면 같은 인스턴스에 차례로 반영)
+        updated, update_fields = {}, {'updated_at'}
+        for _, plan in plans:
+            if plan['op'] in ('update', 'status'):
+                for field, value in plan['fields'].items():
+                    setattr(plan['task'], field, value)
+                    update_fields.add(field)
+                plan['task'].updated_at = now
+                updated[plan['task'].id] = plan['task']
+        if updated:
+            Task.objects.bulk_update(updated.values(), sorted(update_fields))
+
+        # 공동 담당자: 지정된 작업의 기존 행 삭제 후 through 테이블에 한 번에 insert
+        Through = Task.assignees.through
+        replaced = {plan['task'].id: plan['assignees'] for _, plan in plans if plan['assignees'] is not None}
+        if replaced:
+            Through.objects.filter(task_id__in=replaced).delete()
+            Through.objects.bulk_create([
+                Through(task_id=task_id, user_id=user_id)
+                for task_id, user_ids in replaced.items() for user_id in dict.fromkeys(user_ids)
+            ])
+
+        # 삭제 (post_delete signal로 삭제 기록 / 팀 버전 처리)
+        deleted_ids = [plan['task'].id for _, plan in plans if plan['op'] == 'delete']
+        if deleted_ids:
+            Task.objects.filter(id__in=deleted_ids).delete()
+
+        changed = created + list(updated.values())
+        if changed:
+            TaskAssignment.sync_for_tasks(changed)
+            bump_team_version(team.id)  # 커밋 후에 올라감
+
+    serialized = {
+        task['id']: task
+        for task in serialize_task_rows(task_rows(Task.objects.filter(id__in=[t.id for t in changed])))
+    }
+    results = []
+    for index, plan in plans:
+        result = {'index': index, 'ok': True, 'op': plan['op'], 'id': plan['task'].id}
+        if plan['op'] != 'delete':
+            result['task'] = serialized[plan['task'].id]
+        results.append(result)
+    return True, results
@@ -0,0 +1,70 @@
+# ========================================
+# 작업 목록 직렬화 속도 비교 (TaskSerializer vs serialize_task_rows)
+# 사용법:
+#   python manage.py benchmark_task_serialization                 # 1,000 / 10,000개
+#   python manage.py benchmark_task_serialization --sizes 500 5000 --repeat 5
+# 임시 데이터를 만들어 측정 후 롤백, 쿼리 시간까지 포함한 전체 시간(최솟값) 출력
+# ========================================
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from teams.models import Team
+from tasks.models import Task
+from tasks.pagination import TASK_ORDERING
+from tasks.serializers import TaskSerializer, serialize_task_rows, task_rows
+
+
+class Command(BaseCommand):
+    help = '작업 목록 직렬화 경로(TaskSerializer / values_list 빠른 경로)의 처리 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000], help='작업 수 목록')
+        parser.add_argument('--repeat', type=int, default=3, help='크기별 반복 횟수 (최솟값 사용)')
+
+    def handle(self, *args, **options):
+        paths = [
+            ('TaskSerializer', lambda tasks: TaskSerializer(tasks.with_people(), many=True).data),
+            ('serialize_task_rows', lambda tasks: serialize_task_rows(task_rows(tasks))),
+        ]
+        for size in options['sizes']:
+            with transaction.atomic():
+                tasks = self.seed(size)
+                self.stdout.write(self.style.MIGRATE_HEADING(f'\n[작업 {size:,}개]'))
+
+                outputs, timings = [], []
+                for name, serialize in paths:
+                    best = None
+                    for _ in range(options['repeat']):
+                        started = time.perf_counter()
+                        output = JSONRenderer().render(serialize(tasks))
+                        elapsed = time.perf_counter() - started
+                        best = elapsed if best is None else min(best, elapsed)
+                    outputs.append(output)
+                    timings.append(best)
+                    self.stdout.write(f'  {name:<22}{best * 1000:>10.1f} ms')
+
+                self.stdout.write(f'  속도 향상: {timings[0] / timings[1]:.1f}배')
+                if outputs[0] != outputs[1]:
+                    self.stdout.write(self.style.ERROR('  ! 두 경로의 JSON 결과가 다릅니다.'))
+                transaction.set_rollback(True)
+
+    def seed(self, size):
+        """담당자/공동 담당자가 섞인 작업 생성 (handle에서 롤백됨)"""
+        users = [User.objects.create_user(username=f'bench_user_{i}', first_name=f'사용자{i}') for i in range(10)]
+        team = Team.objects.create(name='bench_team', owner=users[0], invite_code='BENCH0')
+        tasks = Task.objects.bulk_create([
+            Task(name=f'작업 {i}', description='설명' * (i % 5), team=team,
+                 assignee=users[i % len(users)] if i % 4 else None,
+                 type='team' if i % 3 else 'personal')
+            for i in range(size)
+        ])
+        Through = Task.assignees.through
+        Through.objects.bulk_create([
+            Through(task_id=task.id, user_id=users[(i + offset) % len(users)].id)
+            for i, task in enumerate(tasks) for offset in range(i % 3)
+        ])
+        return Task.objects.filter(team=team).order_by(*TASK_ORDERING)
@@ -0,0 +1,17 @@
+# ========================================
+# 보관 기간(TOMBSTONE_RETENTION)이 지난 작업 삭제 기록 정리
+# 사용법 (cron 등으로 하루 한 번 정도 실행):
+#   python manage.py prune_task_tombstones
+# 정리된 기록보다 오래된 sync_token은 어차피 reset 처리되므로 언제 실행해도 동기화 결과는 같음
+# ========================================
+from django.core.management.base import BaseCommand
+
+from tasks.sync import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = '보관 기간이 지난 작업 삭제 기록(TaskTombstone)을 정리합니다.'
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones()
+        self.stdout.write(self.style.SUCCESS(f'삭제 기록 {deleted:,}개를 정리했습니다.'))
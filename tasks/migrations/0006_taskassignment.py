@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_task_assignments(apps, schema_editor):
+    """기존 assignee / assignees 데이터를 TaskAssignment로 복사"""
+    Task = apps.get_model('tasks', 'Task')
+    TaskAssignment = apps.get_model('tasks', 'TaskAssignment')
+    AssigneeLink = Task.assignees.through
+
+    tasks = {
+        task['id']: task
+        for task in Task.objects.values('id', 'assignee_id', 'team_id', 'status', 'due_date')
+    }
+    pairs = {(task_id, task['assignee_id']) for task_id, task in tasks.items() if task['assignee_id']}
+    pairs.update(AssigneeLink.objects.values_list('task_id', 'user_id'))
+
+    TaskAssignment.objects.bulk_create([
+        TaskAssignment(
+            task_id=task_id, user_id=user_id, team_id=tasks[task_id]['team_id'],
+            status=tasks[task_id]['status'], due_date=tasks[task_id]['due_date'],
+        )
+        for task_id, user_id in pairs
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_assignees'),
+        ('teams', '0003_team_ai_roles_assigned'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', '대기중'), ('in_progress', '진행중'), ('completed', '완료')], default='pending', max_length=20)),
+                ('due_date', models.DateField(blank=True, null=True)),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='tasks.task')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_assignments', to='teams.team')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_assignments', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'team', 'status', 'due_date'], name='taskassign_user_team_idx')],
+                'unique_together': {('task', 'user')},
+            },
+        ),
+        migrations.RunPython(backfill_task_assignments, migrations.RunPython.noop),
+    ]
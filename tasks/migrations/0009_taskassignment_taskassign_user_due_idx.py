@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_tasktombstone'),
+        ('teams', '0003_team_ai_roles_assigned'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='taskassignment',
+            index=models.Index(fields=['user', 'team', 'due_date'], name='taskassign_user_due_idx'),
+        ),
+    ]
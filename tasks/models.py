@@ -6,6 +6,70 @@ from django.contrib.auth.models import User
 from teams.models import Team
 from datetime import date, timedelta
 
+
+# ========================================
+# 마감 긴급도 분류 (기준은 여기서만 정의)
+# - completed: 완료된 작업
+# - overdue:   마감일이 지난 작업
+# - imminent:  오늘 ~ DEADLINE_IMMINENT_DAYS일 뒤까지 마감
+# - normal:    그 이후 마감
+# - no_due:    마감일 없음
+# TaskQuerySet.with_urgency()로 SQL(CASE WHEN)에서 계산 → 인스턴스 없이 필터/집계/정렬 가능
+# ========================================
+DEADLINE_IMMINENT_DAYS = 1
+
+URGENCY_COMPLETED = 'completed'
+URGENCY_OVERDUE = 'overdue'
+URGENCY_IMMINENT = 'imminent'
+URGENCY_NORMAL = 'normal'
+URGENCY_NO_DUE = 'no_due'
+
+# 마감 임박 알림 수에 포함되는 분류 (지난 미완료 작업도 포함)
+URGENCY_NEEDS_ATTENTION = (URGENCY_OVERDUE, URGENCY_IMMINENT)
+# 긴급한 순서 (urgency_rank 정렬용)
+URGENCY_ORDER = (URGENCY_OVERDUE, URGENCY_IMMINENT, URGENCY_NORMAL, URGENCY_NO_DUE, URGENCY_COMPLETED)
+
+
+def urgency_expression(today=None):
+    """작업의 긴급도 분류 CASE 식 (기준일 today, 기본은 오늘)"""
+    today = today or date.today()
+    return models.Case(
+        models.When(status='completed', then=models.Value(URGENCY_COMPLETED)),
+        models.When(due_date__isnull=True, then=models.Value(URGENCY_NO_DUE)),
+        models.When(due_date__lt=today, then=models.Value(URGENCY_OVERDUE)),
+        models.When(due_date__lte=today + timedelta(days=DEADLINE_IMMINENT_DAYS), then=models.Value(URGENCY_IMMINENT)),
+        default=models.Value(URGENCY_NORMAL),
+        output_field=models.CharField(),
+    )
+
+
+def urgency_rank_expression():
+    """긴급도 정렬 순위 (0이 가장 긴급)"""
+    return models.Case(
+        *[models.When(urgency=urgency, then=models.Value(rank)) for rank, urgency in enumerate(URGENCY_ORDER)],
+        output_field=models.IntegerField(),
+    )
+
+
+# ========================================
+# 작업 목록 조회용 QuerySet
+# with_people(): 담당자(assignee)는 JOIN, 공동 담당자(assignees)는 prefetch로 한 번에 불러옴
+# → TaskSerializer(assignee_name, assignees, assignees_names)와 템플릿의 task.assignee 접근이
+#   작업 수와 관계없이 쿼리 2번으로 끝남 (목록을 반환/렌더링하는 곳에서는 항상 사용)
+# 공동 담당자는 id 순 (tasks.serializers.serialize_task_rows와 같은 순서)
+# ========================================
+class TaskQuerySet(models.QuerySet):
+    def with_people(self):
+        people = User.objects.only('id', 'username', 'first_name').order_by('id')
+        return self.select_related('assignee').prefetch_related(
+            models.Prefetch('assignees', queryset=people)
+        )
+
+    def with_urgency(self, today=None):
+        """urgency(긴급도 분류)와 urgency_rank(정렬 순위) 주석 추가"""
+        return self.annotate(urgency=urgency_expression(today)).annotate(urgency_rank=urgency_rank_expression())
+
+
 class Task(models.Model):
     TASK_TYPES = (
         ('team', '팀 작업'),
@@ -33,20 +97,108 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         ordering = ['due_date', 'created_at']
+        indexes = [
+            # 팀/개인 작업 목록 (Meta.ordering 순서)
+            models.Index(fields=['team', 'type', 'due_date', 'created_at'], name='task_team_type_due_idx'),
+            # 상태/마감일 필터 (진행률, 마감 임박)
+            models.Index(fields=['team', 'type', 'status', 'due_date'], name='task_team_type_status_idx'),
+            # 대시보드/팀 로그 최신순
+            models.Index(fields=['team', 'created_at'], name='task_team_created_idx'),
+        ]
 
     def __str__(self):
         return self.name
     
     @property
     def is_deadline_imminent(self):
-        """마감 임박 여부 확인 (당일 또는 전날 마감)"""
+        """마감 임박 여부 확인 (with_urgency()의 imminent와 같은 기준, 이미 불러온 인스턴스용)"""
         if not self.due_date or self.status == 'completed':
             return False
         
         today = date.today()
-        tomorrow = today + timedelta(days=1)
-        
-        return self.due_date == today or self.due_date == tomorrow
+        return today <= self.due_date <= today + timedelta(days=DEADLINE_IMMINENT_DAYS)
 # ========================================
+
+
+# ========================================
+# 담당자 통합 테이블
+# 기존 단일 assignee와 공동 담당자 assignees를 한 테이블로 모아 "내 작업" 조회를 인덱스 하나로 처리
+# (assignee OR assignees JOIN + DISTINCT 대신 사용)
+# team/status/due_date는 조회용으로 Task 값을 복사해 둠 (tasks/signals.py에서 동기화)
+# ========================================
+class TaskAssignment(models.Model):
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='assignments')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='task_assignments')
+    team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='task_assignments')
+    status = models.CharField(max_length=20, choices=Task.STATUS_CHOICES, default='pending')
+    due_date = models.DateField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ('task', 'user')
+        indexes = [
+            models.Index(fields=['user', 'team', 'status', 'due_date'], name='taskassign_user_team_idx'),
+            # 캘린더 보이는 범위의 내 작업 (마감일 범위)
+            models.Index(fields=['user', 'team', 'due_date'], name='taskassign_user_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.task}"
+
+    @classmethod
+    def sync_for_task(cls, task):
+        """작업의 담당자(assignee + assignees)와 상태/마감일을 통합 테이블에 반영"""
+        user_ids = set(task.assignees.values_list('id', flat=True))
+        if task.assignee_id:
+            user_ids.add(task.assignee_id)
+
+        assignments = cls.objects.filter(task=task)
+        assignments.exclude(user_id__in=user_ids).delete()
+        assignments.update(team_id=task.team_id, status=task.status, due_date=task.due_date)
+
+        existing = set(assignments.values_list('user_id', flat=True))
+        cls.objects.bulk_create([
+            cls(task=task, user_id=user_id, team_id=task.team_id, status=task.status, due_date=task.due_date)
+            for user_id in user_ids - existing
+        ])
+
+    @classmethod
+    def sync_for_tasks(cls, tasks):
+        """
+        여러 작업을 한 번에 반영 (bulk_create/bulk_update처럼 signal이 발생하지 않는 일괄 처리용)
+        기존 행을 지우고 다시 만드는 방식이라 작업 수와 관계없이 쿼리 3번
+        """
+        tasks = list(tasks)
+        user_ids = {task.id: {task.assignee_id} - {None} for task in tasks}
+        through = Task.assignees.through.objects.filter(task_id__in=user_ids)
+        for task_id, user_id in through.values_list('task_id', 'user_id'):
+            user_ids[task_id].add(user_id)
+
+        cls.objects.filter(task_id__in=user_ids).delete()
+        cls.objects.bulk_create([
+            cls(task_id=task.id, user_id=user_id, team_id=task.team_id, status=task.status, due_date=task.due_date)
+            for task in tasks for user_id in user_ids[task.id]
+        ])
+
+
+# ========================================
+# 삭제된 작업 기록 (delta 동기화용)
+# 작업 목록 API의 ?since= 요청에 "그 이후 삭제된 작업 ID"를 알려주기 위해 남김
+# 팀 삭제로 함께 지워지는 작업도 기록되므로 팀은 FK가 아닌 ID로만 저장
+# ========================================
+class TaskTombstone(models.Model):
+    task_id = models.BigIntegerField()
+    team_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['team_id', 'deleted_at'], name='tasktomb_team_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f"deleted task {self.task_id}"
+
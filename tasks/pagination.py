@@ -0,0 +1,83 @@
+# tasks/pagination.py
+
+# ========================================
+# 작업 목록 커서(keyset) 페이지네이션
+# - 정렬 기준: (due_date, created_at, id) = Task.Meta.ordering + id
+#   (due_date가 없는 작업이 먼저 오도록 NULL을 앞에 둠)
+# - 커서는 마지막 작업의 정렬 값을 base64로 인코딩한 문자열 (클라이언트는 그대로 돌려보내기만 함)
+# - OFFSET 없이 인덱스(team, type, due_date, created_at)에서 바로 다음 위치를 찾으므로
+#   몇 번째 페이지든 작업 수와 관계없이 같은 속도
+# ========================================
+import base64
+import json
+from datetime import date, datetime
+
+from django.db.models import F, Q
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+TASK_ORDERING = (F('due_date').asc(nulls_first=True), 'created_at', 'id')
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(task):
+    """작업의 정렬 값으로 커서 문자열 생성"""
+    position = [
+        task.due_date.isoformat() if task.due_date else None,
+        task.created_at.isoformat(),
+        task.id,
+    ]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 (due_date, created_at, id)로 변환 (잘못된 값이면 InvalidCursor)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        due_date, created_at, task_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (
+            date.fromisoformat(due_date) if due_date else None,
+            datetime.fromisoformat(created_at),
+            int(task_id),
+        )
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise InvalidCursor('잘못된 커서입니다.')
+
+
+def _after(due_date, created_at, task_id):
+    """정렬 순서상 (due_date, created_at, id) 다음에 오는 작업 조건"""
+    same_due_date_after = Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=task_id)
+    if due_date is None:
+        # NULL 마감일 구간의 나머지 + 마감일이 있는 모든 작업
+        return (Q(due_date__isnull=True) & same_due_date_after) | Q(due_date__isnull=False)
+    # 앞의 due_date >= 조건은 인덱스 범위 탐색(seek)에 쓰이도록 따로 둠
+    return Q(due_date__gte=due_date) & (Q(due_date__gt=due_date) | (Q(due_date=due_date) & same_due_date_after))
+
+
+def parse_page_size(value):
+    """limit 쿼리 파라미터 → 페이지 크기 (1 ~ MAX_PAGE_SIZE)"""
+    try:
+        return max(1, min(int(value), MAX_PAGE_SIZE))
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+
+
+def paginate_tasks(queryset, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    작업 QuerySet에서 cursor 다음 page_size개를 가져옴
+    반환: (작업 리스트, 다음 페이지 커서 또는 None)
+    """
+    queryset = queryset.order_by(*TASK_ORDERING)
+    if cursor:
+        queryset = queryset.filter(_after(*decode_cursor(cursor)))
+
+    # 한 개 더 가져와서 다음 페이지 존재 여부 확인
+    tasks = list(queryset[:page_size + 1])
+    if len(tasks) <= page_size:
+        return tasks, None
+    tasks = tasks[:page_size]
+    return tasks, encode_cursor(tasks[-1])
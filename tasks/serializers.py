@@ -23,3 +23,83 @@ class TaskSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'team', 'assignee', 'assignee_name', 'assignees', 'assignees_names', 'type', 'status', 'due_date', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at', 'assignee_name', 'assignees_names']
 # ========================================
+
+
+# ========================================
+# 읽기 전용 작업 목록 빠른 직렬화
+# 작업 수백 개를 TaskSerializer로 직렬화하면 필드 객체 생성/호출 비용이 대부분을 차지함
+# → values_list로 튜플만 가져오고(task_rows), 담당자 이름은 through 테이블에서 한 번에 모아
+#   TaskSerializer와 같은 dict를 만듦 (serialize_task_rows)
+# TaskSerializer.Meta.fields가 바뀌면 TASK_FIELD_PLAN도 함께 수정 (tasks/tests.py에서 동일성 확인)
+# ========================================
+from collections import defaultdict
+
+_date_field = serializers.DateField()
+_datetime_field = serializers.DateTimeField()
+
+# (응답 키, values_list 컬럼, 변환 함수)
+TASK_FIELD_PLAN = (
+    ('id', 'id', None),
+    ('name', 'name', None),
+    ('description', 'description', None),
+    ('team', 'team_id', None),
+    ('assignee', 'assignee_id', None),
+    ('assignee_name', 'assignee__first_name', None),
+    ('assignees', None, None),
+    ('assignees_names', None, None),
+    ('type', 'type', None),
+    ('status', 'status', None),
+    ('due_date', 'due_date', _date_field.to_representation),
+    ('created_at', 'created_at', _datetime_field.to_representation),
+    ('updated_at', 'updated_at', _datetime_field.to_representation),
+)
+# 정렬/커서 계산에 필요한 컬럼(id, due_date, created_at)은 이름 그대로 둠 → tasks.pagination과 호환
+TASK_ROW_COLUMNS = tuple(column for _, column, _ in TASK_FIELD_PLAN if column)
+
+
+def task_rows(queryset):
+    """작업 QuerySet → 빠른 직렬화용 namedtuple 행 QuerySet (모델 인스턴스 생성 없음)"""
+    return queryset.values_list(*TASK_ROW_COLUMNS, named=True)
+
+
+def _compile_row_plan():
+    """TASK_FIELD_PLAN → (응답 키, 행 인덱스 또는 None, 변환 함수) 목록"""
+    plan, index = [], 0
+    for key, column, convert in TASK_FIELD_PLAN:
+        plan.append((key, index if column else None, convert))
+        index += 1 if column else 0
+    return plan
+
+
+_ROW_PLAN = _compile_row_plan()
+
+
+def serialize_task_rows(rows):
+    """task_rows() 결과 → TaskSerializer(many=True).data와 같은 dict 리스트 (쿼리 1번 추가)"""
+    rows = list(rows)
+    people = defaultdict(list)
+    through = Task.assignees.through.objects.filter(task_id__in=[row.id for row in rows])
+    for task_id, user_id, first_name, username in through.order_by('task_id', 'user_id').values_list(
+        'task_id', 'user_id', 'user__first_name', 'user__username'
+    ):
+        people[task_id].append((user_id, first_name or username))
+
+    data = []
+    for row in rows:
+        assignees = people.get(row.id, ())
+        values = {}
+        for key, index, convert in _ROW_PLAN:
+            if index is None:
+                # 담당자 목록 (assignees / assignees_names)
+                position = 0 if key == 'assignees' else 1
+                values[key] = [person[position] for person in assignees]
+                continue
+            value = row[index]
+            if key == 'assignee_name' and row.assignee_id is None:
+                # TaskSerializer는 담당자가 없으면 assignee_name 키 자체를 생략함
+                continue
+            if value is not None and convert is not None:
+                value = convert(value)
+            values[key] = value
+        data.append(values)
+    return data
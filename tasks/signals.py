@@ -0,0 +1,51 @@
+# tasks/signals.py
+
+# ========================================
+# 담당자 통합 테이블(TaskAssignment) 동기화
+# Task 저장 / assignees 변경 시 TaskAssignment를 갱신
+# assignees 변경은 Task.save를 거치지 않으므로 updated_at을 직접 갱신 (delta 동기화 대상에 포함)
+# Task 삭제 시 delta 동기화용 삭제 기록(TaskTombstone) 저장
+# ========================================
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from .models import Task, TaskAssignment
+from .sync import record_task_deletion, touch_tasks
+
+
+@receiver(post_save, sender=Task)
+def sync_assignments_on_task_save(sender, instance, created, **kwargs):
+    if created:
+        # 새 작업은 아직 assignees가 없으므로 단일 담당자만 추가 (assignees는 m2m_changed에서 처리)
+        if instance.assignee_id:
+            TaskAssignment.objects.create(
+                task=instance, user_id=instance.assignee_id, team_id=instance.team_id,
+                status=instance.status, due_date=instance.due_date,
+            )
+        return
+    TaskAssignment.sync_for_task(instance)
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def sync_assignments_on_assignees_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        TaskAssignment.sync_for_task(instance)
+        touch_tasks([instance.pk])
+        return
+    # user.task_assignees 쪽에서 변경한 경우
+    if pk_set is None:
+        tasks = Task.objects.filter(assignments__user=instance)
+    else:
+        tasks = Task.objects.filter(pk__in=pk_set)
+    tasks = list(tasks)
+    for task in tasks:
+        TaskAssignment.sync_for_task(task)
+    touch_tasks([task.pk for task in tasks])
+
+
+@receiver(post_delete, sender=Task)
+def record_tombstone_on_task_delete(sender, instance, **kwargs):
+    # TaskDeleteView뿐 아니라 팀 삭제 등으로 함께 지워지는 경우도 기록
+    record_task_deletion(instance)
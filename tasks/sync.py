@@ -0,0 +1,78 @@
+# tasks/sync.py
+
+# ========================================
+# 작업 목록 delta 동기화
+# - 작업 목록 응답에 sync_token(응답 생성 시각 - SYNC_OVERLAP)을 같이 내려줌
+#   updated_at은 저장 시각이라 커밋이 늦은 트랜잭션의 변경은 토큰보다 이전 시각으로 보일 수 있음
+#   → 겹치는 구간만큼 앞당겨 다시 보내고, 클라이언트는 id 기준으로 덮어써서 중복 제거
+# - 클라이언트가 ?since=<sync_token>으로 요청하면 그 이후 생성/수정된 작업과 삭제된 작업 ID만 반환
+# - 삭제 기록(TaskTombstone)은 TOMBSTONE_RETENTION 동안만 보관 → 더 오래된 토큰은 전체 다시 불러오기(reset)
+#   오래된 기록 정리는 prune_task_tombstones 명령으로 주기적으로 실행 (삭제할 때마다 하지 않음)
+# ========================================
+import base64
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+
+from .models import Task, TaskTombstone
+
+TOMBSTONE_RETENTION = timedelta(days=7)
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class InvalidSyncToken(ValueError):
+    pass
+
+
+def encode_sync_token(moment):
+    return base64.urlsafe_b64encode(moment.isoformat().encode()).decode().rstrip('=')
+
+
+def new_sync_token():
+    """지금 발급할 토큰 (아직 커밋 중인 변경을 놓치지 않도록 SYNC_OVERLAP만큼 앞당김)"""
+    return encode_sync_token(timezone.now() - SYNC_OVERLAP)
+
+
+def decode_sync_token(token):
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        moment = datetime.fromisoformat(base64.urlsafe_b64decode(padded).decode())
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidSyncToken('잘못된 동기화 토큰입니다.')
+    if timezone.is_naive(moment):
+        raise InvalidSyncToken('잘못된 동기화 토큰입니다.')
+    return moment
+
+
+def is_expired(since):
+    """삭제 기록 보관 기간보다 오래된 토큰인지 (삭제 누락 가능 → 전체 다시 불러오기)"""
+    return since < timezone.now() - TOMBSTONE_RETENTION
+
+
+def get_changed_tasks(queryset, since):
+    """since 이후 생성/수정된 작업 (같은 시각 변경을 놓치지 않도록 >= 사용, 클라이언트는 id 기준으로 덮어씀)"""
+    return queryset.filter(updated_at__gte=since)
+
+
+def get_deleted_task_ids(team_id, since):
+    """since 이후 삭제된 작업 ID"""
+    return list(
+        TaskTombstone.objects.filter(team_id=team_id, deleted_at__gte=since)
+        .values_list('task_id', flat=True)
+    )
+
+
+def record_task_deletion(task):
+    """작업 삭제 기록 남기기"""
+    TaskTombstone.objects.create(task_id=task.id, team_id=task.team_id)
+
+
+def prune_tombstones():
+    """보관 기간이 지난 삭제 기록 정리 → 지운 개수"""
+    deleted, _ = TaskTombstone.objects.filter(deleted_at__lt=timezone.now() - TOMBSTONE_RETENTION).delete()
+    return deleted
+
+
+def touch_tasks(task_ids):
+    """save()를 거치지 않는 변경(assignees 등) 후 updated_at 갱신"""
+    Task.objects.filter(pk__in=task_ids).update(updated_at=timezone.now())
@@ -1,3 +1,374 @@
+import json
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from teams.models import Team, TeamMember
+from teams.versioning import get_team_version
+from .models import (
+    DEADLINE_IMMINENT_DAYS, URGENCY_IMMINENT, URGENCY_NEEDS_ATTENTION, URGENCY_ORDER,
+    Task, TaskAssignment, TaskTombstone,
+)
+from .pagination import TASK_ORDERING
+from .serializers import TASK_FIELD_PLAN, TaskSerializer, serialize_task_rows, task_rows
+from .sync import SYNC_OVERLAP, TOMBSTONE_RETENTION, encode_sync_token
+
+
+class TaskAssignmentSyncTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pw')
+        self.member = User.objects.create_user(username='member', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.owner, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.owner)
+        TeamMember.objects.create(team=self.team, user=self.member)
+
+    def assignment_users(self, task):
+        return set(TaskAssignment.objects.filter(task=task).values_list('user__username', flat=True))
+
+    def test_assignee_and_assignees_are_merged(self):
+        task = Task.objects.create(name='작업', team=self.team, assignee=self.owner)
+        self.assertEqual(self.assignment_users(task), {'owner'})
+
+        task.assignees.set([self.owner, self.member])
+        self.assertEqual(self.assignment_users(task), {'owner', 'member'})
+
+        task.assignees.remove(self.owner)
+        self.assertEqual(self.assignment_users(task), {'owner', 'member'})
+
+        task.assignee = None
+        task.save()
+        self.assertEqual(self.assignment_users(task), {'member'})
+
+        self.member.task_assignees.clear()
+        self.assertEqual(self.assignment_users(task), set())
+
+    def test_status_and_due_date_are_copied(self):
+        task = Task.objects.create(name='작업', team=self.team, assignee=self.owner)
+        task.assignees.add(self.member)
+        task.status = 'completed'
+        task.due_date = date(2025, 1, 1)
+        task.save()
+
+        self.assertEqual(
+            set(TaskAssignment.objects.filter(task=task).values_list('status', 'due_date')),
+            {('completed', date(2025, 1, 1))},
+        )
+
+    def test_my_tasks_lookup_has_no_duplicates(self):
+        task = Task.objects.create(name='작업', team=self.team, assignee=self.owner)
+        task.assignees.set([self.owner])
+        tasks = Task.objects.filter(assignments__user=self.owner, assignments__team=self.team)
+        self.assertEqual(list(tasks), [task])
+
+
+class TaskListPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='owner', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.user, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.user)
+        self.client.force_login(self.user)
+        self.url = f'/api/dashboard/{self.team.id}/tasks/list/'
+
+    def test_pages_follow_task_ordering(self):
+        # 마감일 없음 / 같은 마감일 여러 개 섞어서 생성
+        for i in range(7):
+            Task.objects.create(name=f'팀 {i}', team=self.team, type='team',
+                                due_date=None if i % 3 == 0 else date(2025, 1, 1 + i % 2))
+        Task.objects.create(name='개인', team=self.team, type='personal', assignee=self.user)
+        expected = list(Task.objects.filter(team=self.team, type='team').order_by('due_date', 'created_at', 'id')
+                        .values_list('id', flat=True))
+
+        data = self.client.get(self.url, {'limit': 3}).json()
+        self.assertEqual([t['name'] for t in data['personal_tasks']], ['개인'])
+        self.assertIsNone(data['personal_tasks_next'])
+
+        ids = [t['id'] for t in data['team_tasks']]
+        cursor = data['team_tasks_next']
+        while cursor:
+            data = self.client.get(self.url, {'limit': 3, 'team_tasks_cursor': cursor}).json()
+            self.assertNotIn('personal_tasks', data)
+            ids += [t['id'] for t in data['team_tasks']]
+            cursor = data['team_tasks_next']
+        self.assertEqual(ids, expected)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'team_tasks_cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+
+class TaskDeltaSyncTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pw')
+        self.member = User.objects.create_user(username='member', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.owner, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.owner)
+        self.client.force_login(self.owner)
+        self.url = f'/api/dashboard/{self.team.id}/tasks/list/'
+
+    def test_since_returns_only_changes(self):
+        unchanged = Task.objects.create(name='그대로', team=self.team, type='team')
+        edited = Task.objects.create(name='수정 전', team=self.team, type='team')
+        deleted = Task.objects.create(name='삭제', team=self.team, type='team')
+        moved = Task.objects.create(name='이동', team=self.team, type='team')
+        # 토큰의 겹침 구간(SYNC_OVERLAP)보다 앞선 작업으로 만듦
+        Task.objects.update(updated_at=timezone.now() - SYNC_OVERLAP * 2)
+        token = self.client.get(self.url).json()['sync_token']
+
+        edited.name = '수정 후'
+        edited.save()
+        deleted_id = deleted.id
+        deleted.delete()
+        moved.type = 'personal'
+        moved.assignee = self.member
+        moved.save()
+        created = Task.objects.create(name='새 작업', team=self.team, type='personal', assignee=self.owner)
+
+        data = self.client.get(self.url, {'since': token}).json()
+        self.assertFalse(data['reset'])
+        self.assertEqual([t['id'] for t in data['team_tasks']], [edited.id])
+        self.assertEqual([t['id'] for t in data['personal_tasks']], [created.id])
+        # 다른 사람의 개인 작업으로 바뀐 작업은 목록에서 빠진 것으로 전달
+        self.assertEqual(data['deleted_ids'], sorted([deleted_id, moved.id]))
+        self.assertNotIn(unchanged.id, [t['id'] for t in data['team_tasks']])
+
+        # 새 토큰도 겹침 구간만큼 앞당겨져 있으므로 방금 변경분을 다시 보냄 (클라이언트는 id 기준으로 덮어씀)
+        data = self.client.get(self.url, {'since': data['sync_token']}).json()
+        self.assertEqual([t['id'] for t in data['team_tasks']], [edited.id])
+        self.assertEqual(data['deleted_ids'], sorted([deleted_id, moved.id]))
+
+        # 겹침 구간이 지나면 변경 없음
+        TaskTombstone.objects.update(deleted_at=timezone.now() - SYNC_OVERLAP * 2)
+        Task.objects.update(updated_at=timezone.now() - SYNC_OVERLAP * 2)
+        data = self.client.get(self.url, {'since': data['sync_token']}).json()
+        self.assertEqual((data['team_tasks'], data['personal_tasks'], data['deleted_ids']), ([], [], []))
+
+    def test_late_commit_is_not_missed(self):
+        task = Task.objects.create(name='작업', team=self.team, type='team')
+        Task.objects.update(updated_at=timezone.now() - SYNC_OVERLAP * 2)
+        before = timezone.now()
+        token = self.client.get(self.url).json()['sync_token']
+
+        # 토큰 발급 전에 저장됐지만 그 뒤에 커밋된 변경 (updated_at이 발급 시각보다 이전)
+        Task.objects.filter(pk=task.pk).update(name='늦은 커밋', updated_at=before - timedelta(seconds=1))
+        data = self.client.get(self.url, {'since': token}).json()
+        self.assertEqual([t['id'] for t in data['team_tasks']], [task.id])
+
+    def test_assignees_change_is_synced(self):
+        task = Task.objects.create(name='작업', team=self.team, type='team')
+        token = self.client.get(self.url).json()['sync_token']
+
+        task.assignees.add(self.member)
+        data = self.client.get(self.url, {'since': token}).json()
+        self.assertEqual([t['id'] for t in data['team_tasks']], [task.id])
+
+    def test_expired_and_invalid_tokens(self):
+        old_token = encode_sync_token(timezone.now() - TOMBSTONE_RETENTION - timedelta(minutes=1))
+        data = self.client.get(self.url, {'since': old_token}).json()
+        self.assertTrue(data['reset'])
+
+        response = self.client.get(self.url, {'since': 'not-a-token'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_old_tombstones_are_pruned(self):
+        old = Task.objects.create(name='오래된 삭제', team=self.team)
+        old.delete()
+        TaskTombstone.objects.update(deleted_at=timezone.now() - TOMBSTONE_RETENTION - timedelta(days=1))
+
+        recent = Task.objects.create(name='새 삭제', team=self.team)
+        recent_id = recent.id
+        recent.delete()
+        # 삭제할 때마다 정리하지 않음 → 명령 실행 시 보관 기간이 지난 기록만 정리
+        self.assertEqual(TaskTombstone.objects.count(), 2)
+        call_command('prune_task_tombstones', stdout=StringIO())
+        self.assertEqual(list(TaskTombstone.objects.values_list('task_id', flat=True)), [recent_id])
+
+
+class TaskListQueryCountTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pw', first_name='팀장')
+        self.members = [User.objects.create_user(username=f'member{i}', password='pw') for i in range(3)]
+        self.team = Team.objects.create(name='팀', owner=self.owner, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.owner)
+        self.client.force_login(self.owner)
+        session = self.client.session
+        session['current_team_id'] = self.team.id
+        session.save()
+
+    def add_tasks(self, count):
+        for i in range(count):
+            task = Task.objects.create(
+                name=f'작업 {i}', team=self.team, type='team' if i % 2 else 'personal',
+                assignee=self.owner, due_date=date(2030, 1, 1),
+            )
+            task.assignees.set(self.members)
+
+    def count_queries(self, url):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx)
+
+    def assert_constant_queries(self, url):
+        self.add_tasks(2)
+        few = self.count_queries(url)
+        self.add_tasks(20)
+        self.assertEqual(self.count_queries(url), few)
+
+    def test_serializer_uses_loaded_people(self):
+        self.add_tasks(10)
+        # 작업 1번 + assignees prefetch 1번
+        with self.assertNumQueries(2):
+            data = TaskSerializer(Task.objects.filter(team=self.team).with_people(), many=True).data
+        self.assertEqual(data[0]['assignee_name'], '팀장')
+        self.assertEqual(len(data[0]['assignees_names']), 3)
+
+    def test_task_list_api(self):
+        self.assert_constant_queries(f'/api/dashboard/{self.team.id}/tasks/list/')
+
+    def test_tasks_page(self):
+        self.assert_constant_queries(f'/api/dashboard/{self.team.id}/tasks/')
+
+    def test_dashboard_page(self):
+        self.assert_constant_queries('/dashboard/')
+
+    def test_calendar_feed(self):
+        self.assert_constant_queries(f'/api/teams/{self.team.id}/schedule/detail?start=2029-12-01&end=2030-01-31')
+
+
+class FastTaskSerializationTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pw', first_name='팀장')
+        self.member = User.objects.create_user(username='member', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.owner, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.owner)
+
+        Task.objects.create(name='담당자 없음', team=self.team)
+        Task.objects.create(
+            name='개인', team=self.team, type='personal', assignee=self.owner,
+            status='completed', due_date=date(2030, 1, 1), description='설명 "따옴표"\n줄바꿈',
+        )
+        shared = Task.objects.create(name='공동', team=self.team, assignee=self.member, status='in_progress')
+        shared.assignees.set([self.member, self.owner])
+
+    def test_plan_matches_task_serializer_fields(self):
+        self.assertEqual([key for key, _, _ in TASK_FIELD_PLAN], TaskSerializer.Meta.fields)
+
+    def test_json_is_byte_identical(self):
+        tasks = Task.objects.filter(team=self.team).order_by(*TASK_ORDERING)
+        expected = JSONRenderer().render(TaskSerializer(tasks.with_people(), many=True).data)
+        actual = JSONRenderer().render(serialize_task_rows(task_rows(tasks)))
+        self.assertEqual(actual, expected)
+
+    def test_task_list_api_matches_task_serializer(self):
+        self.client.force_login(self.owner)
+        data = self.client.get(f'/api/dashboard/{self.team.id}/tasks/list/').json()
+        tasks = Task.objects.filter(team=self.team, type='team').order_by(*TASK_ORDERING).with_people()
+        self.assertEqual(data['team_tasks'], json.loads(JSONRenderer().render(TaskSerializer(tasks, many=True).data)))
+
+
+class TaskBatchTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pw')
+        self.member = User.objects.create_user(username='member', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.owner, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.owner)
+        TeamMember.objects.create(team=self.team, user=self.member)
+        self.client.force_login(self.owner)
+        self.url = f'/api/dashboard/{self.team.id}/tasks/batch/'
+        cache.clear()
+
+    def post(self, operations):
+        return self.client.post(self.url, {'operations': operations}, content_type='application/json')
+
+    def test_mixed_operations(self):
+        edited = Task.objects.create(name='수정 전', team=self.team, assignee=self.owner)
+        done = Task.objects.create(name='완료 처리', team=self.team)
+        deleted = Task.objects.create(name='삭제', team=self.team)
+        version = get_team_version(self.team.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post([
+                {'op': 'create', 'data': {'name': '새 작업', 'type': 'team', 'assignees': [self.owner.id, self.member.id]}},
+                {'op': 'create', 'data': {'name': '개인', 'type': 'personal'}},
+                {'op': 'update', 'id': edited.id, 'data': {'name': '수정 후', 'assignees': [self.member.id]}},
+                {'op': 'status', 'id': done.id, 'status': 'completed'},
+                {'op': 'delete', 'id': deleted.id},
+            ])
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual([r['op'] for r in results], ['create', 'create', 'update', 'status', 'delete'])
+
+        created = Task.objects.get(id=results[0]['id'])
+        self.assertEqual(results[0]['task']['assignees'], [self.owner.id, self.member.id])
+        self.assertEqual(set(created.assignments.values_list('user_id', flat=True)), {self.owner.id, self.member.id})
+        self.assertEqual(Task.objects.get(id=results[1]['id']).assignee, self.owner)
+
+        edited.refresh_from_db()
+        self.assertEqual(edited.name, '수정 후')
+        self.assertEqual(set(edited.assignments.values_list('user_id', flat=True)), {self.owner.id, self.member.id})
+        self.assertGreater(edited.updated_at, edited.created_at)
+        self.assertEqual(Task.objects.get(id=done.id).status, 'completed')
+        self.assertFalse(Task.objects.filter(id=deleted.id).exists())
+        self.assertTrue(TaskTombstone.objects.filter(task_id=deleted.id).exists())
+        self.assertGreater(get_team_version(self.team.id), version)
+
+    def test_invalid_item_rolls_back_everything(self):
+        task = Task.objects.create(name='작업', team=self.team)
+        response = self.post([
+            {'op': 'status', 'id': task.id, 'status': 'completed'},
+            {'op': 'status', 'id': task.id, 'status': 'unknown'},
+            {'op': 'update', 'id': 999999, 'data': {'name': 'x'}},
+            {'op': 'create', 'data': {'type': 'team'}},
+        ])
+        self.assertEqual(response.status_code, 400)
+        results = response.json()['results']
+        self.assertEqual([r['ok'] for r in results], [True, False, False, False])
+        self.assertIn('name', results[3]['errors'])
+        task.refresh_from_db()
+        self.assertEqual(task.status, 'pending')
+
+    def test_status_changes_use_constant_queries(self):
+        def mark_done(count):
+            tasks = [Task.objects.create(name=f'작업 {i}', team=self.team, assignee=self.owner) for i in range(count)]
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.post([{'op': 'status', 'id': t.id, 'status': 'completed'} for t in tasks])
+            self.assertEqual(response.status_code, 200)
+            return len(ctx)
+
+        self.assertEqual(mark_done(2), mark_done(30))
+        self.assertFalse(TaskAssignment.objects.exclude(status='completed').exists())
+
+
+class TaskUrgencyTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pw')
+        self.team = Team.objects.create(name='팀', owner=self.owner, invite_code='ABC123')
+        today = date.today()
+        self.expected = {
+            'overdue': Task.objects.create(name='overdue', team=self.team, due_date=today - timedelta(days=1)),
+            'imminent': Task.objects.create(name='imminent', team=self.team, due_date=today + timedelta(days=DEADLINE_IMMINENT_DAYS)),
+            'normal': Task.objects.create(name='normal', team=self.team, due_date=today + timedelta(days=DEADLINE_IMMINENT_DAYS + 1)),
+            'no_due': Task.objects.create(name='no_due', team=self.team),
+            'completed': Task.objects.create(name='completed', team=self.team, status='completed', due_date=today),
+        }
+
+    def test_classification_matches_property(self):
+        for task in Task.objects.filter(team=self.team).with_urgency():
+            self.assertEqual(task.urgency, task.name)
+            self.assertEqual(task.is_deadline_imminent, task.urgency == URGENCY_IMMINENT)
 
-# Create your tests here.
+    def test_order_and_count_by_urgency(self):
+        names = Task.objects.filter(team=self.team).with_urgency().order_by('urgency_rank').values_list('name', flat=True)
+        self.assertEqual(list(names), list(URGENCY_ORDER))
+        self.assertEqual(
+            Task.objects.filter(team=self.team).with_urgency().filter(urgency__in=URGENCY_NEEDS_ATTENTION).count(), 2
+        )
@@ -18,9 +18,9 @@ def tasks_page(request, team_id):
     team = get_object_or_404(Team, id=team_id)
     request.session['current_team_id'] = team.id  # 현재 팀 ID를 세션에 저장
     
-    # 팀 작업과 개인 작업 분리
-    team_tasks = Task.objects.filter(team=team, type='team')
-    personal_tasks = Task.objects.filter(team=team, type='personal', assignee=request.user)
+    # 팀 작업과 개인 작업 분리 (첫 페이지만 렌더링, 이후는 tasks.js에서 커서로 불러옴)
+    team_tasks, _ = paginate_tasks(Task.objects.filter(team=team, type='team').with_people().with_urgency())
+    personal_tasks, _ = paginate_tasks(Task.objects.filter(team=team, type='personal', assignee=request.user).with_people().with_urgency())
     
     # 팀 멤버 정보
     team_members = team.teammember_set.select_related('user')
@@ -47,21 +47,82 @@ from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from .models import Task
 from teams.models import Team
-from .serializers import TaskSerializer
+from .serializers import TaskSerializer, serialize_task_rows, task_rows
+from .batch import BatchError, apply_batch
+from .pagination import TASK_ORDERING, InvalidCursor, paginate_tasks, parse_page_size
+from .sync import (
+    InvalidSyncToken, decode_sync_token, is_expired, new_sync_token,
+    get_changed_tasks, get_deleted_task_ids,
+)
+from teams.versioning import team_etag
 
 #팀별 작업 리스트 반환하는 API 추가
+# ========================================
+# 커서 페이지네이션
+# - 기본: 팀 작업 / 개인 작업 첫 페이지 + 다음 페이지 커서(team_tasks_next, personal_tasks_next)
+# - ?team_tasks_cursor=... / ?personal_tasks_cursor=... : 해당 목록의 다음 페이지만 반환
+# - ?limit=N : 페이지 크기 (최대 MAX_PAGE_SIZE)
+# 읽기 전용 목록이므로 TaskSerializer 대신 values_list 기반 빠른 직렬화(serialize_task_rows) 사용
+# delta 동기화
+# - 모든 응답에 sync_token 포함
+# - ?since=<sync_token> : 그 이후 변경된 작업(team_tasks, personal_tasks)과
+#   삭제되었거나 목록에서 빠진 작업 ID(deleted_ids)만 반환
+# - 토큰이 삭제 기록 보관 기간보다 오래되면 reset: true (클라이언트가 전체 다시 불러오기)
+# ========================================
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@team_etag
 def TaskListAPIView(request, team_id):
     team = get_object_or_404(Team, id=team_id)
-
-    team_tasks = Task.objects.filter(team=team, type='team')
-    personal_tasks = Task.objects.filter(team=team, type='personal', assignee=request.user)
-
-    return Response({
-        "team_tasks": TaskSerializer(team_tasks, many=True).data,
-        "personal_tasks": TaskSerializer(personal_tasks, many=True).data
-    })
+    page_size = parse_page_size(request.query_params.get('limit'))
+    # 조회 전에 시각을 잡아야 조회 중에 바뀐 작업도 다음 동기화에 포함됨 (커밋이 늦은 변경은 SYNC_OVERLAP으로)
+    sync_token = new_sync_token()
+
+    task_lists = {
+        'team_tasks': Task.objects.filter(team=team, type='team'),
+        'personal_tasks': Task.objects.filter(team=team, type='personal', assignee=request.user),
+    }
+
+    since = request.query_params.get('since')
+    if since:
+        try:
+            since = decode_sync_token(since)
+        except InvalidSyncToken as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if is_expired(since):
+            return Response({'reset': True, 'sync_token': sync_token})
+        return Response(_task_changes(team, task_lists, since, sync_token))
+    cursors = {name: request.query_params.get(f'{name}_cursor') for name in task_lists}
+    # 커서가 하나라도 오면 "더 보기" 요청 → 커서가 온 목록만 반환
+    if any(cursors.values()):
+        task_lists = {name: tasks for name, tasks in task_lists.items() if cursors[name]}
+
+    data = {}
+    for name, tasks in task_lists.items():
+        try:
+            page, next_cursor = paginate_tasks(task_rows(tasks), cursors[name], page_size)
+        except InvalidCursor as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        data[name] = serialize_task_rows(page)
+        data[f'{name}_next'] = next_cursor
+
+    data['sync_token'] = sync_token
+    return Response(data)
+
+
+def _task_changes(team, task_lists, since, sync_token):
+    """since 이후 변경분 (유형/담당자가 바뀌어 목록에서 빠진 작업도 deleted_ids에 포함)"""
+    data = {'reset': False, 'sync_token': sync_token}
+    listed_ids = set()
+    for name, tasks in task_lists.items():
+        changed = list(task_rows(get_changed_tasks(tasks, since)).order_by(*TASK_ORDERING))
+        listed_ids.update(row.id for row in changed)
+        data[name] = serialize_task_rows(changed)
+
+    changed_ids = get_changed_tasks(Task.objects.filter(team=team), since).order_by().values_list('id', flat=True)
+    removed_ids = set(changed_ids) - listed_ids
+    data['deleted_ids'] = sorted(removed_ids.union(get_deleted_task_ids(team.id, since)))
+    return data
 
 # 작업 생성
 class TaskCreateView(generics.CreateAPIView):
@@ -143,4 +204,20 @@ class TaskUpdateView(generics.UpdateAPIView):
                 task.assignees.set(assignees)
             return Response(TaskSerializer(task).data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+# 작업 일괄 처리 (생성/수정/상태 변경/삭제를 트랜잭션 하나로, tasks/batch.py)
+class TaskBatchView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, team_id):
+        team = get_object_or_404(Team, id=team_id)
+        operations = request.data.get('operations') if hasattr(request.data, 'get') else None
+        try:
+            ok, results = apply_batch(team, request.user, operations)
+        except BatchError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if not ok:
+            return Response({'error': '처리할 수 없는 항목이 있습니다.', 'results': results},
+                            status=status.HTTP_400_BAD_REQUEST)
+        return Response({'results': results})
 # ========================================
@@ -10,5 +10,11 @@ class TeamLog(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 팀 로그 최신순
+            models.Index(fields=['team', 'created_at'], name='teamlog_team_created_idx'),
+        ]
+
     def __str__(self):
         return self.title
\ No newline at end of file
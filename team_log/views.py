@@ -9,6 +9,7 @@ from django.contrib.auth.decorators import login_required
 from django.db.models import Count, Q  # [추가] 진행률 계산을 위한 Q import (최근활동 제거)
 from django.shortcuts import get_object_or_404
 from django.http import HttpResponseForbidden
+from teams.versioning import team_etag
 from .models import TeamLog
 
 
@@ -76,6 +77,7 @@ def all_team_logs_api(request):
 
 #로그인 필수 + 접근권한 체크(해당 팀에 속해있지 않으면 403)
 @login_required
+@team_etag
 def team_log_list_api(request, team_id):
     team = get_object_or_404(Team, id=team_id)
 
@@ -12,6 +12,7 @@ from channels.auth import AuthMiddlewareStack
 import django  # === MGP ===
 django.setup()  # === MGP ===
 import roles.routing  # === MGP ===
+import schedule.routing
 
 # === MGP: get_asgi_application 분리하여 재사용 ===
 django_asgi_app = get_asgi_application()
@@ -22,6 +23,7 @@ application = ProtocolTypeRouter({
     "websocket": AuthMiddlewareStack(
         URLRouter(
             roles.routing.websocket_urlpatterns
+            + schedule.routing.websocket_urlpatterns
         )
     ),
 })
\ No newline at end of file
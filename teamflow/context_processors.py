@@ -1,93 +1,95 @@
 """
 글로벌 컨텍스트 프로세서
 모든 템플릿에서 공통으로 사용되는 컨텍스트 변수들을 제공합니다.
+
+- 각 값은 SimpleLazyObject로 감싸서 템플릿이 실제로 읽을 때만 계산합니다.
+- 계산된 헤더 정보(전공, 팀, 역할, 마감 임박 수)는 (사용자, 팀) 단위로 캐시하고,
+  Task/Team/Profile 변경 시 teams/signals.py에서 버전이 올라가 무효화됩니다.
 """
 
-from datetime import date, timedelta
+from django.utils.functional import SimpleLazyObject, cached_property
+
+from dashboard.utils import get_task_stats
 from teams.models import Team
-from tasks.models import Task
+from teams.versioning import get_versioned, set_versioned
 from users.models import Profile
 
 
+class HeaderContext:
+    """요청 하나에 대한 헤더/사이드바 정보 (값마다 필요할 때 계산 후 캐시에 추가)"""
+
+    def __init__(self, request):
+        self.request = request
+        self.user = request.user
+
+    @cached_property
+    def team(self):
+        # 현재 팀 정보 (세션에서 가져오기)
+        current_team_id = self.request.session.get('current_team_id')
+        if current_team_id:
+            team = self._cached('team', team_id=current_team_id,
+                                compute=lambda: Team.objects.filter(id=current_team_id).first())
+            if team:
+                return team
+
+        # 첫 번째 팀을 기본으로 설정 (세션에 팀이 없는 경우)
+        team = Team.objects.filter(members=self.user).first()
+        if team:
+            self.request.session['current_team_id'] = team.id
+        return team
+
+    def get_specialization(self):
+        # 사용자 역할 정보 (전공/전문분야)
+        def compute():
+            profile = Profile.objects.filter(user=self.user).first()
+            return (profile.specialization if profile else None) or "미정"
+        return self._cached('user_specialization', compute=compute)
+
+    def get_team_role(self):
+        # 팀 내 역할 계산 (팀장/팀원)
+        if not self.team:
+            return "미정"
+        return "팀장" if self.team.owner_id == self.user.id else "팀원"
+
+    def get_deadline_imminent_count(self):
+        # 마감 임박 작업 계산 (대시보드와 같은 기준)
+        if not self.team:
+            return 0
+        return self._cached('deadline_imminent_count', team_id=self.team.id,
+                            compute=lambda: get_task_stats(self.team, self.user)['deadline_imminent'])
+
+    def _cached(self, name, compute, team_id=None):
+        """
+        (사용자, 팀) 단위 캐시 묶음에서 값을 꺼내고, 없으면 계산해서 묶음에 추가
+        team_id가 없으면 팀과 무관한 사용자 값 묶음 사용
+        """
+        key = f'context:user:{self.user.id}:team:{team_id}'
+        values, versions = get_versioned(key, team_id=team_id, user_id=self.user.id)
+        values = values or {}
+        if name not in values:
+            values[name] = compute()
+            set_versioned(key, values, versions)
+        return values[name]
+
+
 def global_context(request):
     """
     모든 템플릿에서 사용할 수 있는 글로벌 컨텍스트 변수들을 제공합니다.
     """
     context = {}
-    
+
     if request.user.is_authenticated:
+        header = HeaderContext(request)
+
         # 현재 사용자 정보
         context['current_user'] = request.user
-        
+
         # 사용자 실제 이름 (first_name 우선, 없으면 username)
-        user_display_name = request.user.first_name or request.user.username
-        context['user_display_name'] = user_display_name
-        
-        # 사용자 역할 정보 (전공/전문분야)
-        try:
-            profile = Profile.objects.get(user=request.user)
-            context['user_specialization'] = profile.specialization or "미정"
-        except Profile.DoesNotExist:
-            context['user_specialization'] = "미정"
-        
-        # 현재 팀 정보 (세션에서 가져오기)
-        current_team_id = request.session.get('current_team_id')
-        current_team = None
-        
-        if current_team_id:
-            try:
-                current_team = Team.objects.get(id=current_team_id)
-                context['team'] = current_team
-            except Team.DoesNotExist:
-                pass
-        
-        # 첫 번째 팀을 기본으로 설정 (세션에 팀이 없는 경우)
-        if not current_team:
-            user_teams = Team.objects.filter(members=request.user)
-            if user_teams.exists():
-                current_team = user_teams.first()
-                context['team'] = current_team
-                request.session['current_team_id'] = current_team.id
-        
-        # 팀 내 역할 계산 (팀장/팀원)
-        if current_team:
-            if current_team.owner == request.user:
-                context['team_role'] = "팀장"
-            else:
-                context['team_role'] = "팀원"
-        else:
-            context['team_role'] = "미정"
-        
-        # 마감 임박 작업 계산
-        deadline_imminent_count = 0
-        if current_team:
-            # 오늘로부터 3일 이내의 마감 작업들
-            deadline_threshold = date.today() + timedelta(days=1)
-            from django.db.models import Q
-            my_tasks = Task.objects.filter(
-                (Q(assignee=request.user) | Q(assignees=request.user))
-            ).distinct().order_by('-created_at')
-            # 팀 작업 중 마감 임박
-            team_tasks = my_tasks.filter(
-                team=current_team,
-                type='team',
-                due_date__isnull=False,
-                due_date__lte=deadline_threshold,
-                status__in=['pending', 'in_progress']
-            )
-            
-            # 개인 작업 중 마감 임박
-            personal_tasks = Task.objects.filter(
-                team=current_team,
-                type='personal',
-                assignee=request.user,
-                due_date__isnull=False,
-                due_date__lte=deadline_threshold,
-                status__in=['pending', 'in_progress']
-            )
-            
-            deadline_imminent_count = team_tasks.count() + personal_tasks.count()
-        
-        context['deadline_imminent_count'] = deadline_imminent_count
-    
-    return context
\ No newline at end of file
+        context['user_display_name'] = request.user.first_name or request.user.username
+
+        context['user_specialization'] = SimpleLazyObject(header.get_specialization)
+        context['team'] = SimpleLazyObject(lambda: header.team)
+        context['team_role'] = SimpleLazyObject(header.get_team_role)
+        context['deadline_imminent_count'] = SimpleLazyObject(header.get_deadline_imminent_count)
+
+    return context
@@ -168,6 +168,12 @@ DATABASES = {
     }
 }
 
+# 캐시 (대시보드 스냅샷 등)
+# 여러 프로세스로 운영할 때는 .env에 CACHE_URL=redis://127.0.0.1:6379/1 처럼 공유 캐시를 지정
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://teamflow'),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -387,6 +393,29 @@ NCP_APIGW_API_KEY = env('NCP_APIGW_API_KEY')
 NCP_ACCESS_KEY = env('NCP_ACCESS_KEY')
 NCP_SECRET_KEY = env('NCP_SECRET_KEY')
 
+# ========================================
+# 파일 다운로드 전송 방식 (files/downloads.py)
+# - 비워 두면 Django가 직접 스트리밍
+# - 'x-accel-redirect': 권한 확인 후 nginx가 MEDIA_ROOT를 직접 전송
+#     location /protected-media/ { internal; alias <MEDIA_ROOT>/; }
+# - 'x-sendfile': Apache mod_xsendfile / lighttpd
+# ========================================
+FILES_DOWNLOAD_OFFLOAD = env('FILES_DOWNLOAD_OFFLOAD', default=None)
+FILES_ACCEL_REDIRECT_PREFIX = '/protected-media/'
+
+# 팀 전체 파일 ZIP 캐시 위치 (저장소 기준 경로, files/archives.py)
+# MEDIA_ROOT 아래에 두어야 위 X-Accel-Redirect / X-Sendfile 전송도 그대로 사용 가능
+FILES_ARCHIVE_DIR = 'team_archives'
+# 새 ZIP으로 바뀐 이전 ZIP을 남겨 두는 시간 (그 사이 시작된 다운로드가 끝날 수 있도록)
+FILES_ARCHIVE_KEEP_MINUTES = 60
+
+# 청크(이어 올리기) 업로드 (files/uploads.py)
+# 임시 파일은 저장소 기준 FILES_UPLOAD_TEMP_DIR에 만들어 완료 시 rename으로 옮김
+FILES_UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+FILES_UPLOAD_MAX_SIZE = env.int('FILES_UPLOAD_MAX_SIZE', default=2 * 1024 * 1024 * 1024)
+FILES_UPLOAD_TEMP_DIR = 'upload_parts'
+FILES_UPLOAD_EXPIRE_HOURS = 24
+
 # ========================================
 # AI 웹소켓
 # 2. ASGI 애플리케이션 설정
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TeamsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'teams'
+
+    def ready(self):
+        # 팀 / 사용자 버전 갱신 signals 등록
+        import teams.signals
@@ -0,0 +1,98 @@
+# teams/signals.py
+
+# ========================================
+# 팀 / 사용자 버전 갱신
+# 팀 소유 모델이 저장·삭제되면 팀 버전을 올려 ETag와 대시보드 스냅샷 캐시를 무효화
+# (실제 증가는 저장한 트랜잭션이 커밋된 뒤 - teams/versioning.py)
+# ========================================
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from files.models import File
+from roles.models import AISubmission, MemberRoleAssignment, Role
+from schedule.models import Meeting, MeetingException, SchedulePoll, Vote
+from tasks.models import Task
+from team_log.models import TeamLog
+from users.models import Profile
+from .models import Team, TeamMember
+from .versioning import bump_team_version, bump_user_version
+
+
+# team FK를 직접 가진 모델들
+TEAM_OWNED_MODELS = [Task, Meeting, SchedulePoll, Role, AISubmission, File, TeamLog]
+
+
+def _bump_on_team_owned_change(sender, instance, **kwargs):
+    bump_team_version(instance.team_id)
+
+
+for model in TEAM_OWNED_MODELS:
+    post_save.connect(_bump_on_team_owned_change, sender=model, dispatch_uid=f'team_version_{model.__name__}_save')
+    post_delete.connect(_bump_on_team_owned_change, sender=model, dispatch_uid=f'team_version_{model.__name__}_delete')
+
+
+@receiver([post_save, post_delete], sender=Vote)
+def bump_on_vote_change(sender, instance, **kwargs):
+    try:
+        bump_team_version(instance.poll.team_id)
+    except SchedulePoll.DoesNotExist:
+        # 투표 조율 삭제로 함께 지워지는 경우 (조율 삭제 시 팀 버전이 올라감)
+        pass
+
+
+@receiver([post_save, post_delete], sender=MeetingException)
+def bump_on_meeting_exception_change(sender, instance, **kwargs):
+    team_id = Meeting.objects.filter(pk=instance.meeting_id).values_list('team_id', flat=True).first()
+    if team_id is not None:
+        bump_team_version(team_id)
+
+
+@receiver([post_save, post_delete], sender=MemberRoleAssignment)
+def bump_on_role_assignment_change(sender, instance, **kwargs):
+    team_id = instance.team_id
+    if team_id is None:
+        team_id = Role.objects.filter(pk=instance.role_id).values_list('team_id', flat=True).first()
+    if team_id is not None:
+        bump_team_version(team_id)
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def bump_on_task_assignees_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        bump_team_version(instance.team_id)
+        return
+    # user.task_assignees 쪽에서 변경한 경우: 관련 작업들의 팀 버전을 올림
+    # (clear는 pk_set이 없으므로 사용자가 속한 모든 팀)
+    if pk_set is None:
+        team_ids = TeamMember.objects.filter(user=instance).values_list('team_id', flat=True)
+    else:
+        team_ids = Task.objects.filter(pk__in=pk_set).values_list('team_id', flat=True)
+    for team_id in set(team_ids):
+        bump_team_version(team_id)
+
+
+@receiver([post_save, post_delete], sender=TeamMember)
+def bump_on_member_change(sender, instance, **kwargs):
+    bump_team_version(instance.team_id)
+    bump_user_version(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=Team)
+def bump_on_team_change(sender, instance, **kwargs):
+    bump_team_version(instance.id)
+    # 팀 이름/설명 등은 팀원들의 팀 목록에도 표시됨
+    for user_id in TeamMember.objects.filter(team_id=instance.id).values_list('user_id', flat=True):
+        bump_user_version(user_id)
+
+
+@receiver([post_save, post_delete], sender=Profile)
+def bump_on_profile_change(sender, instance, **kwargs):
+    # 이름/전공은 사용자가 속한 모든 팀의 팀원 목록에 표시됨
+    # (User 저장 시 users.models의 signal이 Profile도 저장하므로 이름 변경도 여기서 처리됨)
+    team_ids = TeamMember.objects.filter(user_id=instance.user_id).values_list('team_id', flat=True)
+    for team_id in team_ids:
+        bump_team_version(team_id)
+    # 사이드바의 전공/전문분야 (teamflow.context_processors)
+    bump_user_version(instance.user_id)
@@ -1,3 +1,121 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.http import Http404
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from roles.models import Role
+from tasks.models import Task
+from .models import Team, TeamMember
+from .versioning import bump_team_version, get_team_version
+
+
+class TeamETagTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='owner', password='pw', first_name='팀장')
+        self.team = Team.objects.create(name='팀', owner=self.user, invite_code='ABC123')
+        TeamMember.objects.create(team=self.team, user=self.user, role='팀장')
+        self.client.force_login(self.user)
+
+    def test_unchanged_team_returns_304_without_touching_team_tables(self):
+        url = f'/api/dashboard/{self.team.id}/tasks/list/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(any('tasks_task' in q['sql'] for q in queries.captured_queries))
+
+    def test_team_write_changes_etag(self):
+        url = f'/api/dashboard/{self.team.id}/roles/list/'
+        etag = self.client.get(url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Role.objects.create(name='백엔드', team=self.team)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual([r['name'] for r in response.json()['roles']], ['백엔드'])
+
+    def test_etag_is_per_user(self):
+        other = User.objects.create_user(username='member', password='pw')
+        TeamMember.objects.create(team=self.team, user=other, role='팀원')
+        url = f'/api/dashboard/{self.team.id}/tasks/list/'
+        etag = self.client.get(url)['ETag']
+
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_user_teams_etag_changes_on_membership(self):
+        url = '/api/teams/list/'
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            new_team = Team.objects.create(name='새 팀', owner=self.user, invite_code='XYZ789')
+            TeamMember.objects.create(team=new_team, user=self.user, role='팀장')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['teams']), 2)
+
+    def test_non_members_get_no_etag(self):
+        outsider = User.objects.create_user(username='outsider', password='pw')
+        url = f'/api/dashboard/{self.team.id}/tasks/list/'
+        etag = self.client.get(url)['ETag']
+
+        self.client.force_login(outsider)
+        for response in (self.client.get(url), self.client.get(url, HTTP_IF_NONE_MATCH=etag),
+                         self.client.get('/api/dashboard/99999/tasks/list/')):
+            self.assertNotEqual(response.status_code, 304)
+            self.assertNotIn('ETag', response)
+            self.assertNotIn('Last-Modified', response)
+
+        # 가입하면 ETag 사용 (멤버십 캐시는 사용자 버전으로 무효화)
+        with self.captureOnCommitCallbacks(execute=True):
+            TeamMember.objects.create(team=self.team, user=outsider, role='팀원')
+        self.assertIn('ETag', self.client.get(url))
+
+    def test_error_responses_have_no_validators(self):
+        with mock.patch('tasks.views.paginate_tasks', side_effect=Http404):
+            response = self.client.get(f'/api/dashboard/{self.team.id}/tasks/list/')
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response)
+        self.assertNotIn('Last-Modified', response)
+
+    def test_task_assignee_change_changes_etag(self):
+        task = Task.objects.create(name='작업', team=self.team, type='team')
+        url = f'/api/teams/{self.team.id}/schedule/detail'
+        etag = self.client.get(url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task.assignees.add(self.user)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_version_changes_only_after_commit(self):
+        before = get_team_version(self.team.id)
+        with self.captureOnCommitCallbacks() as callbacks:
+            Role.objects.create(name='백엔드', team=self.team)
+            # 커밋 전에는 다른 요청이 보는 버전이 그대로 (아직 보이지 않는 데이터를 새 버전으로 캐시하지 않도록)
+            self.assertEqual(get_team_version(self.team.id), before)
+        for callback in callbacks:
+            callback()
+        self.assertGreater(get_team_version(self.team.id), before)
+
+    def test_bumps_are_not_lost(self):
+        before = get_team_version(self.team.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(3):
+                bump_team_version(self.team.id)
+        self.assertEqual(get_team_version(self.team.id), before + 3)
 
-# Create your tests here.
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_team_version(self.team.id)
+        self.assertGreater(get_team_version(self.team.id), before + 3)
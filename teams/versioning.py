@@ -0,0 +1,204 @@
+# teams/versioning.py
+
+# ========================================
+# 팀 / 사용자 단위 변경 버전
+# - 팀 소유 모델(Task, Meeting, Role, File 등)이 저장·삭제되면 signals.py에서 버전을 올림
+# - 버전 값은 처음 만든 시각(ns)에서 변경마다 cache.incr로 1씩 증가 (읽고 다시 쓰지 않으므로 동시 변경도 모두 반영)
+#   캐시에서 사라지면 현재 시각으로 다시 시작 → 이전 값보다 큼
+# - 버전은 쓰는 쪽 트랜잭션이 커밋된 뒤에 올림 (transaction.on_commit)
+#   커밋 전에 올리면 다른 요청이 아직 커밋 전 데이터를 읽어 새 버전으로 캐시할 수 있음
+# - team_etag / user_etag 데코레이터: 버전으로 ETag / Last-Modified를 만들고
+#   If-None-Match가 같으면 ORM 조회 전에 304 반환
+#   팀 ETag는 그 팀의 팀원에게만 (팀원이 아니거나 없는 팀이면 ETag 없이 뷰가 403/404 처리)
+#   → 팀 존재 여부/변경 빈도가 ETag로 드러나지 않음, 검증값은 2xx 응답에만 붙임
+# ========================================
+import time
+from datetime import date, datetime, timezone as dt_timezone
+from functools import wraps
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from .models import TeamMember
+
+
+def _version_key(scope, obj_id):
+    return f'teams:version:{scope}:{obj_id}'
+
+
+def _get_version(scope, obj_id):
+    key = _version_key(scope, obj_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _bump_version(scope, obj_id):
+    key = _version_key(scope, obj_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # 캐시에 없음 → 현재 시각으로 시작 (다른 요청이 먼저 만들었으면 그 값을 올림)
+        if not cache.add(key, time.time_ns(), timeout=None):
+            cache.incr(key)
+
+
+def get_team_version(team_id):
+    """팀 버전 조회"""
+    return _get_version('team', team_id)
+
+
+def bump_team_version(team_id):
+    """팀 데이터 변경 시 버전 올림 (트랜잭션 안이면 커밋 후, 밖이면 바로)"""
+    transaction.on_commit(lambda: _bump_version('team', team_id))
+
+
+def get_user_version(user_id):
+    """사용자 버전 조회 (사용자가 속한 팀 목록 등)"""
+    return _get_version('user', user_id)
+
+
+def bump_user_version(user_id):
+    """사용자의 팀 목록/역할 변경 시 버전 올림 (트랜잭션 안이면 커밋 후, 밖이면 바로)"""
+    transaction.on_commit(lambda: _bump_version('user', user_id))
+
+
+def get_versioned(key, team_id=None, user_id=None):
+    """
+    팀/사용자 버전에 묶인 캐시 값 조회
+    버전 키와 값을 get_many로 한 번에 가져와서 (값, 현재 버전) 반환
+    - 값이 없거나 저장 당시 버전/날짜가 다르면 값은 None
+    - 현재 버전은 새 값을 계산한 뒤 set_versioned에 그대로 넘김
+      (계산 도중 변경이 생기면 버전이 달라져 다음 조회에서 버려짐)
+    """
+    scopes = [(scope, obj_id) for scope, obj_id in (('team', team_id), ('user', user_id)) if obj_id is not None]
+    version_keys = [_version_key(scope, obj_id) for scope, obj_id in scopes]
+    cached = cache.get_many(version_keys + [key])
+
+    versions = tuple(
+        cached.get(version_key) or _get_version(scope, obj_id)
+        for version_key, (scope, obj_id) in zip(version_keys, scopes)
+    )
+    entry = cached.get(key)
+    if entry is None or entry['versions'] != versions or entry['date'] != date.today().isoformat():
+        return None, versions
+    return entry['value'], versions
+
+
+def set_versioned(key, value, versions, timeout=60 * 60):
+    """get_versioned에서 받은 버전과 함께 캐시 값 저장"""
+    cache.set(key, {
+        'versions': versions,
+        'date': date.today().isoformat(),
+        'value': value,
+    }, timeout=timeout)
+
+
+def version_to_datetime(version):
+    """버전(ns 시각)을 datetime으로 변환"""
+    return datetime.fromtimestamp(version / 1e9, tz=dt_timezone.utc)
+
+
+# ========================================
+# ETag / 304 데코레이터
+# ========================================
+def _team_id_from_kwargs(request, *args, **kwargs):
+    return kwargs.get('team_id')
+
+
+def _user_id(request):
+    user = getattr(request, 'user', None)
+    if user is None or not user.is_authenticated:
+        return None
+    return user.id
+
+
+def _conditional(get_scope):
+    """
+    get_scope(request, *args, **kwargs) -> (scope, obj_id) 또는 None
+    응답이 사용자/날짜(마감 임박 등)에 따라 달라지므로 ETag에 사용자 ID와 오늘 날짜를 포함
+    """
+    def _version_info(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return None
+        if not hasattr(request, '_teams_version_info'):
+            info = None
+            user_id = _user_id(request)
+            target = get_scope(request, *args, **kwargs) if user_id else None
+            if target is not None:
+                scope, obj_id = target
+                info = (scope, obj_id, _get_version(scope, obj_id), user_id)
+            request._teams_version_info = info
+        return request._teams_version_info
+
+    def etag_func(request, *args, **kwargs):
+        info = _version_info(request, *args, **kwargs)
+        if info is None:
+            return None
+        scope, obj_id, version, user_id = info
+        return f'W/"{scope}{obj_id}.{version}.u{user_id}.{date.today():%Y%m%d}"'
+
+    def last_modified_func(request, *args, **kwargs):
+        info = _version_info(request, *args, **kwargs)
+        if info is None:
+            return None
+        # 날짜가 바뀌면 내용도 바뀔 수 있으므로 오늘 0시보다 이르지 않게 함
+        start_of_today = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        return max(version_to_datetime(info[2]), start_of_today)
+
+    def decorator(view_func):
+        conditional_view = condition(etag_func=etag_func, last_modified_func=last_modified_func)(view_func)
+
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if 200 <= response.status_code < 300:
+                # 브라우저가 매번 If-None-Match로 재검증하도록 설정
+                patch_cache_control(response, private=True, no_cache=True)
+            elif response.status_code != 304:
+                # 오류 응답(403/404 등)에는 버전이 담긴 검증값을 남기지 않음
+                response.headers.pop('ETag', None)
+                response.headers.pop('Last-Modified', None)
+            return response
+        return _wrapped_view
+    return decorator
+
+
+def _member_team_ids(user_id):
+    """사용자가 속한 팀 ID 목록 (사용자 버전에 묶어 캐시 → 팀 가입/탈퇴 시 다시 조회)"""
+    key = f'teams:member_team_ids:{user_id}'
+    team_ids, versions = get_versioned(key, user_id=user_id)
+    if team_ids is None:
+        team_ids = list(TeamMember.objects.filter(user_id=user_id).values_list('team_id', flat=True))
+        set_versioned(key, team_ids, versions)
+    return team_ids
+
+
+def team_etag(view_func=None, get_team_id=_team_id_from_kwargs):
+    """
+    팀 버전 기반 ETag 데코레이터
+    - 기본: URL 인자 team_id 사용
+    - get_team_id(request, *args, **kwargs)로 팀 ID를 구하는 방법을 바꿀 수 있음
+    - 요청한 사용자가 그 팀의 팀원일 때만 ETag 사용 (아니면 뷰의 권한/404 처리를 그대로 거침)
+    """
+    def get_scope(request, *args, **kwargs):
+        try:
+            team_id = int(get_team_id(request, *args, **kwargs))
+        except (TypeError, ValueError):
+            return None
+        if team_id not in _member_team_ids(request.user.id):
+            return None
+        return ('team', team_id)
+
+    decorator = _conditional(get_scope)
+    return decorator(view_func) if view_func else decorator
+
+
+def user_etag(view_func):
+    """사용자 버전 기반 ETag 데코레이터 (사용자의 팀 목록 등)"""
+    return _conditional(lambda request, *args, **kwargs: ('user', _user_id(request)))(view_func)
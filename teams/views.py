@@ -4,7 +4,9 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from django.utils.decorators import method_decorator
 from .models import Team, TeamMember # ⬅️ TeamMember도 import 해야 합니다.
+from .versioning import user_etag
 
 # ========================================
 # MGP: REST API 엔드포인트 추가
@@ -100,6 +102,7 @@ class UserTeamsAPIView(APIView):
     """사용자가 참여한 팀 목록 반환"""
     permission_classes = [IsAuthenticated]
     
+    @method_decorator(user_etag)
     def get(self, request):
         try:
             # 사용자가 참여한 팀 목록 가져오기
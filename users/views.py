@@ -7,8 +7,7 @@ from rest_framework.response import Response
 from users.utils import needs_profile_setup, is_existing_user, get_user_profile_status
 from teams.models import TeamMember
 from allauth.socialaccount.models import SocialAccount
-from tasks.models import Task
-from django.db.models import Q
+from tasks.models import TaskAssignment
 
 
 # ========================================
@@ -159,9 +158,7 @@ class UserMeUpdateView(APIView):
         user = request.user
         # 통계 계산
         teams_count = TeamMember.objects.filter(user=user).count()
-        tasks_count = Task.objects.filter(status='completed').filter(
-            Q(assignee=user) | Q(assignees=user)
-        ).distinct().count()
+        tasks_count = TaskAssignment.objects.filter(user=user, status='completed').count()
         join_date = user.date_joined
 
         return Response({
@@ -204,9 +201,7 @@ class UserMeUpdateView(APIView):
         
         # 최신 통계 포함하여 반환
         teams_count = TeamMember.objects.filter(user=user).count()
-        tasks_count = Task.objects.filter(status='completed').filter(
-            Q(assignee=user) | Q(assignees=user)
-        ).distinct().count()
+        tasks_count = TaskAssignment.objects.filter(user=user, status='completed').count()
         response_data = {
             "success": True,
             "id": user.id,